@@ -0,0 +1,89 @@
+"""AssetManager start-up, one asset at a time on the main thread versus decoding on a thread pool.
+
+Every asset is decoded eagerly for the comparison; the lazy_assets row shows start-up when only
+the pinned sprite sheets are decoded.
+
+Run from the repository root with ``python -m benchmarks.asset_loading``.
+"""
+import json
+import os
+import tempfile
+import time
+
+from benchmarks.common import ASSET_GUIDE, init_display, report
+
+import pygame
+
+from src.asset_manager import AssetManager
+from src.config import Config
+
+REPEATS: int = 10
+THREADS: int = 4
+
+class LegacyAssetManager(AssetManager):
+    def __init__(self, asset_guide: str):
+        with open(asset_guide, "r") as file:
+            obj = json.load(file)
+
+        for audio in obj.get("audio", []):
+            self.add_audio(audio.get("name"), audio.get("path"), audio.get("volume"))
+        for font in obj.get("fonts", []):
+            for size in font.get("sizes", []):
+                self.add_font(font.get("name"), font.get("path"), size)
+        for image in obj.get("images", []):
+            self.add_image(image.get("name"), image.get("path"))
+        for sprite in obj.get("sprites", []):
+            self.add_sprite(
+                name=sprite.get("name"),
+                sprite_sheet=sprite.get("sprite_sheet"),
+                dimensions=pygame.Vector2(sprite.get("width"), sprite.get("height")),
+                animations=sprite.get("animations"),
+                animation_layout=sprite.get("animation_layout"),
+                num_frames=sprite.get("num_frames")
+            )
+
+def available_guide(directory: str) -> str:
+    with open(ASSET_GUIDE, "r") as file:
+        obj = json.load(file)
+    for kind in ("audio", "fonts", "images"):
+        obj[kind] = [entry for entry in obj.get(kind, []) if os.path.exists(entry.get("path"))]
+
+    path: str = os.path.join(directory, "asset_guide.json")
+    with open(path, "w") as file:
+        json.dump(obj, file)
+    return path
+
+def run(manager_type: type, guide: str) -> float:
+    best: float = float("inf")
+    for _ in range(REPEATS):
+        start: float = time.perf_counter()
+        manager_type(guide)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def main() -> None:
+    init_display()
+
+    with tempfile.TemporaryDirectory() as directory:
+        guide: str = available_guide(directory)
+        # lazy_assets would leave the pool only the pinned sprite sheets to decode
+        Config.LAZY_ASSETS = True
+        lazy_ms: float = run(AssetManager, guide)
+        Config.LAZY_ASSETS = False
+        legacy_ms: float = run(LegacyAssetManager, guide)
+        Config.ASSET_LOADER_THREADS = 1
+        single_ms: float = run(AssetManager, guide)
+        Config.ASSET_LOADER_THREADS = THREADS
+        pooled_ms: float = run(AssetManager, guide)
+
+    report("AssetManager start-up", [
+        ("main thread only", legacy_ms),
+        ("1 loader thread", single_ms),
+        (f"{THREADS} loader threads", pooled_ms),
+        (f"{THREADS} loader threads, lazy_assets", lazy_ms)
+    ], "ms")
+    report(f"time spent in each loading phase, {min(THREADS, os.cpu_count() or 1)} workers",
+           [(kind, seconds * 1000) for kind, seconds in AssetManager.LOAD_TIMES.items()], "ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Peak resident memory over a full playthrough, every asset resident versus lazy handles with eviction.
+
+Run from the repository root with ``python -m benchmarks.asset_residency``. Each mode runs in a fresh
+interpreter so the peaks do not mix.
+"""
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.common import ASSET_GUIDE, init_display, report
+
+import pygame
+
+from src.asset_manager import AssetManager
+from src.camera import Camera
+from src.config import Config
+from src.npc import NPC
+from src.scene_manager import SceneManager
+from src.text_engine import TextEngine
+from src.ui_manager import UIManager
+
+SCENE_GUIDE: str = "scenes/scene_guide.json"
+FRAMES_PER_SCENE: int = 60
+
+def available_guide(directory: str) -> str:
+    with open(ASSET_GUIDE, "r") as file:
+        obj = json.load(file)
+    for kind in ("audio", "fonts", "images"):
+        obj[kind] = [entry for entry in obj.get(kind, []) if os.path.exists(entry.get("path"))]
+
+    path: str = os.path.join(directory, "asset_guide.json")
+    with open(path, "w") as file:
+        json.dump(obj, file)
+    return path
+
+def play_through(lazy: bool, guide: str) -> None:
+    window: pygame.Surface = init_display()
+    Config.LAZY_ASSETS = lazy
+    Config.SCENE_PREFETCH = False
+    AssetManager(guide)
+    AssetManager.NULL_IMAGE = AssetManager.get_image("null")
+    TextEngine.init(AssetManager.FONT_ASSETS)
+
+    ui_manager: UIManager = UIManager(window)
+    manager: SceneManager = SceneManager(SCENE_GUIDE, None)
+    scene_name: str = manager.start_scene
+    while scene_name != "":
+        manager.load_scene(scene_name, "main", pygame.Vector2(0, 1))
+        scene = manager.scenes[scene_name]
+        for entity in scene.entities_dict.values():
+            if isinstance(entity, NPC):
+                for dialogue in entity.dialogues.values():
+                    if scene.dialogue is None and not dialogue.start(scene, manager):
+                        scene.dialogue = dialogue
+
+        for _ in range(FRAMES_PER_SCENE):
+            manager.update(ui_manager, 1 / 60)
+            manager.render(window, ui_manager)
+
+        next_scenes: list[str] = scene.next_scenes
+        scene_name = next_scenes[0] if next_scenes else ""
+        Camera.TRACK = None
+
+    peak_kib: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"peak_kib": peak_kib, "assets_kib": AssetManager.resident_bytes() / 1024}))
+
+def measure(lazy: bool, guide: str) -> dict:
+    output: str = subprocess.run(
+        [sys.executable, "-m", "benchmarks.asset_residency", "--child", "lazy" if lazy else "eager", guide],
+        capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main() -> None:
+    if len(sys.argv) == 4 and sys.argv[1] == "--child":
+        play_through(sys.argv[2] == "lazy", sys.argv[3])
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        guide: str = available_guide(directory)
+        eager: dict = measure(False, guide)
+        lazy: dict = measure(True, guide)
+
+    report("peak RSS over a playthrough", [("all resident", eager["peak_kib"] / 1024),
+                                           ("lazy + eviction", lazy["peak_kib"] / 1024)], "MiB")
+    report("AssetManager resident at the end", [("all resident", eager["assets_kib"]),
+                                                ("lazy + eviction", lazy["assets_kib"])], "KiB")
+
+if __name__ == "__main__":
+    main()
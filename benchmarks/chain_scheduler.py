@@ -0,0 +1,71 @@
+"""Per-frame cost of active dispatch chains, counting every chain down in Scene.update versus the ChainScheduler that
+lets waiting chains sleep until their deadline. Chains either wait on a long delay or keep a camera move running. The
+chain update step of the scene is timed on its own, so no empty-scene baseline is subtracted. The story scenes have at
+most four chains active at once.
+
+Run from the repository root with ``python -m benchmarks.chain_scheduler``.
+"""
+import time
+
+from benchmarks.common import init_display, load_assets, report
+
+import pygame
+
+from src.asset_manager import AssetManager
+from src.camera import Camera
+from src.config import Config
+from src.event import DispatchChain, MoveCameraPosition, PlayAudio
+from src.player import Player
+from src.scene import Scene
+from src.sprite import copy_sprite
+
+FRAMES: int = 300
+REPEATS: int = 5
+CHAINS: list[int] = [0, 1, 4, 10, 100, 1000]
+BOUNDS: tuple[int, int] = (50, 50)
+DT: float = 1 / 60
+
+def build_chain(kind: str) -> DispatchChain:
+    match kind:
+        case "waiting":
+            event: PlayAudio = PlayAudio("", 0)
+            event.org_wait = event.wait = FRAMES * REPEATS * DT * 10
+            return DispatchChain([event])
+        case _:
+            return DispatchChain([MoveCameraPosition(pygame.Vector2(BOUNDS) / 2, FRAMES * REPEATS * DT * 10)])
+
+def build_scene(scheduled: bool, kind: str, chains: int) -> Scene:
+    Config.CHAIN_SCHEDULER = scheduled
+    player: Player = Player(pygame.Vector2(0, 0), copy_sprite(AssetManager.get_sprite("esi")), 0.2)
+    scene: Scene = Scene((0, 0, 0, 0), pygame.Vector2(BOUNDS), None, [], player, {}, {}, {}, [])
+    scene.load("", pygame.Vector2(0, 1), False, False)
+    for _ in range(chains):
+        scene.add_dispatch_chain(None, build_chain(kind))
+    scene.update_dispatch_chains(None, DT)
+    return scene
+
+def run(kind: str, chains: int) -> tuple[float, float]:
+    scenes: list[tuple[bool, Scene]] = [(scheduled, build_scene(scheduled, kind, chains)) for scheduled in (False, True)]
+    best: dict[bool, float] = {False: float("inf"), True: float("inf")}
+    for _ in range(REPEATS):
+        for scheduled, scene in scenes:
+            Config.CHAIN_SCHEDULER = scheduled
+            start: float = time.perf_counter()
+            for _ in range(FRAMES):
+                scene.update_dispatch_chains(None, DT)
+            best[scheduled] = min(best[scheduled], time.perf_counter() - start)
+    Camera.TRACK = None
+    return best[False] / FRAMES * 1e9, best[True] / FRAMES * 1e9
+
+def main() -> None:
+    init_display()
+    load_assets()
+
+    for kind in ["waiting", "camera move"]:
+        for chains in CHAINS:
+            countdown_ns, scheduled_ns = run(kind, chains)
+            report(f"{chains} {kind} chains, chain update per frame",
+                   [("countdown in Scene.update", countdown_ns), ("chain scheduler", scheduled_ns)], "ns")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Scene updates per second with linear collision loops versus the occupancy-grid collision index.
+
+Run from the repository root with ``python -m benchmarks.collision``.
+"""
+import random
+
+from benchmarks.common import init_display, load_assets, measure_fps, report
+
+import pygame
+
+from src.asset_manager import AssetManager
+from src.camera import Camera
+from src.collision_index import Blocked
+from src.entity_route import EntityRoute, Waypoint
+from src.map_element import MapElement
+from src.npc import NPC
+from src.player import Player
+from src.route_tracker import Conditions
+from src.scene import Scene
+from src.sprite import copy_sprite
+from src.ui_manager import UIManager
+
+FRAMES: int = 300
+BOUNDS: tuple[int, int] = (240, 240)
+MAP_ELEMENTS: int = 4000
+NPCS: int = 300
+WAYPOINTS: int = 24
+SEED: int = 7
+
+class LegacyCollisionIndex:
+    def __init__(self, map_elements: list[MapElement]):
+        self.map_elements: list[MapElement] = map_elements
+        self.entities: list = []
+
+    def is_blocked(self, rect: pygame.Rect) -> Blocked:
+        for entity in self.entities:
+            if entity.get_collision(rect):
+                return Blocked.ENTITY
+        for map_element in self.map_elements:
+            if map_element.get_collision(rect):
+                return Blocked.MAP
+        return Blocked.NONE
+
+    def move(self, entity) -> None:
+        pass
+
+    def sync(self, entities: list) -> None:
+        self.entities = entities
+
+def build_scene() -> Scene:
+    rng: random.Random = random.Random(SEED)
+    empty: Conditions = Conditions([], [], [])
+    sprite = AssetManager.get_sprite("esi")
+
+    def random_cell() -> pygame.Vector2:
+        return pygame.Vector2(rng.randrange(BOUNDS[0]), rng.randrange(BOUNDS[1]))
+
+    map_elements: list[MapElement] = [
+        MapElement(pygame.Rect(random_cell(), (rng.randint(1, 3), rng.randint(1, 3))), None, True)
+        for _ in range(MAP_ELEMENTS)
+    ]
+
+    entities: dict = {}
+    for i in range(NPCS):
+        waypoints: list[Waypoint] = [Waypoint(random_cell(), 0.2, pygame.Vector2(0, 1), 0) for _ in range(WAYPOINTS)]
+        entities[f"npc{i}"] = NPC(
+            sprite=copy_sprite(sprite), collision=True, spawn=random_cell(), conditions=empty,
+            routes={"wander": EntityRoute(waypoints, empty)}, dialogues={}
+        )
+
+    player: Player = Player(pygame.Vector2(BOUNDS[0] // 2, BOUNDS[1] // 2), copy_sprite(sprite), 0.2)
+    scene: Scene = Scene((0, 0, 0, 0), pygame.Vector2(BOUNDS), None, map_elements, player, entities, {}, {}, [])
+    scene.load("", pygame.Vector2(0, 1), False, False)
+    return scene
+
+def run(window: pygame.Surface, legacy: bool) -> tuple[float, list[tuple[float, float]]]:
+    ui_manager: UIManager = UIManager(window)
+    scene: Scene = build_scene()
+    if legacy:
+        scene.collision_index = LegacyCollisionIndex(scene.map_elements)
+
+    def frame() -> None:
+        scene.update(ui_manager, 1 / 60, None)
+
+    fps: float = measure_fps(frame, FRAMES)
+    Camera.TRACK = None
+    return fps, [(entity.grid_pos.x, entity.grid_pos.y) for entity in scene.entities]
+
+def main() -> None:
+    window: pygame.Surface = init_display()
+    load_assets()
+
+    before, legacy_positions = run(window, True)
+    after, indexed_positions = run(window, False)
+
+    report(f"scene update, {MAP_ELEMENTS} map elements, {NPCS} routed NPCs",
+           [("linear loops", before), ("collision index", after)], "updates/s")
+    print("same positions", legacy_positions == indexed_positions)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import hashlib
+import json
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+import pygame
+
+from src.asset_manager import AssetManager
+from src.config import Config
+from src.text_engine import TextEngine
+
+ASSET_GUIDE: str = "assets/asset_guide.json"
+CONFIG: str = "config.json"
+
+def init_display() -> pygame.Surface:
+    pygame.init()
+    Config.load(CONFIG)
+    surface: pygame.Surface = pygame.display.set_mode(Config.WINDOW_DIMS)
+    Config.set_window_dimensions(surface.get_size())
+    return surface
+
+def load_assets(audio: bool = False) -> None:
+    with open(ASSET_GUIDE, "rb") as file:
+        source: bytes = file.read()
+    AssetManager.GUIDE_DIGEST = hashlib.sha256(source).hexdigest()
+    obj = json.loads(source)
+
+    if audio:
+        for entry in obj.get("audio", []):
+            if os.path.exists(entry.get("path")):
+                AssetManager.add_audio(entry.get("name"), entry.get("path"), entry.get("volume"))
+
+    for font in obj.get("fonts", []):
+        for size in font.get("sizes", []):
+            AssetManager.add_font(font.get("name"), font.get("path"), size)
+
+    for image in obj.get("images", []):
+        AssetManager.add_image(image.get("name"), image.get("path"))
+
+    for sprite in obj.get("sprites", []):
+        AssetManager.add_sprite(
+            name=sprite.get("name"),
+            sprite_sheet=sprite.get("sprite_sheet"),
+            dimensions=pygame.Vector2(sprite.get("width"), sprite.get("height")),
+            animations=sprite.get("animations"),
+            animation_layout=sprite.get("animation_layout"),
+            num_frames=sprite.get("num_frames")
+        )
+    AssetManager.pack_sprites()
+
+    AssetManager.NULL_IMAGE = AssetManager.get_image("null")
+    TextEngine.init(AssetManager.FONT_ASSETS)
+
+def measure_fps(frame, frames: int) -> float:
+    frame()
+    start: float = time.perf_counter()
+    for _ in range(frames):
+        frame()
+    return frames / (time.perf_counter() - start)
+
+def report(title: str, rows: list[tuple[str, float]], unit: str) -> None:
+    print(title)
+    width: int = max(len(name) for name, _ in rows)
+    for name, value in rows:
+        print(f"  {name:<{width}}  {value:10.1f} {unit}")
@@ -0,0 +1,89 @@
+"""Condition evaluation throughput, flag lists checked against a str to bool dict, compiled bit masks checked against
+the Flags bitset, and bit masks memoized until one of their flags changes. Every condition is checked once per round,
+like a frame, and one flag changes every 60 rounds.
+
+Run from the repository root with ``python -m benchmarks.conditions``.
+"""
+import random
+import time
+
+from benchmarks.common import report
+
+from src.route_tracker import Conditions, Flags
+
+FLAGS: int = 200
+CONDITIONS: int = 2000
+ROUNDS: int = 600
+ROUNDS_PER_CHANGE: int = 60
+SEED: int = 23
+
+class LegacyConditions(Conditions):
+    DEFINED: dict[str, bool] = {}
+
+    def satisfied(self) -> bool:
+        for flag in self.all_flags:
+            if not LegacyConditions.DEFINED.get(flag, False):
+                return False
+
+        found: bool = len(self.any_flags) == 0
+        for flag in self.any_flags:
+            if LegacyConditions.DEFINED.get(flag, False):
+                found = True
+                break
+
+        if not found:
+            return False
+
+        for flag in self.not_flags:
+            if LegacyConditions.DEFINED.get(flag, False):
+                return False
+
+        return True
+
+class MaskConditions(Conditions):
+    def satisfied(self) -> bool:
+        bits: int = Flags.BITS
+        return bits & self.all_mask == self.all_mask and \
+            (self.any_mask == 0 or bits & self.any_mask != 0) and \
+            bits & self.not_mask == 0
+
+def build(condition_type: type, rng: random.Random) -> list[Conditions]:
+    def sample() -> list[str]:
+        return [f"flag{rng.randrange(FLAGS)}" for _ in range(rng.randint(0, 3))]
+    return [condition_type(sample(), sample(), sample()) for _ in range(CONDITIONS)]
+
+def toggle(flag: str) -> None:
+    Flags.toggle(flag)
+    LegacyConditions.DEFINED[flag] = Flags.is_set(flag)
+
+def run(conditions: list[Conditions]) -> tuple[float, list[bool]]:
+    results: list[bool] = [condition.satisfied() for condition in conditions]
+    start: float = time.perf_counter()
+    for i in range(ROUNDS):
+        if i % ROUNDS_PER_CHANGE == 0:
+            toggle(f"flag{i // ROUNDS_PER_CHANGE}")
+        for condition in conditions:
+            condition.satisfied()
+    elapsed: float = time.perf_counter() - start
+
+    for i in range(0, ROUNDS, ROUNDS_PER_CHANGE):
+        toggle(f"flag{i // ROUNDS_PER_CHANGE}")
+    return CONDITIONS * ROUNDS / elapsed / 1e6, results
+
+def main() -> None:
+    rng: random.Random = random.Random(SEED)
+    for i in range(FLAGS):
+        if rng.random() < 0.5:
+            Flags.set(f"flag{i}")
+            LegacyConditions.DEFINED[f"flag{i}"] = True
+
+    legacy_rate, legacy_results = run(build(LegacyConditions, random.Random(SEED)))
+    masked_rate, masked_results = run(build(MaskConditions, random.Random(SEED)))
+    memo_rate, memo_results = run(build(Conditions, random.Random(SEED)))
+
+    report(f"condition checks, {CONDITIONS} conditions over {FLAGS} flags",
+           [("flag lists", legacy_rate), ("bit masks", masked_rate), ("memoized masks", memo_rate)], "M checks/s")
+    print(f"  same results: {legacy_results == masked_results == memo_results}")
+
+if __name__ == "__main__":
+    main()
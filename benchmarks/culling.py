@@ -0,0 +1,87 @@
+"""Scene render cost with and without viewport culling, camera over a dense crowd versus an empty area.
+
+Run from the repository root with ``python -m benchmarks.culling``.
+"""
+import random
+
+from benchmarks.common import init_display, load_assets, measure_fps, report
+
+import pygame
+
+from src.asset_manager import AssetManager
+from src.camera import Camera
+from src.config import Config
+from src.entity import Entity
+from src.npc import NPC
+from src.player import Player
+from src.route_tracker import Conditions
+from src.scene import Scene
+from src.sprite import copy_sprite
+from src.ui_manager import UIManager
+
+FRAMES: int = 300
+BOUNDS: tuple[int, int] = (200, 200)
+CROWD: int = 600
+CROWD_AREA: int = 30
+SEED: int = 11
+
+class LegacyScene(Scene):
+    def render(self, window_surface: pygame.Surface, ui_manager: UIManager) -> None:
+        window_surface.fill((0, 0, 0))
+        self.map_layer.render(window_surface)
+        for entity in self.entities:
+            if isinstance(entity, Player):
+                continue
+            entity.render(window_surface)
+        self.player.render(window_surface)
+
+def build_scene(scene_type: type) -> Scene:
+    rng: random.Random = random.Random(SEED)
+    empty: Conditions = Conditions([], [], [])
+    sprite = AssetManager.get_sprite("esi")
+
+    entities: dict[str, Entity] = {
+        f"npc{i}": NPC(copy_sprite(sprite), True,
+                       pygame.Vector2(rng.randrange(CROWD_AREA), rng.randrange(CROWD_AREA)), empty, {}, {})
+        for i in range(CROWD)
+    }
+    player: Player = Player(pygame.Vector2(CROWD_AREA // 2, CROWD_AREA // 2), copy_sprite(sprite), 0.2)
+    scene: Scene = scene_type((0, 0, 0, 0), pygame.Vector2(BOUNDS), None, [], player, entities, {}, {}, [])
+    scene.load("", pygame.Vector2(0, 1), False, False)
+    Camera.TRACK = None
+    return scene
+
+def run(window: pygame.Surface, scene: Scene, camera: pygame.Vector2) -> float:
+    ui_manager: UIManager = UIManager(window)
+
+    def frame() -> None:
+        Camera.POS = camera.copy()
+        scene.render(window, ui_manager)
+
+    return measure_fps(frame, FRAMES)
+
+def main() -> None:
+    window: pygame.Surface = init_display()
+    load_assets()
+
+    crowd: pygame.Vector2 = pygame.Vector2(0, 0)
+    away: pygame.Vector2 = pygame.Vector2(BOUNDS) * Config.TILE_SIZE - Config.WINDOW_DIMS
+    legacy: Scene = build_scene(LegacyScene)
+    culled: Scene = build_scene(Scene)
+
+    rows: list[tuple[str, float]] = [
+        ("over crowd, draw all", run(window, legacy, crowd)),
+        ("over crowd, culled", run(window, culled, crowd))
+    ]
+    crowd_stats: dict[str, int] = dict(culled.render_stats)
+    rows += [
+        ("empty area, draw all", run(window, legacy, away)),
+        ("empty area, culled", run(window, culled, away))
+    ]
+
+    report(f"scene render, {CROWD} NPCs", rows, "fps")
+    print("over crowd", crowd_stats)
+    print("empty area", culled.render_stats)
+
+if __name__ == "__main__":
+    main()
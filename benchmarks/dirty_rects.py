@@ -0,0 +1,63 @@
+"""Presented screen area per frame, full flips versus dirty rectangles, over a real scene with a dialogue running.
+
+Run from the repository root with ``python -m benchmarks.dirty_rects``.
+"""
+from benchmarks.common import init_display, load_assets, measure_fps, report
+
+import pygame
+
+from src.camera import Camera
+from src.config import Config
+from src.damage_tracker import DamageTracker
+from src.npc import NPC
+from src.scene_manager import SceneManager
+from src.ui_manager import UIManager
+
+FRAMES: int = 600
+SCENE: str = "bucket"
+SCENE_GUIDE: str = "scenes/scene_guide.json"
+
+def run(window: pygame.Surface, dirty: bool) -> tuple[float, dict[str, float]]:
+    Config.DIRTY_RECT_RENDERING = dirty
+    ui_manager: UIManager = UIManager(window)
+    manager: SceneManager = SceneManager(SCENE_GUIDE, None)
+    manager.load_scene(SCENE, "main", pygame.Vector2(0, 1))
+    scene = manager.scenes[SCENE]
+    tracker: DamageTracker = DamageTracker(window.get_size())
+
+    for entity in scene.entities_dict.values():
+        if not isinstance(entity, NPC):
+            continue
+        for dialogue in entity.dialogues.values():
+            if scene.dialogue is None and not dialogue.start(scene, manager):
+                scene.dialogue = dialogue
+
+    def frame() -> None:
+        manager.update(ui_manager, 1 / 60)
+        manager.render(window, ui_manager)
+        if dirty:
+            manager.report_damage(tracker, ui_manager)
+            tracker.present()
+        else:
+            tracker.invalidate()
+            tracker.present()
+
+    fps: float = measure_fps(frame, FRAMES)
+    Camera.TRACK = None
+    return fps, tracker.stats()
+
+def main() -> None:
+    window: pygame.Surface = init_display()
+    load_assets()
+
+    flip_fps, flip_stats = run(window, False)
+    dirty_fps, dirty_stats = run(window, True)
+
+    report(f"{SCENE} scene with a dialogue typing", [("full flip", flip_fps), ("dirty rects", dirty_fps)], "fps")
+    report("average presented area", [
+        ("full flip", flip_stats["average_fraction"] * 100),
+        ("dirty rects", dirty_stats["average_fraction"] * 100)
+    ], "% of window")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Per-frame trigger and scene exit cost in a stress scene with thousands of flags, rescanning every trigger and exit
+against conditions memoized on a global flag version versus re-evaluating only the dependents of changed flags. Cost is
+measured at 0, 1, 10 and 100 flag changes per frame for two scene sizes.
+
+Run from the repository root with ``python -m benchmarks.flag_index``.
+"""
+import random
+import time
+
+from benchmarks.common import init_display, load_assets, report
+
+import pygame
+
+from src.asset_manager import AssetManager
+from src.camera import Camera
+from src.config import Config
+from src.event import OnPlayerEnter, PlayAudio
+from src.player import Player
+from src.route_tracker import Conditions, Flags
+from src.scene import Scene
+from src.scene_in_out import SceneExit, SceneTransition
+from src.sprite import copy_sprite
+from src.trigger import Trigger
+
+FLAGS: int = 5000
+SIZES: list[tuple[int, int]] = [(1000, 250), (4000, 1000)] # triggers, exits
+CHANGES: list[int] = [0, 1, 10, 100]
+FRAMES: int = 200
+BOUNDS: tuple[int, int] = (200, 200)
+SEED: int = 29
+
+class LegacyConditions(Conditions):
+    VERSION: int = 0
+
+    def satisfied(self) -> bool:
+        if self.version == LegacyConditions.VERSION:
+            return self.result
+
+        bits: int = Flags.BITS
+        self.result = bits & self.all_mask == self.all_mask and \
+            (self.any_mask == 0 or bits & self.any_mask != 0) and \
+            bits & self.not_mask == 0
+        self.version = LegacyConditions.VERSION
+        return self.result
+
+    def compile(self) -> None:
+        super().compile()
+        self.version: int = -1
+
+def build_scene(condition_type: type, triggers: int, exits: int) -> Scene:
+    rng: random.Random = random.Random(SEED)
+    sprite = AssetManager.get_sprite("esi")
+
+    def random_rect() -> pygame.Rect:
+        return pygame.Rect(rng.randrange(10, BOUNDS[0]), rng.randrange(10, BOUNDS[1]), rng.randint(1, 4),
+                           rng.randint(1, 4))
+
+    def random_conditions() -> Conditions:
+        return condition_type([f"flag{rng.randrange(FLAGS)}"], [f"flag{rng.randrange(FLAGS)}"],
+                              [f"flag{rng.randrange(FLAGS)}"])
+
+    scene_triggers: dict[str, Trigger] = {}
+    for i in range(triggers):
+        catch: OnPlayerEnter = OnPlayerEnter(random_rect())
+        catch.conditions = random_conditions()
+        scene_triggers[f"trigger{i}"] = Trigger(False, False, [catch], [PlayAudio("", 0)])
+    scene_exits: list[SceneExit] = [SceneExit(random_rect(), False, SceneTransition.TELEPORT, 0, "", "",
+                                              random_conditions()) for _ in range(exits)]
+
+    player: Player = Player(pygame.Vector2(0, 0), copy_sprite(sprite), 0.2)
+    scene: Scene = Scene((0, 0, 0, 0), pygame.Vector2(BOUNDS), None, [], player, {}, scene_triggers, {}, scene_exits)
+    scene.load("", pygame.Vector2(0, 1), False, False)
+    Camera.TRACK = None
+    return scene
+
+def run(indexed: bool, triggers: int, exits: int, changes: int) -> float:
+    scene: Scene = build_scene(Conditions if indexed else LegacyConditions, triggers, exits)
+    rng: random.Random = random.Random(SEED)
+
+    def frame() -> None:
+        for _ in range(changes):
+            Flags.toggle(f"flag{rng.randrange(FLAGS)}")
+            LegacyConditions.VERSION += 1
+
+        if indexed:
+            scene.trigger_scheduler.update(scene, None)
+            open_exits: list[SceneExit] = scene.available_exits()
+        else:
+            for trigger in scene.triggers.values():
+                if trigger.catch(scene):
+                    trigger.dispatch(None, scene)
+            open_exits = [scene_exit for scene_exit in scene.exits if scene_exit.available()]
+
+        for scene_exit in open_exits:
+            if scene_exit.entered(scene.player.grid_pos):
+                break
+
+    frame()
+    start: float = time.perf_counter()
+    for _ in range(FRAMES):
+        frame()
+    return (time.perf_counter() - start) / FRAMES * 1e6
+
+def main() -> None:
+    init_display()
+    load_assets()
+    Config.EVENT_TRIGGERS = True
+    rng: random.Random = random.Random(SEED)
+    for i in range(FLAGS):
+        if rng.random() < 0.5:
+            Flags.set(f"flag{i}")
+
+    for triggers, exits in SIZES:
+        for changes in CHANGES:
+            rescan_us: float = run(False, triggers, exits, changes)
+            indexed_us: float = run(True, triggers, exits, changes)
+            report(f"{triggers} triggers, {exits} exits, {changes} flag changes per frame",
+                   [("full rescan", rescan_us), ("flag index", indexed_us)], "us")
+
+if __name__ == "__main__":
+    main()
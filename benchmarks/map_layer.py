@@ -0,0 +1,61 @@
+"""Static map rendering per frame, one blit per map element versus baked chunks, across map sizes.
+
+Run from the repository root with ``python -m benchmarks.map_layer``.
+"""
+from benchmarks.common import init_display, load_assets, measure_fps, report
+
+import pygame
+
+from src.asset_manager import AssetManager
+from src.camera import Camera
+from src.config import Config
+from src.map_element import MapElement
+from src.map_layer import MapLayer
+
+FRAMES: int = 300
+MAP_SIZES: list[int] = [24, 48, 96]
+ELEMENT_SIZE: int = 2
+
+class LegacyMapLayer:
+    def __init__(self, map_elements: list[MapElement]):
+        self.map_elements: list[MapElement] = map_elements
+
+    def render(self, surface: pygame.Surface) -> None:
+        for map_element in self.map_elements:
+            map_element.render(surface)
+
+def build_map(size: int) -> list[MapElement]:
+    images: list[pygame.Surface] = [AssetManager.get_image("grass_tile"), AssetManager.get_image("dirt_tile")]
+    return [
+        MapElement(pygame.Rect(x, y, ELEMENT_SIZE, ELEMENT_SIZE), images[(x + y) // ELEMENT_SIZE % 2], False)
+        for x in range(0, size, ELEMENT_SIZE) for y in range(0, size, ELEMENT_SIZE)
+    ]
+
+def run(window: pygame.Surface, layer, size: int) -> float:
+    span: pygame.Vector2 = pygame.Vector2(size * Config.TILE_SIZE) - Config.WINDOW_DIMS
+    step: list[int] = [0]
+
+    def frame() -> None:
+        step[0] += 1
+        Camera.POS = pygame.Vector2(step[0] * 7 % max(int(span.x), 1), step[0] * 3 % max(int(span.y), 1))
+        window.fill((0, 0, 0))
+        layer.render(window)
+
+    return measure_fps(frame, FRAMES)
+
+def main() -> None:
+    window: pygame.Surface = init_display()
+    load_assets()
+
+    rows: list[tuple[str, float]] = []
+    for size in MAP_SIZES:
+        map_elements: list[MapElement] = build_map(size)
+        rows.append((f"{size}x{size} tiles, per element", run(window, LegacyMapLayer(map_elements), size)))
+        layer: MapLayer = MapLayer(map_elements)
+        layer.bake()
+        rows.append((f"{size}x{size} tiles, baked chunks", run(window, layer, size)))
+
+    report("static map layer", rows, "fps")
+
+if __name__ == "__main__":
+    main()
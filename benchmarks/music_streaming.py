@@ -0,0 +1,114 @@
+"""Peak resident memory with every scene parsed, background music decoded into a Sound copy per scene versus streamed
+from disk through pygame.mixer.music.
+
+The theme is not shipped with the repository, so a one minute stereo track is synthesised in its place. Run from the
+repository root with ``python -m benchmarks.music_streaming``. Each mode runs in a fresh interpreter so the peaks do
+not mix.
+"""
+import json
+import math
+import os
+import resource
+import struct
+import subprocess
+import sys
+import tempfile
+import wave
+
+from benchmarks.common import ASSET_GUIDE, init_display, report
+
+import pygame
+
+from src import scene_manager
+from src.asset_manager import AssetManager
+from src.config import Config
+from src.music_player import MusicTrack
+from src.scene_manager import SceneManager
+
+SCENE_GUIDE: str = "scenes/scene_guide.json"
+THEME: str = "esi_theme"
+TRACK_SECONDS: int = 60
+SAMPLE_RATE: int = 44100
+
+class LegacySceneMusic(pygame.mixer.Sound):
+    def same_track(self, other) -> bool:
+        return isinstance(other, pygame.mixer.Sound) and other.get_raw() == self.get_raw()
+
+def legacy_load_background_music(scene, identifier: str, volume: float) -> None:
+    if AssetManager.get_audio(identifier) is None:
+        return
+    background_music: LegacySceneMusic = LegacySceneMusic(AssetManager.get_audio(identifier))
+    background_music.set_volume(volume)
+    scene.set_background_music(background_music)
+
+def write_track(path: str) -> None:
+    period: bytes = b"".join(struct.pack("<hh", int(8000 * math.sin(2 * math.pi * 220 * i / SAMPLE_RATE)), 0)
+                             for i in range(SAMPLE_RATE // 220))
+    with wave.open(path, "wb") as file:
+        file.setnchannels(2)
+        file.setsampwidth(2)
+        file.setframerate(SAMPLE_RATE)
+        file.writeframes(period * (220 * TRACK_SECONDS))
+
+def write_guide(directory: str, stream: bool) -> str:
+    with open(ASSET_GUIDE, "r") as file:
+        obj = json.load(file)
+    for kind in ("audio", "fonts", "images"):
+        obj[kind] = [entry for entry in obj.get(kind, []) if os.path.exists(entry.get("path"))]
+
+    track: str = os.path.join(directory, THEME + ".wav")
+    write_track(track)
+    obj["audio"].append({"name": THEME, "path": track, "volume": 1, "stream": stream})
+
+    path: str = os.path.join(directory, f"asset_guide_{'stream' if stream else 'decoded'}.json")
+    with open(path, "w") as file:
+        json.dump(obj, file)
+    return path
+
+def load_all_scenes(stream: bool, guide: str) -> None:
+    init_display()
+    Config.LAZY_ASSETS = False
+    Config.LAZY_SCENE_LOADING = False
+    Config.SCENE_PREFETCH = False
+    Config.SCENE_CACHE = False
+    if not stream:
+        scene_manager.load_background_music = legacy_load_background_music
+    AssetManager(guide)
+
+    manager: SceneManager = SceneManager(SCENE_GUIDE, None)
+    decoded: int = 0
+    scored: int = 0
+    for name in list(manager.scenes.paths):
+        music = manager.scenes[name].background_music
+        if music is None:
+            continue
+        scored += 1
+        if not isinstance(music, MusicTrack):
+            decoded += len(music.get_raw())
+
+    peak_kib: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"peak_kib": peak_kib, "decoded_kib": decoded / 1024, "scored": scored}))
+
+def measure(stream: bool, guide: str) -> dict:
+    output: str = subprocess.run(
+        [sys.executable, "-m", "benchmarks.music_streaming", "--child", "stream" if stream else "decoded", guide],
+        capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main() -> None:
+    if len(sys.argv) == 4 and sys.argv[1] == "--child":
+        load_all_scenes(sys.argv[2] == "stream", sys.argv[3])
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        decoded: dict = measure(False, write_guide(directory, False))
+        streamed: dict = measure(True, write_guide(directory, True))
+
+    report(f"peak RSS with all scenes parsed, {decoded['scored']} scored",
+           [("decoded per scene", decoded["peak_kib"] / 1024), ("streamed", streamed["peak_kib"] / 1024)], "MiB")
+    report("PCM held by scene music", [("decoded per scene", decoded["decoded_kib"] / 1024),
+                                       ("streamed", streamed["decoded_kib"] / 1024)], "MiB")
+
+if __name__ == "__main__":
+    main()
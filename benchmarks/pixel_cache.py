@@ -0,0 +1,53 @@
+"""Derived pixel work on start-up, tiling every map element of every scene, computed from the source images versus read
+back from the on-disk pixel cache.
+
+Run from the repository root with ``python -m benchmarks.pixel_cache``.
+"""
+import tempfile
+import time
+
+from benchmarks.common import init_display, load_assets, report
+
+from src.config import Config
+from src.map_element import MapElement
+from src.pixel_cache import PixelCache
+from src.scene_manager import SceneManager
+
+SCENE_GUIDE: str = "scenes/scene_guide.json"
+REPEATS: int = 5
+
+def map_elements() -> list[MapElement]:
+    manager: SceneManager = SceneManager(SCENE_GUIDE, None)
+    return [resource for name in list(manager.scenes.paths) for resource in manager.scenes[name].resources
+            if isinstance(resource, MapElement)]
+
+def run(cached: bool, elements: list[MapElement]) -> float:
+    Config.PIXEL_CACHE = cached
+    best: float = float("inf")
+    for _ in range(REPEATS):
+        start: float = time.perf_counter()
+        for element in elements:
+            element.render_surface = None
+            element.finalize()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def main() -> None:
+    init_display()
+    Config.SPRITE_ATLAS = False
+    Config.SCENE_CACHE = False
+    Config.SCENE_PREFETCH = False
+    load_assets()
+
+    with tempfile.TemporaryDirectory() as directory:
+        PixelCache.DIRECTORY = directory
+        elements: list[MapElement] = map_elements()
+
+        cold: float = run(False, elements)
+        run(True, elements)
+        warm: float = run(True, elements)
+
+    report(f"tiling {len(elements)} map elements", [("computed", cold), ("pixel cache", warm)], "ms")
+
+if __name__ == "__main__":
+    main()
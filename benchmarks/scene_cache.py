@@ -0,0 +1,50 @@
+"""Time to read every scene file, cold JSON parsing versus a warm compiled scene cache.
+
+Run from the repository root with ``python -m benchmarks.scene_cache``.
+"""
+import json
+import tempfile
+import time
+
+from benchmarks.common import init_display, load_assets, report
+
+from src.config import Config
+from src.scene_cache import SceneCache
+from src.scene_manager import SceneManager
+
+SCENE_GUIDE: str = "scenes/scene_guide.json"
+REPEATS: int = 5
+
+def read_all(manager: SceneManager, paths: list[str], finalize: bool) -> float:
+    best: float = float("inf")
+    for _ in range(REPEATS):
+        start: float = time.perf_counter()
+        for path in paths:
+            manager.read_scene_file(path, not finalize)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def main() -> None:
+    init_display()
+    load_assets()
+
+    with open(SCENE_GUIDE, "r") as file:
+        paths: list[str] = [scene_obj.get("path") for scene_obj in json.load(file).get("scenes", [])]
+
+    Config.SCENE_CACHE = False
+    manager: SceneManager = SceneManager(SCENE_GUIDE, None)
+    with tempfile.TemporaryDirectory() as directory:
+        cold_ms: float = read_all(manager, paths, False)
+        cold_final_ms: float = read_all(manager, paths, True)
+
+        manager.cache = SceneCache(directory)
+        read_all(manager, paths, True)
+        warm_ms: float = read_all(manager, paths, False)
+        warm_final_ms: float = read_all(manager, paths, True)
+
+    report(f"read {len(paths)} scenes, model only", [("JSON parse", cold_ms), ("scene cache", warm_ms)], "ms")
+    report(f"read {len(paths)} scenes, finalized", [("JSON parse", cold_final_ms), ("scene cache", warm_final_ms)], "ms")
+    print("cache", {"hits": manager.cache.hits, "misses": manager.cache.misses})
+
+if __name__ == "__main__":
+    main()
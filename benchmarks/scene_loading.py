@@ -0,0 +1,43 @@
+"""SceneManager start-up time and Python heap, eager parsing of every scene versus lazy parsing on first load.
+
+Run from the repository root with ``python -m benchmarks.scene_loading``.
+"""
+import time
+import tracemalloc
+
+from benchmarks.common import init_display, load_assets, report
+
+from src.config import Config
+from src.scene_manager import SceneManager
+
+SCENE_GUIDE: str = "scenes/scene_guide.json"
+REPEATS: int = 5
+
+def run(lazy: bool) -> tuple[float, float]:
+    Config.LAZY_SCENE_LOADING = lazy
+
+    best: float = float("inf")
+    for _ in range(REPEATS):
+        start: float = time.perf_counter()
+        SceneManager(SCENE_GUIDE, None)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    manager: SceneManager = SceneManager(SCENE_GUIDE, None)
+    resident: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del manager
+    return best * 1000, resident / 1024
+
+def main() -> None:
+    init_display()
+    load_assets()
+
+    eager_ms, eager_kb = run(False)
+    lazy_ms, lazy_kb = run(True)
+
+    report("SceneManager start-up", [("eager", eager_ms), ("lazy", lazy_ms)], "ms")
+    report("Python heap held by SceneManager", [("eager", eager_kb), ("lazy", lazy_kb)], "KiB")
+
+if __name__ == "__main__":
+    main()
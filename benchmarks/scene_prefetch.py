@@ -0,0 +1,65 @@
+"""Main-thread stall of each scene transition along the story chain, synchronous parsing versus prefetching.
+
+Run from the repository root with ``python -m benchmarks.scene_prefetch``.
+"""
+import time
+
+from benchmarks.common import init_display, load_assets, report
+
+import pygame
+
+from src.camera import Camera
+from src.config import Config
+from src.scene_manager import SceneManager
+from src.ui_manager import UIManager
+
+SCENE_GUIDE: str = "scenes/scene_guide.json"
+FRAMES_PER_SCENE: int = 30
+
+def run(window: pygame.Surface, prefetch: bool) -> tuple[list[float], float, dict[str, float]]:
+    Config.SCENE_PREFETCH = prefetch
+    ui_manager: UIManager = UIManager(window)
+    manager: SceneManager = SceneManager(SCENE_GUIDE, None)
+
+    stalls: list[float] = []
+    worst_frame: float = 0
+    scene_name: str = manager.start_scene
+    while scene_name != "":
+        start: float = time.perf_counter()
+        manager.load_scene(scene_name, "main", pygame.Vector2(0, 1))
+        stalls.append((time.perf_counter() - start) * 1000)
+
+        for _ in range(FRAMES_PER_SCENE):
+            start = time.perf_counter()
+            manager.update(ui_manager, 1 / 60)
+            manager.render(window, ui_manager)
+            worst_frame = max(worst_frame, (time.perf_counter() - start) * 1000)
+            time.sleep(1 / 60)
+
+        next_scenes: list[str] = manager.scenes[scene_name].next_scenes
+        scene_name = next_scenes[0] if next_scenes else ""
+
+    Camera.TRACK = None
+    manager.prefetcher.shutdown()
+    return stalls, worst_frame, manager.prefetcher.stats()
+
+def main() -> None:
+    window: pygame.Surface = init_display()
+    load_assets()
+
+    sync_stalls, sync_frame, _ = run(window, False)
+    prefetch_stalls, prefetch_frame, stats = run(window, True)
+
+    report(f"scene transition stall over {len(sync_stalls)} scenes (mean)", [
+        ("synchronous", sum(sync_stalls) / len(sync_stalls)),
+        ("prefetched", sum(prefetch_stalls) / len(prefetch_stalls))
+    ], "ms")
+    report("scene transition stall (worst)", [
+        ("synchronous", max(sync_stalls)),
+        ("prefetched", max(prefetch_stalls))
+    ], "ms")
+    report("worst in-scene frame", [("synchronous", sync_frame), ("prefetched", prefetch_frame)], "ms")
+    print("prefetcher", stats)
+
+if __name__ == "__main__":
+    main()
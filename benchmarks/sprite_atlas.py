@@ -0,0 +1,93 @@
+"""Entity render cost with 200 NPCs on screen, one surface per sprite frame drawn blit by blit versus frames packed
+into a sprite atlas and drawn with a single batched blits call.
+
+Run from the repository root with ``python -m benchmarks.sprite_atlas``.
+"""
+import random
+
+from benchmarks.common import init_display, load_assets, measure_fps, report
+
+import pygame
+
+from src.asset_manager import AssetManager
+from src.camera import Camera
+from src.config import Config
+from src.entity import Entity
+from src.npc import NPC
+from src.player import Player
+from src.route_tracker import Conditions
+from src.scene import Scene
+from src.sprite import FrameSet, Sprite, copy_sprite
+from src.ui_manager import UIManager
+
+FRAMES: int = 300
+BOUNDS: tuple[int, int] = (200, 200)
+CROWD: int = 200
+SEED: int = 5
+
+class LegacyScene(Scene):
+    def render(self, window_surface: pygame.Surface, ui_manager: UIManager) -> None:
+        window_surface.fill((0, 0, 0))
+        self.map_layer.render(window_surface)
+        view: pygame.Rect = pygame.Rect(Camera.POS, Config.WINDOW_DIMS).inflate(2, 2)
+        self.spatial_grid.sync(self.entities)
+        visible: list[Entity] = self.spatial_grid.query(view)
+        for entity in visible:
+            if isinstance(entity, Player):
+                continue
+            frame: pygame.Surface = entity.sprite.get() or AssetManager.NULL_IMAGE
+            centered: pygame.Vector2 = entity.pos - pygame.Vector2(frame.get_size()) / 2
+            window_surface.blit(frame, Camera.world_pos_to_view_pos(centered))
+        self.player.render(window_surface)
+
+def build_scene(scene_type: type, sprites: list[Sprite]) -> Scene:
+    rng: random.Random = random.Random(SEED)
+    empty: Conditions = Conditions([], [], [])
+    view: pygame.Vector2 = pygame.Vector2(Config.WINDOW_DIMS) / Config.TILE_SIZE
+
+    entities: dict[str, Entity] = {}
+    for i in range(CROWD):
+        sprite: Sprite = copy_sprite(sprites[i % len(sprites)])
+        sprite.frame_index = rng.randrange(sprite.num_frames)
+        entities[f"npc{i}"] = NPC(sprite, True, pygame.Vector2(rng.randrange(1, int(view.x) - 1),
+                                                               rng.randrange(1, int(view.y) - 1)), empty, {}, {})
+    player: Player = Player(view // 2, copy_sprite(sprites[0]), 0.2)
+    scene: Scene = scene_type((0, 0, 0, 0), pygame.Vector2(BOUNDS), None, [], player, entities, {}, {}, [])
+    scene.load("", pygame.Vector2(0, 1), False, False)
+    Camera.TRACK = None
+    return scene
+
+def run(window: pygame.Surface, scene: Scene) -> float:
+    ui_manager: UIManager = UIManager(window)
+
+    def frame() -> None:
+        Camera.POS = pygame.Vector2(0, 0)
+        scene.render(window, ui_manager)
+
+    return measure_fps(frame, FRAMES)
+
+def main() -> None:
+    window: pygame.Surface = init_display()
+
+    Config.SPRITE_ATLAS = False
+    load_assets()
+    loose: list[Sprite] = [
+        Sprite(FrameSet({animation: [frame.copy() for frame in frames] for animation, frames in sprite.frames.items()},
+                        sprite.dimensions, sprite.num_frames))
+        for sprite in AssetManager.SPRITES.values()
+    ]
+    legacy: Scene = build_scene(LegacyScene, loose)
+
+    Config.SPRITE_ATLAS = True
+    AssetManager.pack_sprites()
+    atlas: Scene = build_scene(Scene, list(AssetManager.SPRITES.values()))
+
+    report(f"{CROWD} NPCs on screen", [
+        ("surface per frame", run(window, legacy)),
+        ("atlas, batched", run(window, atlas))
+    ], "fps")
+    print(f"  atlas pages: {len(AssetManager.ATLAS.pages)}, "
+          f"frames: {sum(len(frames) for frame_set in AssetManager.FRAME_SETS.values() for frames in frame_set.frames.values())}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Sprite frame surface bytes held by every scene once all of them are parsed, a private copy of each frame per
+entity versus frame sets shared through AssetManager.
+
+Run from the repository root with ``python -m benchmarks.sprite_memory``.
+"""
+from benchmarks.common import init_display, load_assets, report
+
+from src import scene_manager
+from src.config import Config
+from src.scene_manager import SceneManager
+from src.sprite import FrameSet, Sprite, copy_sprite
+
+SCENE_GUIDE: str = "scenes/scene_guide.json"
+
+def legacy_copy_sprite(sprite: Sprite) -> Sprite:
+    frames: dict = {animation: [frame.copy() for frame in frames] for animation, frames in sprite.frames.items()}
+    return Sprite(FrameSet(frames, sprite.dimensions, sprite.num_frames), sprite.default_anim, sprite.frame_time)
+
+def run(copy) -> tuple[int, int, int]:
+    scene_manager.copy_sprite = copy
+    manager: SceneManager = SceneManager(SCENE_GUIDE, None)
+    scene_manager.copy_sprite = copy_sprite
+
+    sprites: int = 0
+    frames: dict[int, int] = {}
+    for name in list(manager.scenes.paths):
+        scene = manager.scenes[name]
+        for entity in [scene.player, *scene.entities_dict.values()]:
+            sprites += 1
+            for animation_frames in entity.sprite.frames.values():
+                for frame in animation_frames:
+                    frames[id(frame)] = frame.get_width() * frame.get_height() * frame.get_bytesize()
+    return sprites, len(frames), sum(frames.values())
+
+def main() -> None:
+    init_display()
+    Config.SPRITE_ATLAS = False
+    Config.LAZY_SCENE_LOADING = False
+    Config.SCENE_PREFETCH = False
+    Config.SCENE_CACHE = False
+    load_assets()
+
+    sprites, copied_frames, copied_bytes = run(legacy_copy_sprite)
+    _, shared_frames, shared_bytes = run(copy_sprite)
+
+    print(f"{sprites} entity sprites across all scenes")
+    report("distinct frame surfaces", [("copied", copied_frames), ("shared", shared_frames)], "surfaces")
+    report("frame surface bytes", [("copied", copied_bytes / 1024), ("shared", shared_bytes / 1024)], "KiB")
+
+if __name__ == "__main__":
+    main()
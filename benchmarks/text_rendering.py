@@ -0,0 +1,144 @@
+"""Frames per second of a dialogue-heavy frame, per-frame font.render versus the glyph atlas.
+
+Run from the repository root with ``python -m benchmarks.text_rendering``.
+"""
+import json
+
+from benchmarks.common import init_display, load_assets, measure_fps, report
+
+import pygame
+
+import src.ui_manager as ui_manager_module
+from src.asset_manager import AssetManager
+from src.config import Config
+from src.dialogue import SPEAKER_TEXT_POS, SPOKEN_TEXT_POS, Dialogue, Monologue, MonologueLine, MonologueOption
+from src.event import DispatchChain
+from src.route_tracker import Conditions
+from src.text_engine import TextCache, TextEngine
+from src.ui_manager import Button, Text, UIManager
+
+FRAMES: int = 600
+
+class LegacyTextEngine:
+    @classmethod
+    def size(cls, text: str, font: pygame.font.Font) -> tuple[int, int]:
+        return font.render(text, True, (255, 255, 255)).get_size()
+
+    @classmethod
+    def draw(cls, surface: pygame.Surface, text: str, font: pygame.font.Font, color: list,
+             rect: pygame.Rect, cached: bool = True, width: int | None = None) -> None:
+        width = rect.width if width is None else width
+        y: int = rect.top
+        font_height: int = font.size("Tg")[1]
+        blits: list = []
+        for line in text.split("\n"):
+            while line:
+                i: int = 1
+                while font.size(line[:i])[0] < width and i < len(line):
+                    i += 1
+                if i < len(line):
+                    split_idx: int = line.rfind(" ", 0, i)
+                    i = split_idx + 1 if split_idx != -1 else i
+                img: pygame.Surface = font.render(line[:i], False, color[:3]).convert()
+                if color[3] < 255: img.set_alpha(color[3])
+                blits.append((img, (rect.left, y)))
+                y += font_height - 2
+                line = line[i:]
+        surface.blits(blits)
+
+class LegacyMonologue(Monologue):
+    def draw_text(self, surface: pygame.Surface, ui_manager: UIManager,
+                  text_end: pygame.Vector2, start: pygame.Vector2, dims: pygame.Rect) -> None:
+        ui_manager.draw_text(Text(
+            self.speaker, [255, 255, 255, 255],
+            start + SPEAKER_TEXT_POS, AssetManager.get_font("snake46"),
+            dimensions=pygame.Vector2(text_end.x - (start.x + SPEAKER_TEXT_POS.x),
+                                      dims.height - SPEAKER_TEXT_POS.y)
+        ), surface)
+
+        ui_manager.draw_text(Text(
+            self.spoken, [255, 255, 255, 255],
+            start + SPOKEN_TEXT_POS, self.font,
+            dimensions=pygame.Vector2(text_end.x - (start.x + SPOKEN_TEXT_POS.x),
+                                      dims.height - SPOKEN_TEXT_POS.y)
+        ), surface)
+
+def longest_lines(path: str) -> list[str]:
+    best: list[str] = []
+
+    def walk(obj) -> None:
+        nonlocal best
+        if isinstance(obj, dict):
+            if "lines" in obj:
+                lines: list[str] = [line.get("text", "") for line in obj.get("lines")]
+                if len("".join(lines)) > len("".join(best)):
+                    best = lines
+            for value in obj.values():
+                walk(value)
+        elif isinstance(obj, list):
+            for value in obj:
+                walk(value)
+
+    with open(path, "r") as file:
+        walk(json.load(file))
+    return best
+
+def build_dialogue(monologue_type: type) -> Dialogue:
+    empty: Conditions = Conditions([], [], [])
+    lines: list[MonologueLine] = [MonologueLine(text, 0) for text in longest_lines("scenes/esi/bucket.json")]
+    options: list[MonologueOption] = [
+        MonologueOption("Stay quiet", "", empty),
+        MonologueOption("Ask about Abronoma", "", empty),
+        MonologueOption("Walk away", "", empty)
+    ]
+    monologue: Monologue = monologue_type(
+        conditions=empty, alt_monologue="", speaker="Big Man", lines=lines,
+        font=AssetManager.get_font("snake32"), next_monologue=None, set_route=[],
+        dispatch=DispatchChain([]), modify_flags=[], options=options,
+        speaker_image=AssetManager.get_image("big_man_portrait")
+    )
+    for _ in lines:
+        monologue.advance()
+        monologue.advance()
+    monologue.line_index[0] = len(lines) - 1
+    monologue.awaiting_choice = True
+    monologue.choice_fade = 255
+
+    dialogue: Dialogue = Dialogue(empty, [("m", empty)], {"m": monologue}, "")
+    dialogue.current_monologue = "m"
+    dialogue.playing = True
+    dialogue.fade = 255
+    return dialogue
+
+def run(window: pygame.Surface, monologue_type: type) -> float:
+    ui_manager: UIManager = UIManager(window)
+    dialogue: Dialogue = build_dialogue(monologue_type)
+    dims: pygame.Rect = pygame.Rect(Config.DIALOGUE_BOX_POS, Config.DIALOGUE_BOX_DIMS)
+    center: pygame.Vector2 = pygame.Vector2(window.get_rect().center)
+
+    def frame() -> None:
+        window.fill((0, 0, 0))
+        dialogue.render(window, dims, ui_manager)
+        for i, label in enumerate(["Continue", "Main Menu", "Exit to Desktop"]):
+            ui_manager.draw_button(Button(Text(
+                label, [255, 255, 255, 255], center + pygame.Vector2(0, -200 + 70 * i),
+                AssetManager.get_font("snake64"), align_center=True
+            ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]), i)
+
+    return measure_fps(frame, FRAMES)
+
+def main() -> None:
+    window: pygame.Surface = init_display()
+    load_assets()
+
+    # The legacy run also draws dialogue text through UIManager, as Monologue did before TextCanvas
+    ui_manager_module.TextEngine = LegacyTextEngine
+    before: float = run(window, LegacyMonologue)
+    ui_manager_module.TextEngine = TextEngine
+    after: float = run(window, Monologue)
+
+    report("dialogue frame", [("font.render", before), ("glyph atlas", after)], "fps")
+    print("text cache", TextCache.stats())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Per-frame trigger cost in a trigger-heavy scene where nothing is happening, polling every trigger versus the
+signal-driven TriggerScheduler.
+
+Run from the repository root with ``python -m benchmarks.triggers``.
+"""
+import random
+import time
+
+from benchmarks.common import init_display, load_assets, report
+
+import pygame
+
+from src.asset_manager import AssetManager
+from src.camera import Camera
+from src.config import Config
+from src.event import OnEntityEnter, OnPlayerEnter, OnSceneStart, PlayAudio
+from src.npc import NPC
+from src.player import Player
+from src.route_tracker import Conditions
+from src.scene import Scene
+from src.sprite import copy_sprite
+from src.trigger import Trigger
+
+FRAMES: int = 600
+TRIGGERS: int = 1000
+BOUNDS: tuple[int, int] = (200, 200)
+ENTITIES: int = 20
+SEED: int = 17
+
+def build_scene() -> Scene:
+    rng: random.Random = random.Random(SEED)
+    sprite = AssetManager.get_sprite("esi")
+
+    def random_rect() -> pygame.Rect:
+        return pygame.Rect(rng.randrange(BOUNDS[0]), rng.randrange(BOUNDS[1]), rng.randint(1, 4), rng.randint(1, 4))
+
+    def random_conditions() -> Conditions:
+        return Conditions([f"flag{rng.randrange(50)}"], [], [f"flag{rng.randrange(50)}"])
+
+    entities: dict = {f"npc{i}": NPC(copy_sprite(sprite), True, pygame.Vector2(rng.randrange(BOUNDS[0]),
+                                                                             rng.randrange(BOUNDS[1])),
+                                     Conditions([], [], []), {}, {})
+                      for i in range(ENTITIES)}
+    triggers: dict[str, Trigger] = {}
+    for i in range(TRIGGERS):
+        match i % 3:
+            case 0:
+                catch = OnPlayerEnter(random_rect())
+            case 1:
+                catch = OnEntityEnter([f"npc{rng.randrange(ENTITIES)}"], random_rect())
+            case _:
+                catch = OnSceneStart()
+        catch.conditions = random_conditions()
+        triggers[f"trigger{i}"] = Trigger(False, True, [catch], [PlayAudio("", 0)])
+
+    player: Player = Player(pygame.Vector2(BOUNDS[0] // 2, BOUNDS[1] // 2), copy_sprite(sprite), 0.2)
+    scene: Scene = Scene((0, 0, 0, 0), pygame.Vector2(BOUNDS), None, [], player, entities, triggers, {}, [])
+    scene.load("", pygame.Vector2(0, 1), False, False)
+    Camera.TRACK = None
+    return scene
+
+def run(event_triggers: bool) -> tuple[float, int]:
+    scene: Scene = build_scene()
+
+    def frame() -> None:
+        if event_triggers:
+            scene.trigger_scheduler.update(scene, None)
+            return
+        for _, trigger in scene.triggers.items():
+            if trigger.catch(scene):
+                trigger.dispatch(None, scene)
+
+    frame()
+    start: float = time.perf_counter()
+    for _ in range(FRAMES):
+        frame()
+    elapsed: float = time.perf_counter() - start
+    return elapsed / FRAMES * 1e6, scene.trigger_scheduler.evaluated
+
+def main() -> None:
+    init_display()
+    load_assets()
+    Config.EVENT_TRIGGERS = True
+
+    polled_us, _ = run(False)
+    scheduled_us, evaluated = run(True)
+
+    report(f"trigger cost per idle frame, {TRIGGERS} triggers", [("poll every trigger", polled_us),
+                                                                 ("trigger scheduler", scheduled_us)], "us")
+    print(f"  catch events evaluated by the scheduler over {FRAMES + 1} frames: {evaluated}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Cost of a busy cutscene firing voice samples every frame, a Sound copy per dispatch on pygame's free channel pool
+versus preloaded Sounds on the VoiceManager's reserved channels.
+
+Run from the repository root with ``python -m benchmarks.voice_pool``.
+"""
+import time
+
+from benchmarks.common import init_display, load_assets, report
+
+import pygame
+
+from src.asset_manager import AssetManager
+from src.event import PlayAudio
+from src.voice_manager import VoiceManager
+
+FRAMES: int = 600
+DISPATCHES_PER_FRAME: int = 4
+VOICES: list[str] = ["alto_voice", "baritone_voice", "bass_voice", "mezzo_soprano_voice", "tenor_voice"]
+
+class LegacyPlayAudio(PlayAudio):
+    COPIED: int = 0
+
+    def dispatch(self, scene, manager) -> None:
+        self.sound = AssetManager.get_audio(self.audio_id)
+        self.sound = pygame.mixer.Sound(self.sound)
+        frequency, size, channels = pygame.mixer.get_init()
+        LegacyPlayAudio.COPIED += int(self.sound.get_length() * frequency) * channels * abs(size) // 8
+        if self.sound is not None:
+            self.sound.set_volume(self.volume)
+            self.sound.play()
+        self.dispatched = True
+
+def run(event_type: type) -> float:
+    voices: list[str] = [voice for voice in VOICES if AssetManager.get_audio(voice) is not None]
+    start: float = time.perf_counter()
+    for frame in range(FRAMES):
+        for i in range(DISPATCHES_PER_FRAME):
+            event_type(voices[(frame + i) % len(voices)], 0.5).dispatch(None, None)
+    elapsed: float = time.perf_counter() - start
+    pygame.mixer.stop()
+    return elapsed / (FRAMES * DISPATCHES_PER_FRAME) * 1e6
+
+def main() -> None:
+    init_display()
+    load_assets(audio=True)
+
+    legacy_us: float = run(LegacyPlayAudio)
+    pooled_us: float = run(PlayAudio)
+
+    report("mean dispatch cost", [("sound copy", legacy_us), ("voice pool", pooled_us)], "us")
+    report("PCM copied", [("sound copy", LegacyPlayAudio.COPIED / 1024 / 1024), ("voice pool", 0)], "MiB")
+    print(f"  voice pool: {VoiceManager.stats()}")
+
+if __name__ == "__main__":
+    main()
@@ -1,40 +1,125 @@
+import hashlib
+import io
 import json
+import logging
+import os
 import pygame
+import time
 
-from src.sprite import Sprite
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from src.config import Config
+from src.music_player import MusicTrack
+from src.sprite import FrameSet, Sprite, slice_frames
+from src.sprite_atlas import SpriteAtlas
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+def read_bytes(path: str) -> bytes:
+    with open(path, "rb") as file:
+        return file.read()
+
+def load_image(path: str) -> tuple[pygame.Surface, str]:
+    data: bytes = read_bytes(path)
+    return pygame.image.load(io.BytesIO(data), path), hashlib.sha256(data).hexdigest()
+
+def resolve(asset):
+    return asset.get() if isinstance(asset, AssetHandle) else asset
+
+class AssetHandle:
+    def __init__(self, kind: str, name: str):
+        self.kind: str = kind
+        self.name: str = name
+
+    def key(self) -> tuple[str, str]:
+        return self.kind, self.name
+
+    def get(self, size: tuple[int, int] | None = None):
+        match self.kind:
+            case "audio":
+                return AssetManager.get_audio(self.name)
+            case "images":
+                return AssetManager.get_image(self.name, size)
+        return None
 
 class AssetManager:
     NULL_IMAGE: pygame.Surface | None = None
+    GUIDE_DIGEST: str = ""
 
     AUDIO_ASSETS: dict[str, pygame.mixer.Sound] = {}
     FONT_ASSETS: dict[str, pygame.font.Font] = {}
     IMAGE_ASSETS: dict[str, pygame.Surface] = {}
     SPRITES: dict[str, Sprite] = {}
+    FRAME_SETS: dict[tuple, FrameSet] = {}
+    ATLAS: SpriteAtlas | None = None
+
+    AUDIO_ENTRIES: dict[str, dict] = {}
+    IMAGE_ENTRIES: dict[str, dict] = {}
+    SCALED_IMAGES: dict[tuple[str, tuple[int, int]], pygame.Surface] = {}
+    IMAGE_DIGESTS: dict[str, str] = {}
+    VOLUMES: dict[str, float] = {}
+
+    REFS: dict[tuple[str, str], int] = {}
+    SIZES: dict[tuple[str, str], int] = {}
+    LAST_USE: dict[tuple[str, str], int] = {}
+    USE_COUNTER: int = 0
+
+    LOAD_TIMES: dict[str, float] = {}
 
     def __init__(self, asset_guide: str):
-        with open(asset_guide, "r") as file:
-            obj = json.load(file)
-
-        for audio in obj.get("audio", []):
-            self.add_audio(
-                name=audio.get("name"),
-                audio_path=audio.get("path"),
-                volume=audio.get("volume")
-            )
+        with open(asset_guide, "rb") as file:
+            source: bytes = file.read()
+        AssetManager.GUIDE_DIGEST = hashlib.sha256(source).hexdigest()
+        obj = json.loads(source)
+
+        AssetManager.AUDIO_ENTRIES = {audio.get("name"): audio for audio in obj.get("audio", [])}
+        AssetManager.IMAGE_ENTRIES = {image.get("name"): image for image in obj.get("images", [])}
+        audios: list[dict] = [audio for audio in obj.get("audio", []) if not audio.get("stream", False)]
+        images: list[dict] = obj.get("images", [])
+        pinned: set[str] = {sprite.get("sprite_sheet") for sprite in obj.get("sprites", [])} | {"null"}
+        if Config.LAZY_ASSETS:
+            audios = []
+            images = [image for image in images if image.get("name") in pinned]
+
+        start: float = time.perf_counter()
+        workers: int = max(1, min(Config.ASSET_LOADER_THREADS, os.cpu_count() or 1))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="asset-loader") as pool:
+            audio_data: list[Future] = [pool.submit(read_bytes, audio.get("path")) for audio in audios]
+            font_data: list[Future] = [pool.submit(read_bytes, font.get("path"))
+                                       for font in obj.get("fonts", [])]
+            image_data: list[Future] = [pool.submit(load_image, image.get("path")) for image in images]
 
-        for font in obj.get("fonts", []):
-            for size in font.get("sizes", []):
-                self.add_font(
-                    name=font.get("name"),
-                    font_path=font.get("path"),
-                    font_size=size
+            for audio, data in zip(audios, audio_data):
+                self.add_audio(
+                    name=audio.get("name"),
+                    audio_path=audio.get("path"),
+                    volume=audio.get("volume"),
+                    data=data.result()
                 )
+            AssetManager.LOAD_TIMES["audio"] = time.perf_counter() - start
+            start = time.perf_counter()
 
-        for image in obj.get("images", []):
-            self.add_image(
-                name=image.get("name"),
-                image_path=image.get("path")
-            )
+            for font, data in zip(obj.get("fonts", []), font_data):
+                for size in font.get("sizes", []):
+                    self.add_font(
+                        name=font.get("name"),
+                        font_path=font.get("path"),
+                        font_size=size,
+                        data=data.result()
+                    )
+            AssetManager.LOAD_TIMES["fonts"] = time.perf_counter() - start
+            start = time.perf_counter()
+
+            for image, data in zip(images, image_data):
+                self.add_image(
+                    name=image.get("name"),
+                    image_path=image.get("path"),
+                    image=data.result()[0],
+                    digest=data.result()[1]
+                )
+            AssetManager.LOAD_TIMES["images"] = time.perf_counter() - start
+
+        start = time.perf_counter()
 
         for sprite in obj.get("sprites", []):
             self.add_sprite(
@@ -45,44 +130,149 @@ class AssetManager:
                 animation_layout=sprite.get("animation_layout"),
                 num_frames=sprite.get("num_frames")
             )
+        self.pack_sprites()
+        AssetManager.LOAD_TIMES["sprites"] = time.perf_counter() - start
+        logger.info("assets loaded in %s", ", ".join(f"{kind} {seconds * 1000:.1f} ms"
+                                                     for kind, seconds in AssetManager.LOAD_TIMES.items()))
+
+        for name in pinned:
+            self.pin(("images", name))
 
     @classmethod
-    def add_audio(cls, name: str, audio_path: str, volume: float) -> None:
-        sound: pygame.mixer.Sound = pygame.mixer.Sound(audio_path)
-        sound.set_volume(volume)
+    def add_audio(cls, name: str, audio_path: str, volume: float, data: bytes | None = None) -> None:
+        sound: pygame.mixer.Sound = pygame.mixer.Sound(audio_path if data is None else io.BytesIO(data))
+        sound.set_volume(cls.VOLUMES.get(name, volume))
         cls.AUDIO_ASSETS[name] = sound
 
+        frequency, size, channels = pygame.mixer.get_init()
+        cls.SIZES[("audio", name)] = int(sound.get_length() * frequency) * channels * abs(size) // 8
+
     @classmethod
-    def add_font(cls, name: str, font_path: str, font_size: int) -> None:
-        cls.FONT_ASSETS[name + str(font_size)] = pygame.font.Font(font_path, font_size)
+    def add_font(cls, name: str, font_path: str, font_size: int, data: bytes | None = None) -> None:
+        cls.FONT_ASSETS[name + str(font_size)] = pygame.font.Font(
+            font_path if data is None else io.BytesIO(data), font_size)
 
     @classmethod
-    def add_image(cls, name: str, image_path: str) -> None:
-        cls.IMAGE_ASSETS[name] = pygame.image.load(image_path).convert_alpha()
+    def add_image(cls, name: str, image_path: str, image: pygame.Surface | None = None,
+                  digest: str | None = None) -> None:
+        if image is None:
+            image, digest = load_image(image_path)
+        cls.IMAGE_ASSETS[name] = image.convert_alpha()
+        if digest is not None:
+            cls.IMAGE_DIGESTS[name] = digest
+        cls.SIZES[("images", name)] = cls.IMAGE_ASSETS[name].get_width() * cls.IMAGE_ASSETS[name].get_height() * 4
 
     @classmethod
     def add_sprite(cls, name: str, sprite_sheet: str, dimensions: pygame.Vector2,
                    animations: list[str], animation_layout: str,
                    num_frames: int) -> None:
-        cls.SPRITES[name] = Sprite(
-            spritesheet=AssetManager.get_image(sprite_sheet),
-            dimensions=dimensions,
-            animations=animations,
-            row_major=animation_layout == "rows",
-            num_frames=num_frames
-        )
+        key: tuple = (sprite_sheet, max(1.0, Config.ENTITY_RENDER_SCALE), tuple(dimensions), animation_layout)
+        if (frame_set := cls.FRAME_SETS.get(key, None)) is None:
+            frame_set = slice_frames(
+                spritesheet=AssetManager.get_image(sprite_sheet),
+                dimensions=dimensions,
+                animations=animations,
+                row_major=animation_layout == "rows",
+                num_frames=num_frames
+            )
+            cls.FRAME_SETS[key] = frame_set
+        cls.SPRITES[name] = Sprite(frame_set)
+
+    @classmethod
+    def touch(cls, key: tuple[str, str]) -> None:
+        cls.USE_COUNTER += 1
+        cls.LAST_USE[key] = cls.USE_COUNTER
+
+    @classmethod
+    def handle(cls, kind: str, name: str) -> AssetHandle | None:
+        match kind:
+            case "audio":
+                known: bool = name in cls.AUDIO_ASSETS or name in cls.AUDIO_ENTRIES
+            case "images":
+                known: bool = name in cls.IMAGE_ASSETS or name in cls.IMAGE_ENTRIES
+            case _:
+                known: bool = False
+        return AssetHandle(kind, name) if known else None
+
+    @classmethod
+    def pin(cls, key: tuple[str, str]) -> None:
+        cls.SIZES.pop(key, None)
+
+    @classmethod
+    def acquire(cls, assets: set[tuple[str, str]]) -> None:
+        for key in assets:
+            cls.REFS[key] = cls.REFS.get(key, 0) + 1
+
+    @classmethod
+    def release(cls, assets: set[tuple[str, str]]) -> None:
+        for key in assets:
+            cls.REFS[key] = max(0, cls.REFS.get(key, 0) - 1)
+        cls.evict()
+
+    @classmethod
+    def resident_bytes(cls) -> int:
+        return sum(cls.SIZES.values())
+
+    @classmethod
+    def evict(cls) -> None:
+        if not Config.LAZY_ASSETS:
+            return
+
+        resident: int = cls.resident_bytes()
+        unused: list[tuple[str, str]] = sorted([key for key in cls.SIZES if cls.REFS.get(key, 0) == 0],
+                                               key=lambda key: cls.LAST_USE.get(key, 0))
+        for kind, name in unused:
+            if resident <= Config.ASSET_MEMORY_BUDGET:
+                break
+            resident -= cls.SIZES.pop((kind, name))
+            if kind == "audio":
+                cls.AUDIO_ASSETS.pop(name, None)
+            else:
+                cls.IMAGE_ASSETS.pop(name, None)
+                for scaled in [scaled for scaled in cls.SCALED_IMAGES if scaled[0] == name]:
+                    cls.SCALED_IMAGES.pop(scaled)
+
+    @classmethod
+    def pack_sprites(cls) -> None:
+        if not Config.SPRITE_ATLAS:
+            return
+        cls.ATLAS = SpriteAtlas()
+        cls.ATLAS.pack(list(cls.FRAME_SETS.values()))
 
     @classmethod
     def get_audio(cls, name: str) -> pygame.mixer.Sound | None:
+        if name not in cls.AUDIO_ASSETS and name in cls.AUDIO_ENTRIES:
+            entry: dict = cls.AUDIO_ENTRIES[name]
+            cls.add_audio(name, entry.get("path"), entry.get("volume"))
+        cls.touch(("audio", name))
         return cls.AUDIO_ASSETS.get(name, None)
 
+    @classmethod
+    def get_music(cls, name: str, volume: float) -> MusicTrack | None:
+        if (entry := cls.AUDIO_ENTRIES.get(name, None)) is None:
+            return None
+        return MusicTrack(name, entry.get("path"), volume)
+
     @classmethod
     def get_font(cls, name: str) -> pygame.font.Font | None:
         return cls.FONT_ASSETS.get(name, None)
 
     @classmethod
-    def get_image(cls, name: str) -> pygame.Surface | None:
-        return cls.IMAGE_ASSETS.get(name, None)
+    def get_image(cls, name: str, size: tuple[int, int] | None = None) -> pygame.Surface | None:
+        if name not in cls.IMAGE_ASSETS and name in cls.IMAGE_ENTRIES:
+            cls.add_image(name, cls.IMAGE_ENTRIES[name].get("path"))
+        cls.touch(("images", name))
+
+        image: pygame.Surface | None = cls.IMAGE_ASSETS.get(name, None)
+        if image is None or size is None:
+            return image
+
+        if (scaled := cls.SCALED_IMAGES.get((name, size), None)) is None:
+            scaled = pygame.transform.scale(image, size)
+            cls.SCALED_IMAGES[(name, size)] = scaled
+            if ("images", name) in cls.SIZES:
+                cls.SIZES[("images", name)] += size[0] * size[1] * 4
+        return scaled
 
     @classmethod
     def get_sprite(cls, name: str) -> Sprite | None:
@@ -92,4 +282,6 @@ class AssetManager:
     def set_voice_volumes(cls, volume: float) -> None:
         voices: list = ["alto_voice", "baritone_voice", "bass_voice", "mezzo_soprano_voice", "soprano_voice", "tenor_voice"]
         for voice in voices:
-            cls.get_audio(voice).set_volume(volume)
\ No newline at end of file
+            cls.VOLUMES[voice] = volume
+            if voice in cls.AUDIO_ASSETS:
+                cls.AUDIO_ASSETS[voice].set_volume(volume)
\ No newline at end of file
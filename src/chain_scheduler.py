@@ -0,0 +1,110 @@
+import heapq
+
+from src.event import DispatchChain, DispatchEvent
+from src.route_tracker import Flags
+
+class ChainScheduler:
+    def __init__(self):
+        self.clock: float = 0
+        self.awake: dict[DispatchChain, None] = {}
+        self.added: dict[DispatchChain, None] = {}
+        self.removed: set[DispatchChain] = set()
+        self.polled: dict[DispatchChain, int] = {} # chain -> dispatch index whose event has no signals
+
+        self.sleeping: dict[DispatchChain, tuple] = {} # chain -> ( token, event, wait, since, signals )
+        self.watchers: dict[tuple, dict[DispatchChain, None]] = {}
+        self.deadlines: list[tuple[float, int, DispatchChain]] = []
+        self.tokens: int = 0
+
+        self.flags_version: int = Flags.VERSION
+        self.dialogue_idle: bool = True
+
+        self.updated: int = 0
+        self.woken: int = 0
+
+    def add(self, chain: DispatchChain) -> None:
+        self.wake(chain)
+        self.added[chain] = None
+
+    def remove(self, chain: DispatchChain) -> None:
+        self.removed.add(chain)
+
+    def active(self) -> int:
+        return len(self.awake) + len(self.sleeping)
+
+    def sleep(self, chain: DispatchChain, wait: float | None, signals: list[tuple]) -> None:
+        self.tokens += 1
+        event: DispatchEvent | None = chain.dispatches[chain.dispatch_index] if wait is not None else None
+        self.sleeping[chain] = (self.tokens, event, wait, self.clock, signals)
+        for signal in signals:
+            self.watchers.setdefault(signal, {})[chain] = None
+        if wait is not None:
+            heapq.heappush(self.deadlines, (self.clock + wait, self.tokens, chain))
+
+    def wake(self, chain: DispatchChain) -> None:
+        if (sleep := self.sleeping.pop(chain, None)) is None:
+            return
+        _, event, wait, since, signals = sleep
+        if event is not None:
+            event.wait = wait - (self.clock - since)
+        for signal in signals:
+            if (watchers := self.watchers.get(signal, None)) is not None:
+                watchers.pop(chain, None)
+                if not watchers:
+                    del self.watchers[signal]
+        self.awake[chain] = None
+        self.woken += 1
+
+    def signal(self, signal: tuple) -> None:
+        for chain in list(self.watchers.get(signal, ())):
+            self.wake(chain)
+
+    def update(self, scene, manager, dt: float) -> None:
+        if self.added:
+            for chain in self.added:
+                self.awake[chain] = None
+            self.added.clear()
+
+        if Flags.VERSION != self.flags_version:
+            if (changed := Flags.changed_since(self.flags_version)) is None:
+                changed = {signal[1] for signal in self.watchers if signal[0] == "flag"}
+            for flag in changed:
+                self.signal(("flag", flag))
+            self.flags_version = Flags.VERSION
+        if (scene.dialogue is None) != self.dialogue_idle:
+            self.dialogue_idle = scene.dialogue is None
+            self.signal(("dialogue",))
+        while self.deadlines and self.deadlines[0][0] <= self.clock:
+            _, token, chain = heapq.heappop(self.deadlines)
+            if (sleep := self.sleeping.get(chain, None)) is not None and sleep[0] == token:
+                self.wake(chain)
+                sleep[1].wait = min(sleep[1].wait, 0)
+
+        if not self.awake:
+            self.clock += dt
+            return
+
+        updated: list[DispatchChain] = list(self.awake)
+        for chain in updated:
+            chain.update(scene, manager, dt)
+        self.updated += len(updated)
+        self.clock += dt
+
+        polled: dict[DispatchChain, int] = self.polled
+        removed: set[DispatchChain] = self.removed
+        for chain in updated:
+            # A chain running an event without signals stays awake until it dispatches past that event
+            if removed and chain in removed or polled.get(chain, None) == chain.last_dispatch_index:
+                continue
+            if (idle := chain.idle(scene)) is not None:
+                del self.awake[chain]
+                polled.pop(chain, None)
+                self.sleep(chain, *idle)
+            elif chain.dispatches[chain.last_dispatch_index].signals() is None:
+                polled[chain] = chain.last_dispatch_index
+
+        if removed:
+            for chain in removed:
+                self.awake.pop(chain, None)
+                polled.pop(chain, None)
+            removed.clear()
@@ -0,0 +1,74 @@
+import enum
+import pygame
+
+from src.map_element import MapElement
+
+class Blocked(enum.Enum):
+    NONE = 0
+    ENTITY = 1
+    MAP = 2
+
+class CollisionIndex:
+    def __init__(self, map_elements: list[MapElement]):
+        solid: list[pygame.Rect] = [map_element.rect for map_element in map_elements
+                                    if map_element.collision and map_element.rect.w > 0 and map_element.rect.h > 0]
+        bounds: pygame.Rect = solid[0].unionall(solid[1:]) if solid else pygame.Rect(0, 0, 0, 0)
+
+        self.bounds: pygame.Rect = bounds
+        self.static: bytearray = bytearray(bounds.w * bounds.h)
+        for rect in solid:
+            for y in range(rect.top - bounds.top, rect.bottom - bounds.top):
+                row: int = y * bounds.w - bounds.left
+                self.static[row + rect.left:row + rect.right] = b"\x01" * rect.w
+
+        self.cells: dict[tuple[int, int], list] = {}
+        self.placed: dict[int, tuple[object, pygame.Rect | None]] = {}
+
+    def is_blocked(self, rect: pygame.Rect) -> Blocked:
+        cells: dict[tuple[int, int], list] = self.cells
+        for y in range(rect.top, rect.bottom):
+            for x in range(rect.left, rect.right):
+                if (x, y) in cells:
+                    return Blocked.ENTITY
+
+        clipped: pygame.Rect = rect.clip(self.bounds)
+        for y in range(clipped.top - self.bounds.top, clipped.bottom - self.bounds.top):
+            row: int = y * self.bounds.w - self.bounds.left
+            if any(self.static[row + clipped.left:row + clipped.right]):
+                return Blocked.MAP
+
+        return Blocked.NONE
+
+    def move(self, entity) -> None:
+        rect: pygame.Rect | None = pygame.Rect(entity.grid_pos, entity.hit_box) if entity.collision else None
+        if (placed := self.placed.get(id(entity), None)) is not None:
+            if placed[1] == rect:
+                return
+            self.remove(entity)
+
+        self.placed[id(entity)] = (entity, rect)
+        if rect is None:
+            return
+        for y in range(rect.top, rect.bottom):
+            for x in range(rect.left, rect.right):
+                self.cells.setdefault((x, y), []).append(entity)
+
+    def remove(self, entity) -> None:
+        if (placed := self.placed.pop(id(entity), None)) is None or placed[1] is None:
+            return
+        rect: pygame.Rect = placed[1]
+        for y in range(rect.top, rect.bottom):
+            for x in range(rect.left, rect.right):
+                occupants: list = self.cells[(x, y)]
+                occupants.remove(entity)
+                if not occupants:
+                    del self.cells[(x, y)]
+
+    def sync(self, entities: list) -> None:
+        present: set[int] = set()
+        for entity in entities:
+            present.add(id(entity))
+            self.move(entity)
+
+        for _, (entity, _) in [item for item in self.placed.items() if item[0] not in present]:
+            self.remove(entity)
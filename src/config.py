@@ -20,6 +20,21 @@ class Config:
     DIALOGUE_BOX_OUTLINE_THICKNESS: int = 3
     DIALOGUE_TRIANGLE_COLOR: pygame.Vector3 = pygame.Vector3(0, 0, 0)
 
+    TEXT_CACHE_BUDGET: int = 8 * 1024 * 1024
+    DIALOGUE_PRELAYOUT: bool = True
+    DIALOGUE_LAYOUT_GENERATION: int = 0
+    DIRTY_RECT_RENDERING: bool = False
+    EVENT_TRIGGERS: bool = True
+    CHAIN_SCHEDULER: bool = True
+    LAZY_SCENE_LOADING: bool = True
+    SCENE_PREFETCH: bool = True
+    SCENE_CACHE: bool = False
+    PIXEL_CACHE: bool = True
+    ASSET_LOADER_THREADS: int = 4
+    LAZY_ASSETS: bool = True
+    ASSET_MEMORY_BUDGET: int = 16 * 1024 * 1024
+    SPRITE_ATLAS: bool = True
+
     @classmethod
     def load(cls, config_path: str) -> None:
         with open(config_path, "r") as file:
@@ -65,11 +80,53 @@ class Config:
         if (tri_color := obj.get("triangle_color", None)) is not None:
             cls.DIALOGUE_TRIANGLE_COLOR = pygame.Vector3(tri_color)
 
+        if (text_cache_budget := obj.get("text_cache_budget", None)) is not None:
+            cls.TEXT_CACHE_BUDGET = text_cache_budget
+
+        if (dialogue_prelayout := obj.get("dialogue_prelayout", None)) is not None:
+            cls.DIALOGUE_PRELAYOUT = dialogue_prelayout
+
+        if (dirty_rect_rendering := obj.get("dirty_rect_rendering", None)) is not None:
+            cls.DIRTY_RECT_RENDERING = dirty_rect_rendering
+
+        if (event_triggers := obj.get("event_triggers", None)) is not None:
+            cls.EVENT_TRIGGERS = event_triggers
+        if (chain_scheduler := obj.get("chain_scheduler", None)) is not None:
+            cls.CHAIN_SCHEDULER = chain_scheduler
+
+        if (lazy_scene_loading := obj.get("lazy_scene_loading", None)) is not None:
+            cls.LAZY_SCENE_LOADING = lazy_scene_loading
+
+        if (scene_prefetch := obj.get("scene_prefetch", None)) is not None:
+            cls.SCENE_PREFETCH = scene_prefetch
+
+        if (scene_cache := obj.get("scene_cache", None)) is not None:
+            cls.SCENE_CACHE = scene_cache
+
+        if (pixel_cache := obj.get("pixel_cache", None)) is not None:
+            cls.PIXEL_CACHE = pixel_cache
+
+        if (asset_loader_threads := obj.get("asset_loader_threads", None)) is not None:
+            cls.ASSET_LOADER_THREADS = asset_loader_threads
+
+        if (lazy_assets := obj.get("lazy_assets", None)) is not None:
+            cls.LAZY_ASSETS = lazy_assets
+
+        if (asset_memory_budget := obj.get("asset_memory_budget", None)) is not None:
+            cls.ASSET_MEMORY_BUDGET = asset_memory_budget
+
+        if (sprite_atlas := obj.get("sprite_atlas", None)) is not None:
+            cls.SPRITE_ATLAS = sprite_atlas
+
     @classmethod
     def set_window_dimensions(cls, dims: tuple) -> None:
         cls.WINDOW_DIMS = pygame.Vector2(dims)
 
-        cls.DIALOGUE_BOX_DIMS = pygame.Vector2(math.ceil(cls.DIALOGUE_BOX_DIMS_FRACTIONS.x * cls.WINDOW_DIMS.x),
-                                               math.ceil(cls.DIALOGUE_BOX_DIMS_FRACTIONS.y * cls.WINDOW_DIMS.y))
+        dialogue_box_dims: pygame.Vector2 = pygame.Vector2(
+            math.ceil(cls.DIALOGUE_BOX_DIMS_FRACTIONS.x * cls.WINDOW_DIMS.x),
+            math.ceil(cls.DIALOGUE_BOX_DIMS_FRACTIONS.y * cls.WINDOW_DIMS.y))
+        if dialogue_box_dims != cls.DIALOGUE_BOX_DIMS:
+            cls.DIALOGUE_LAYOUT_GENERATION += 1
+        cls.DIALOGUE_BOX_DIMS = dialogue_box_dims
         cls.DIALOGUE_BOX_POS = pygame.Vector2(math.ceil(cls.DIALOGUE_BOX_POS_FRACTIONS.x * cls.WINDOW_DIMS.x),
                                               math.ceil(cls.DIALOGUE_BOX_POS_FRACTIONS.y * cls.WINDOW_DIMS.y))
@@ -0,0 +1,60 @@
+import pygame
+
+def merge_rects(rects: list[pygame.Rect]) -> list[pygame.Rect]:
+    merged: list[pygame.Rect] = []
+    pending: list[pygame.Rect] = [rect.copy() for rect in rects]
+    while pending:
+        rect: pygame.Rect = pending.pop()
+        i: int = 0
+        while i < len(merged):
+            union: pygame.Rect = rect.union(merged[i])
+            if union.w * union.h <= rect.w * rect.h + merged[i].w * merged[i].h:
+                rect = union
+                merged.pop(i)
+                i = 0
+            else:
+                i += 1
+        merged.append(rect)
+    return merged
+
+class DamageTracker:
+    def __init__(self, size: tuple[int, int]):
+        self.screen: pygame.Rect = pygame.Rect((0, 0), size)
+        self.rects: list[pygame.Rect] = []
+        self.full_frame: bool = True
+
+        self.frames: int = 0
+        self.full_frames: int = 0
+        self.area: int = 0
+
+    def add(self, rect: pygame.Rect) -> None:
+        clipped: pygame.Rect = rect.clip(self.screen)
+        if clipped.w > 0 and clipped.h > 0:
+            self.rects.append(clipped)
+
+    def invalidate(self) -> None:
+        self.full_frame = True
+
+    def present(self) -> None:
+        self.frames += 1
+        if self.full_frame:
+            pygame.display.flip()
+            self.full_frames += 1
+            self.area += self.screen.w * self.screen.h
+        else:
+            rects: list[pygame.Rect] = merge_rects(self.rects)
+            if rects:
+                pygame.display.update(rects)
+            self.area += sum(rect.w * rect.h for rect in rects)
+
+        self.rects = []
+        self.full_frame = False
+
+    def stats(self) -> dict[str, float]:
+        frames: int = max(self.frames, 1)
+        return {
+            "frames": self.frames,
+            "full_frames": self.full_frames,
+            "average_area": self.area / frames,
+            "average_fraction": self.area / frames / (self.screen.w * self.screen.h)
+        }
@@ -3,8 +3,10 @@ import pygame
 from src.config import Config
 from src.event import DispatchChain
 from src.route_tracker import Conditions, Flags
+from src.text_engine import TextCanvas, TextEngine, TextPage
 from src.ui_manager import UIManager, Text, Button
-from src.asset_manager import AssetManager
+from src.asset_manager import AssetHandle, AssetManager, resolve
+from src.voice_manager import VoiceManager
 
 SPEAKER_IMAGE_MARGIN_LEFT = 15
 SPEAKER_IMAGE_MARGIN_TOP = 15
@@ -34,12 +36,17 @@ class MonologueOption:
 
 
 class Monologue:
+    CANVAS: TextCanvas | None = None
+    CANVAS_OWNER: "Monologue | None" = None
+
     def __init__(self,
                  conditions: Conditions, alt_monologue: str,
                  speaker: str, lines: list[MonologueLine], font: pygame.font.Font,
                  next_monologue: str | None, set_route: list[tuple[str, Conditions]],
                  dispatch: DispatchChain, modify_flags: list[tuple[str, str]], options: list[MonologueOption],
-                 speaker_image: pygame.Surface | None = None, speaking_sfx: pygame.mixer.Sound | None = None):
+                 speaker_image: pygame.Surface | AssetHandle | None = None,
+                 speaking_sfx: pygame.mixer.Sound | AssetHandle | None = None,
+                 defer: bool = False):
         self.conditions: Conditions = conditions
         self.alt_monologue: str = alt_monologue
 
@@ -54,11 +61,10 @@ class Monologue:
         self.options: list[MonologueOption] = options
         self.drawn_options: list[MonologueOption] = []
 
-        self.speaking_sfx: pygame.mixer.Sound | None = speaking_sfx
-        self.speaker_image: pygame.Surface | None = speaker_image
-        if self.speaker_image is not None:
-            size: int = Config.DIALOGUE_BOX_DIMS.y - SPEAKER_IMAGE_MARGIN_TOP * 2
-            self.speaker_image = pygame.transform.scale(self.speaker_image, pygame.Vector2(size, size))
+        self.speaking_sfx_asset: pygame.mixer.Sound | AssetHandle | None = speaking_sfx
+        self.speaking_sfx: pygame.mixer.Sound | None = None
+        self.speaker_image_asset: pygame.Surface | AssetHandle | None = speaker_image
+        self.speaker_image: pygame.Surface | None = None
 
         self.awaiting_choice: bool = False
         self.has_options: bool = len(self.options) > 0
@@ -75,8 +81,47 @@ class Monologue:
         self.choice_fade: int = 0
         self.choice_fading: int = 0
 
+        self.speaker_text: tuple[pygame.Surface, tuple[int, int]] | None = None
+        self.speaker_generation: int = -1
+        self.text_page: TextPage | None = None
+        self.layout_generation: int = -1
+
         self.is_reset = True
 
+        if not defer:
+            self.finalize()
+
+    def finalize(self) -> None:
+        if self.speaker_image is None and self.speaker_image_asset is not None:
+            size: int = int(Config.DIALOGUE_BOX_DIMS.y - SPEAKER_IMAGE_MARGIN_TOP * 2)
+            if isinstance(self.speaker_image_asset, AssetHandle):
+                self.speaker_image = self.speaker_image_asset.get((size, size))
+            else:
+                self.speaker_image = pygame.transform.scale(self.speaker_image_asset, (size, size))
+        if self.speaking_sfx is None:
+            self.speaking_sfx = resolve(self.speaking_sfx_asset)
+        if Config.DIALOGUE_PRELAYOUT and self.layout_generation != Config.DIALOGUE_LAYOUT_GENERATION:
+            self.prelayout()
+
+    def release(self) -> None:
+        if isinstance(self.speaker_image_asset, AssetHandle):
+            self.speaker_image = None
+        if isinstance(self.speaking_sfx_asset, AssetHandle):
+            self.speaking_sfx = None
+
+    def prelayout(self) -> None:
+        self.layout_generation = Config.DIALOGUE_LAYOUT_GENERATION
+        if self.font is None:
+            return
+
+        box_width: float = Config.DIALOGUE_BOX_DIMS.x
+        start_x: float = 0
+        if self.speaker_image is not None:
+            start_x += SPEAKER_IMAGE_MARGIN_LEFT + self.speaker_image.get_width()
+        width: int = int((box_width - box_width * SPOKEN_TEXT_END_RIGHT_PROPORTION) - (start_x + SPOKEN_TEXT_POS.x))
+
+        self.text_page = TextPage(TextEngine.get_atlas(self.font), "".join(line.text for line in self.lines), width)
+
     def get_set_route(self) -> str | None:
         for (route, conditions) in self.set_route:
             if conditions.satisfied():
@@ -120,6 +165,9 @@ class Monologue:
         self.choice_fade: int = 0
         self.choice_fading: int = 0
 
+        if Monologue.CANVAS_OWNER is self:
+            Monologue.CANVAS.clear()
+
         self.is_reset = True
 
     def advance(self) -> str | None:
@@ -155,26 +203,39 @@ class Monologue:
             self.char_index[0] += 1
             if self.speaking_sfx is not None:
                 if self.speaking_sfx.get_num_channels() == 0 and self.spoken[-1].isalpha():
-                    self.speaking_sfx.play()
+                    VoiceManager.play("dialogue", self.speaking_sfx)
 
         self.awaiting_choice = len(self.options) > 0 and self.line_finished() and self.last_rendered_line()
 
     def draw_text(self, surface: pygame.Surface, ui_manager: UIManager,
                   text_end: pygame.Vector2, start: pygame.Vector2, dims: pygame.Rect) -> None:
-
-        ui_manager.draw_text(Text(
-            self.speaker, [255, 255, 255, 255],
-            start + SPEAKER_TEXT_POS, AssetManager.get_font("snake46"),
-            dimensions=pygame.Vector2(text_end.x - (start.x + SPEAKER_TEXT_POS.x),
-                                      dims.height - SPEAKER_TEXT_POS.y)
-        ), surface)
-
-        ui_manager.draw_text(Text(
-            self.spoken, [255, 255, 255, 255],
-            start + SPOKEN_TEXT_POS, self.font,
-            dimensions=pygame.Vector2(text_end.x - (start.x + SPOKEN_TEXT_POS.x),
-                                      dims.height - SPOKEN_TEXT_POS.y)
-        ), surface)
+        speaker_pos: pygame.Vector2 = start + SPEAKER_TEXT_POS
+        if self.speaker_text is None or self.speaker_generation != Config.DIALOGUE_LAYOUT_GENERATION:
+            self.speaker_generation = Config.DIALOGUE_LAYOUT_GENERATION
+            self.speaker_text = TextEngine.render(self.speaker, AssetManager.get_font("snake46"), [255, 255, 255, 255],
+                                                  int(text_end.x - speaker_pos.x))
+        speaker_surface, offset = self.speaker_text
+        surface.blit(speaker_surface, speaker_pos + offset)
+
+        spoken_pos: pygame.Vector2 = start + SPOKEN_TEXT_POS
+        spoken_width: int = int(text_end.x - spoken_pos.x)
+        spoken_height: int = max(int(dims.height - SPOKEN_TEXT_POS.y), 1)
+        canvas: TextCanvas | None = Monologue.CANVAS
+        if canvas is None or canvas.width != spoken_width or canvas.surface.get_height() != spoken_height or \
+                canvas.atlas.font is not self.font:
+            canvas = Monologue.CANVAS = TextCanvas(self.font, [255, 255, 255, 255], spoken_width, spoken_height)
+            Monologue.CANVAS_OWNER = None
+        if Monologue.CANVAS_OWNER is not self:
+            canvas.clear()
+            Monologue.CANVAS_OWNER = self
+
+        if Config.DIALOGUE_PRELAYOUT and self.layout_generation != Config.DIALOGUE_LAYOUT_GENERATION:
+            self.prelayout()
+        text_page: TextPage | None = self.text_page
+        if not Config.DIALOGUE_PRELAYOUT or text_page is None or text_page.width != spoken_width:
+            text_page = None
+        canvas.update(self.spoken, text_page)
+        canvas.draw(surface, spoken_pos)
 
     def draw_options(self, surface: pygame.Surface, ui_manager: UIManager,
                      start: pygame.Vector2, dims: pygame.Rect) -> None:
@@ -223,6 +284,8 @@ class Monologue:
 
 
 class Dialogue:
+    DRAW_SURFACE: pygame.Surface | None = None
+
     def __init__(self, conditions: Conditions, start_monologues: list[tuple[str, Conditions]],
                  monologues: dict[str, Monologue], entity_id: str):
         self.conditions: Conditions = conditions
@@ -240,14 +303,18 @@ class Dialogue:
 
         self.advance_block: bool = True
 
-        self.draw_surface: pygame.Surface = pygame.Surface(Config.DIALOGUE_BOX_DIMS).convert()
-
         self.tri_coords: list[pygame.Vector2] = [
             pygame.Vector2(-1, -1),
             pygame.Vector2(0, 1),
             pygame.Vector2(1, -1)
         ]
 
+    @classmethod
+    def get_draw_surface(cls) -> pygame.Surface:
+        if cls.DRAW_SURFACE is None or cls.DRAW_SURFACE.get_size() != tuple(map(int, Config.DIALOGUE_BOX_DIMS)):
+            cls.DRAW_SURFACE = pygame.Surface(Config.DIALOGUE_BOX_DIMS).convert()
+        return cls.DRAW_SURFACE
+
     def start(self, scene, manager) -> bool:
         self.playing = True
         self.fading = FADE_SPEED
@@ -350,18 +417,23 @@ class Dialogue:
 
         self.choice_index = ui_manager.choice
 
+    def get_render_state(self, ui_manager: UIManager) -> tuple:
+        monologue: Monologue = self.monologues.get(self.current_monologue)
+        return (id(self), self.playing, self.fade, self.current_monologue, monologue.spoken,
+                monologue.line_index[0], monologue.choice_fade, monologue.awaiting_choice, ui_manager.choice)
+
     def draw_triangle(self, surface: pygame.Surface, dims: pygame.Rect):
         tri_pos = pygame.Vector2(dims.x, dims.y) + pygame.Vector2(dims.width - TRIANGLE_MARGIN_RIGHT,
                                                                   dims.height - TRIANGLE_MARGIN_BOTTOM)
 
         pygame.draw.polygon(surface, Config.DIALOGUE_TRIANGLE_COLOR, [c * 10 + tri_pos for c in self.tri_coords])
 
-    def draw_dialogue_box(self):
-        pygame.draw.rect(self.draw_surface, Config.DIALOGUE_BOX_OUTLINE_COLOR, (
+    def draw_dialogue_box(self, draw_surface: pygame.Surface):
+        pygame.draw.rect(draw_surface, Config.DIALOGUE_BOX_OUTLINE_COLOR, (
             0, 0, Config.DIALOGUE_BOX_DIMS.x, Config.DIALOGUE_BOX_DIMS.y
         ), width=Config.DIALOGUE_BOX_OUTLINE_THICKNESS)
 
-        pygame.draw.rect(self.draw_surface, Config.DIALOGUE_BOX_BACKGROUND_COLOR, (
+        pygame.draw.rect(draw_surface, Config.DIALOGUE_BOX_BACKGROUND_COLOR, (
             Config.DIALOGUE_BOX_OUTLINE_THICKNESS, Config.DIALOGUE_BOX_OUTLINE_THICKNESS,
             Config.DIALOGUE_BOX_DIMS.x - Config.DIALOGUE_BOX_OUTLINE_THICKNESS * 2,
             Config.DIALOGUE_BOX_DIMS.y
@@ -370,13 +442,13 @@ class Dialogue:
     def render(self, surface: pygame.Surface, dims: pygame.Rect, ui_manager: UIManager) -> None:
         if not self.playing and self.fade == 0: return
 
-        self.draw_dialogue_box()
-        self.monologues.get(self.current_monologue).render(self.draw_surface, dims, ui_manager)
+        draw_surface: pygame.Surface = Dialogue.get_draw_surface()
+        self.draw_dialogue_box(draw_surface)
+        self.monologues.get(self.current_monologue).render(draw_surface, dims, ui_manager)
 
-        if self.fade < 255:
-            self.draw_surface.set_alpha(self.fade)
+        draw_surface.set_alpha(min(self.fade, 255))
 
-        surface.blit(self.draw_surface, (dims.x, dims.y))
+        surface.blit(draw_surface, (dims.x, dims.y))
 
         if self.playing and self.monologues.get(self.current_monologue).line_finished() and \
                 not self.monologues.get(self.current_monologue).awaiting_choice:
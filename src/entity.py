@@ -2,9 +2,9 @@ import pygame
 
 from src.asset_manager import AssetManager
 from src.camera import Camera
+from src.collision_index import Blocked, CollisionIndex
 from src.config import Config
 from src.entity_route import EntityRoute
-from src.map_element import MapElement
 from src.route_tracker import Conditions
 from src.sprite import Sprite
 from src.sprite import dir_to_str
@@ -64,7 +64,7 @@ class Entity:
     def input(self, keys: pygame.key.ScancodeWrapper) -> None:
         pass
 
-    def update(self, entities: list, map_elements: list[MapElement], ui_manager: UIManager, dt: float) -> None:
+    def update(self, collision_index: CollisionIndex, ui_manager: UIManager, dt: float) -> None:
         if self.waypoint_wait_time != 0:
             self.waypoint_wait_time -= dt
             if self.waypoint_wait_time < 0:
@@ -94,28 +94,20 @@ class Entity:
         if self.moving:
             target_grid_pos: pygame.Vector2 = self.grid_pos + self.velocity
 
-            collision: bool = False
             rect: pygame.Rect = pygame.Rect(target_grid_pos, self.hit_box)
-            for entity in entities:
-                if entity.get_collision(rect):
-                    self.moving = False
-                    self.velocity = pygame.Vector2(0, 0)
-                    self.move_time = 0
-                    collision = True
-                    break
-
-            if not collision:
-                for map_element in map_elements:
-                    if map_element.get_collision(rect):
-                        if self.current_route is not None:
-                            self.grid_pos = \
-                                self.routes.get(self.current_route).waypoints[self.route_waypoint].pos.copy()
-                            self.pos = self.grid_pos * Config.TILE_SIZE
-                        self.moving = False
-                        self.velocity = pygame.Vector2(0, 0)
-                        self.move_time = 0
-                        collision = True
-                        break
+            blocked: Blocked = collision_index.is_blocked(rect)
+            collision: bool = blocked != Blocked.NONE
+
+            if blocked == Blocked.MAP:
+                if self.current_route is not None:
+                    self.grid_pos = \
+                        self.routes.get(self.current_route).waypoints[self.route_waypoint].pos.copy()
+                    self.pos = self.grid_pos * Config.TILE_SIZE
+                    collision_index.move(self)
+            if collision:
+                self.moving = False
+                self.velocity = pygame.Vector2(0, 0)
+                self.move_time = 0
 
             if not collision:
                 self.move_time += dt
@@ -131,6 +123,7 @@ class Entity:
                     self.grid_pos += self.velocity
                     self.velocity = pygame.Vector2(0, 0)
                     self.moving = False
+                    collision_index.move(self)
 
         if self.current_route is not None and self.moving:
             self.sprite.set(dir_to_str(self.facing, self.facing))
@@ -139,7 +132,16 @@ class Entity:
 
         self.sprite.update(dt)
 
-    def render(self, surface: pygame.Surface) -> None:
+    def get_render_rect(self) -> pygame.Rect:
         frame: pygame.Surface = self.sprite.get() or AssetManager.NULL_IMAGE
-        centered: pygame.Vector2 = self.pos - pygame.Vector2(frame.get_size()) / 2
-        surface.blit(frame, Camera.world_pos_to_view_pos(centered))
+        return pygame.Rect(self.pos - pygame.Vector2(frame.get_size()) / 2, frame.get_size())
+
+    def get_blit(self) -> tuple[pygame.Surface, pygame.Vector2, pygame.Rect]:
+        region: tuple[pygame.Surface, pygame.Rect] | None = self.sprite.get_region()
+        if region is None:
+            region = (AssetManager.NULL_IMAGE, AssetManager.NULL_IMAGE.get_rect())
+        centered: pygame.Vector2 = self.pos - pygame.Vector2(region[1].size) / 2
+        return region[0], Camera.world_pos_to_view_pos(centered), region[1]
+
+    def render(self, surface: pygame.Surface) -> None:
+        surface.blit(*self.get_blit())
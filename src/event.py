@@ -6,7 +6,7 @@ import sys
 
 import pygame
 
-from src.asset_manager import AssetManager
+from src.asset_manager import AssetHandle, AssetManager, resolve
 from src.camera import Camera
 from src.config import Config
 from src.entity_route import EntityRoute
@@ -14,6 +14,7 @@ from src.game_backends.backend import GameState
 from src.route_tracker import Conditions
 from src.scene_in_out import SceneExit, str_to_scene_transition
 from src.route_tracker import Flags
+from src.voice_manager import VoiceManager
 
 class SceneState(enum.Enum):
     ENTERING = 0,
@@ -28,6 +29,9 @@ class CatchEvent:
     def catch(self, scene) -> bool:
         pass
 
+    def signals(self) -> list[tuple] | None:
+        return None
+
 class DispatchEvent:
     def __init__(self):
         self.conditions: Conditions | None = None
@@ -45,6 +49,9 @@ class DispatchEvent:
     def update(self, scene, dt: float) -> None:
         pass
 
+    def signals(self) -> list[tuple] | None:
+        return []
+
 class DispatchChain:
     def __init__(self, dispatch: list[DispatchEvent]):
         self.dispatches: list[DispatchEvent] = dispatch
@@ -111,6 +118,36 @@ class DispatchChain:
             self.last_dispatch_index = self.dispatch_index
             self.dispatch_index += 1
 
+    def idle(self, scene) -> tuple[float | None, list[tuple]] | None:
+        if not self.active:
+            return None, []
+
+        last: DispatchEvent = self.dispatches[self.last_dispatch_index]
+        signals: list[tuple] | None = last.signals()
+        if signals is None:
+            return None
+        if self.dispatch_index >= len(self.dispatches):
+            return None if last.is_complete(scene) else (None, signals)
+
+        event: DispatchEvent = self.dispatches[self.dispatch_index]
+        if event.conditions is not None:
+            if not event.conditions.satisfied():
+                return None
+            signals = signals + [("flag", flag) for flag in event.conditions.flags()]
+
+        if event.wait_for_previous:
+            previous: DispatchEvent = self.dispatches[self.dispatch_index - 1]
+            if previous is not last:
+                if (previous_signals := previous.signals()) is None:
+                    return None
+                signals = signals + previous_signals
+            if not previous.is_complete(scene):
+                return None, signals
+
+        if event.org_wait > 0 and event.wait > 0:
+            return event.wait, signals
+        return None
+
 class OnPlayerEnter(CatchEvent):
     def __init__(self, rect: pygame.Rect):
         super().__init__()
@@ -119,6 +156,9 @@ class OnPlayerEnter(CatchEvent):
     def catch(self, scene) -> bool:
         return self.rect.collidepoint(scene.player.grid_pos)
 
+    def signals(self) -> list[tuple] | None:
+        return [("player",)]
+
 class OnEntityEnter(CatchEvent):
     def __init__(self, ids: list[str], rect: pygame.Rect):
         super().__init__()
@@ -132,6 +172,9 @@ class OnEntityEnter(CatchEvent):
                 return True
         return False
 
+    def signals(self) -> list[tuple] | None:
+        return [("entity", identifier) for identifier in self.ids]
+
 class OnSceneLoad(CatchEvent):
     def __init__(self):
         super().__init__()
@@ -139,6 +182,9 @@ class OnSceneLoad(CatchEvent):
     def catch(self, scene) -> bool:
         return True
 
+    def signals(self) -> list[tuple] | None:
+        return []
+
 class OnSceneStart(CatchEvent):
     def __init__(self):
         super().__init__()
@@ -146,6 +192,9 @@ class OnSceneStart(CatchEvent):
     def catch(self, scene) -> bool:
         return scene.state == SceneState.ENTERED
 
+    def signals(self) -> list[tuple] | None:
+        return [("state",)]
+
 class OnSceneExit(CatchEvent):
     def __init__(self):
         super().__init__()
@@ -153,6 +202,9 @@ class OnSceneExit(CatchEvent):
     def catch(self, scene) -> bool:
         return scene.state == SceneState.EXITED
 
+    def signals(self) -> list[tuple] | None:
+        return [("state",)]
+
 
 class ExitScene(DispatchEvent):
     def __init__(self, transition: str, transition_time: float, next_scene: str, entrance: str):
@@ -265,6 +317,9 @@ class BeginEntityDialogue(DispatchEvent):
     def is_complete(self, scene) -> bool:
         return scene.dialogue is None and self.dispatched
 
+    def signals(self) -> list[tuple] | None:
+        return [("dialogue",)]
+
     def dispatch(self, scene, manager) -> None:
         self.dispatched = True
         dialogue = scene.entities_dict.get(self.entity_id).interact(scene.player, self.dialogue_id)
@@ -284,6 +339,9 @@ class BeginIndependentDialogue(DispatchEvent):
     def is_complete(self, scene) -> bool:
         return scene.dialogue is None and self.dispatched
 
+    def signals(self) -> list[tuple] | None:
+        return [("dialogue",)]
+
     def dispatch(self, scene, manager) -> None:
         self.dispatched = True
         scene.dialogue = self.dialogue
@@ -324,6 +382,9 @@ class MoveCameraPosition(DispatchEvent):
     def is_complete(self, scene) -> bool:
         return self.fraction == 1.0 and self.dispatched
 
+    def signals(self) -> list[tuple] | None:
+        return None
+
     def dispatch(self, scene, manager) -> None:
         Camera.TRACK = None
         self.start_pos = Camera.POS.copy()
@@ -357,6 +418,9 @@ class MoveCameraEntity(DispatchEvent):
     def is_complete(self, scene) -> bool:
         return Camera.POS == self.target_pos and self.dispatched
 
+    def signals(self) -> list[tuple] | None:
+        return None
+
     def dispatch(self, scene, manager) -> None:
         Camera.TRACK = None
         self.target_pos = scene.entities_dict.get(self.entity_id).pos - Camera.WINDOW_CENTER
@@ -393,6 +457,9 @@ class MovePlayer(DispatchEvent):
     def is_complete(self, scene) -> bool:
         return scene.player.current_route is None
 
+    def signals(self) -> list[tuple] | None:
+        return None
+
     def dispatch(self, scene, manager) -> None:
         scene.player.controls_disabled = True
         scene.player.routes["ROUTE"] = self.route
@@ -435,22 +502,29 @@ class EndCameraShake(DispatchEvent):
         self.dispatched = True
 
 class PlayAudio(DispatchEvent):
-    def __init__(self, audio_id: str, volume: float):
+    def __init__(self, audio_id: str, volume: float, priority: int = 0, audio: AssetHandle | None = None):
         super().__init__()
         self.audio_id: str = audio_id
         self.volume: float = volume
-
+        self.priority: int = priority
+        self.audio: AssetHandle | None = audio
         self.sound: pygame.mixer.Sound | None = None
 
+    def finalize(self) -> None:
+        if self.sound is None:
+            self.sound = resolve(self.audio)
+
+    def release(self) -> None:
+        self.sound = None
+
     def is_complete(self, scene) -> bool:
         return self.dispatched
 
     def dispatch(self, scene, manager) -> None:
-        self.sound = AssetManager.get_audio(self.audio_id)
-        self.sound = pygame.mixer.Sound(self.sound)
-        if self.sound is not None:
-            self.sound.set_volume(self.volume)
-            self.sound.play()
+        sound: pygame.mixer.Sound | None = self.sound if self.sound is not None else \
+            AssetManager.get_audio(self.audio_id)
+        if sound is not None:
+            VoiceManager.play("cutscene", sound, self.priority, self.volume)
         self.dispatched = True
 
 class LaunchScript(DispatchEvent):
@@ -0,0 +1,20 @@
+from src.route_tracker import Conditions
+
+class FlagIndex:
+    def __init__(self):
+        self.dependents: dict[str, list] = {}
+
+    def add(self, conditions: Conditions | None, owner) -> None:
+        if conditions is None:
+            return
+        for flag in dict.fromkeys(conditions.flags()):
+            owners: list = self.dependents.setdefault(flag, [])
+            if not any(dependent is owner for dependent in owners):
+                owners.append(owner)
+
+    def affected(self, flags: set[str]) -> list:
+        owners: dict[int, object] = {}
+        for flag in flags:
+            for owner in self.dependents.get(flag, []):
+                owners[id(owner)] = owner
+        return list(owners.values())
@@ -11,7 +11,9 @@ from src.game_backends.paused import PausedBackend
 from src.game_backends.playing import PlayingBackend
 from src.game_backends.running_scene import EscapeGameBackend
 from src.scene_manager import SceneManager
+from src.text_engine import TextEngine
 from src.ui_manager import UIManager
+from src.voice_manager import VoiceManager
 
 class Game:
     def __init__(self, asset_guide: str, scene_guide: str, config_path: str,
@@ -27,6 +29,8 @@ class Game:
 
         self.asset_manager: AssetManager = AssetManager(asset_guide)
         AssetManager.NULL_IMAGE = AssetManager.get_image("null")
+        TextEngine.init(AssetManager.FONT_ASSETS)
+        VoiceManager.reserve()
         self.scene_manager: SceneManager = SceneManager(scene_guide, self)
         self.ui_manager: UIManager = UIManager(self.window_surface)
         
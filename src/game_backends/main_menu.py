@@ -4,6 +4,7 @@ import math
 
 from src.asset_manager import AssetManager
 from src.game_backends.backend import Backend, GameState
+from src.menu_layer import MenuLayer
 from src.ui_manager import Text, Button
 
 from src.config import Config
@@ -24,6 +25,8 @@ class MainMenuBackend(Backend):
         self.bottom_pos: pygame.Vector2 = pygame.Vector2(0, 0)
         self.top_pos: pygame.Vector2 = pygame.Vector2(0, 0)
 
+        self.layer: MenuLayer | None = None
+
     def init(self, game) -> None:
         self.next_backend = None
         self.fade = 255
@@ -45,6 +48,7 @@ class MainMenuBackend(Backend):
 
     def switch_menu(self, game, new_menu: Menu) -> None:
         self.state = new_menu
+        self.layer = None
 
         match new_menu:
             case Menu.MAIN:
@@ -64,6 +68,9 @@ class MainMenuBackend(Backend):
             if event.type == pygame.QUIT:
                 game.running = False
 
+            if event.type == pygame.WINDOWEXPOSED and self.layer is not None:
+                self.layer.invalidate()
+
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
                     match self.state:
@@ -98,11 +105,13 @@ class MainMenuBackend(Backend):
                         Config.MUSIC_VOLUME -= 0.05
                     elif game.ui_manager.choice == 1:
                         Config.VOICE_VOLUME -= 0.05
+                    self.layer = None
                 if event.key == pygame.K_RIGHT and self.state == Menu.OPTIONS:
                     if game.ui_manager.choice == 0:
                         Config.MUSIC_VOLUME += 0.05
                     elif game.ui_manager.choice == 1:
                         Config.VOICE_VOLUME += 0.05
+                    self.layer = None
                 Config.MUSIC_VOLUME = pygame.math.clamp(Config.MUSIC_VOLUME, 0, 1)
                 Config.VOICE_VOLUME = pygame.math.clamp(Config.VOICE_VOLUME, 0, 1)
 
@@ -118,153 +127,157 @@ class MainMenuBackend(Backend):
                 return
             game.set_backend(self.next_backend)
 
-    def render_main_menu(self, game) -> None:
-        game.ui_manager.draw_text(Text(
+    def build_main_menu(self, game, layer: MenuLayer) -> None:
+        layer.add_text(Text(
             "Homegoing", [170, 20, 20, 255],
             self.center_pos + pygame.Vector2(0, -230), AssetManager.get_font("snake192"),
             align_center=True
         ))
 
         play_text: str = "Continue" if game.state_backends[GameState.PLAYING].is_setup else "Play"
-        game.ui_manager.draw_button(Button(Text(
+        layer.add_button(Button(Text(
             play_text, [255, 255, 255, 255],
             self.center_pos + pygame.Vector2(0, -50), AssetManager.get_font("snake64"),
             align_center=True
-        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]), 0)
+        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]))
 
-        game.ui_manager.draw_button(Button(Text(
+        layer.add_button(Button(Text(
             "How to Play", [255, 255, 255, 255],
             self.center_pos + pygame.Vector2(0, 30), AssetManager.get_font("snake64"),
             align_center=True
-        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]), 1)
+        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]))
 
-        game.ui_manager.draw_button(Button(Text(
+        layer.add_button(Button(Text(
             "Options", [255, 255, 255, 255],
             self.center_pos + pygame.Vector2(0, 110), AssetManager.get_font("snake64"),
             align_center=True
-        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]), 2)
+        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]))
 
-        game.ui_manager.draw_button(Button(Text(
+        layer.add_button(Button(Text(
             "Credits", [255, 255, 255, 255],
             self.center_pos + pygame.Vector2(0, 190), AssetManager.get_font("snake64"),
             align_center=True
-        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]), 3)
+        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]))
 
-        game.ui_manager.draw_button(Button(Text(
+        layer.add_button(Button(Text(
             "Exit", [255, 255, 255, 255],
             self.center_pos + pygame.Vector2(0, 270), AssetManager.get_font("snake64"),
             align_center=True
-        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]), 4)
+        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]))
 
-    def render_how_to_play(self, game) -> None:
-        game.ui_manager.draw_text(Text(
+    def build_how_to_play(self, game, layer: MenuLayer) -> None:
+        layer.add_text(Text(
             "How to Play", [170, 20, 20, 255],
             self.center_pos + pygame.Vector2(0, -200), AssetManager.get_font("snake64"),
             align_center=True
         ))
 
-        game.ui_manager.draw_text(Text(
+        layer.add_text(Text(
             "Walk around and talk with WASD or the arrow keys", [255, 255, 255, 255],
             self.center_pos + pygame.Vector2(0, -60), AssetManager.get_font("snake46"),
             align_center=True
         ))
 
-        game.ui_manager.draw_text(Text(
+        layer.add_text(Text(
             "Interact with the environment with ENTER or SPACE", [255, 255, 255, 255],
             self.center_pos + pygame.Vector2(0, 0), AssetManager.get_font("snake46"),
             align_center=True
         ))
 
-        game.ui_manager.draw_text(Text(
+        layer.add_text(Text(
             "Talk to characters and complete objectives", [255, 255, 255, 255],
             self.center_pos + pygame.Vector2(0, 60), AssetManager.get_font("snake46"),
             align_center=True
         ))
 
-        game.ui_manager.draw_button(Button(Text(
+        layer.add_button(Button(Text(
             "Understood", [255, 255, 255, 255],
             self.center_pos + pygame.Vector2(0, 180), AssetManager.get_font("snake64"),
             align_center=True
-        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]), 0)
+        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]))
 
-    def render_options(self, game):
-        game.ui_manager.draw_text(Text(
+    def build_options(self, game, layer: MenuLayer) -> None:
+        layer.add_text(Text(
             "Use Left/Right arrows to modify values", [255, 255, 255, 255],
             self.center_pos + pygame.Vector2(0, -150), AssetManager.get_font("snake32"),
             align_center=True
         ))
 
-        game.ui_manager.draw_button(Button(Text(
+        layer.add_button(Button(Text(
             "Music Volume   < " + str(round(Config.MUSIC_VOLUME * 100.0)) + "% >", [255, 255, 255, 255],
             self.center_pos + pygame.Vector2(0, -40), AssetManager.get_font("snake64"),
             align_center=True
-        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake32"), [150, 0, 150, 255]), 0)
+        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake32"), [150, 0, 150, 255]))
 
-        game.ui_manager.draw_button(Button(Text(
+        layer.add_button(Button(Text(
             "Voice Volume   < " + str(round(Config.VOICE_VOLUME * 100.0)) + "% >", [255, 255, 255, 255],
             self.center_pos + pygame.Vector2(0, 50), AssetManager.get_font("snake64"),
             align_center=True
-        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake32"), [150, 0, 150, 255]), 1)
+        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake32"), [150, 0, 150, 255]))
 
-        game.ui_manager.draw_button(Button(Text(
+        layer.add_button(Button(Text(
             "Done", [255, 255, 255, 255],
             self.center_pos + pygame.Vector2(0, 180), AssetManager.get_font("snake64"),
             align_center=True
-        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]), 2)
+        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]))
 
-    def render_credit(self, game, name: str, role: str, y: int):
-        game.ui_manager.draw_text(Text(
+    def build_credit(self, layer: MenuLayer, name: str, role: str, y: int) -> None:
+        layer.add_text(Text(
             name, [255, 255, 255, 255],
             self.center_pos + pygame.Vector2(-200, y), AssetManager.get_font("snake46"),
             align_left=True
         ))
 
-        game.ui_manager.draw_text(Text(
+        layer.add_text(Text(
             role, [255, 255, 255, 255],
             self.center_pos + pygame.Vector2(200, y), AssetManager.get_font("snake46"),
             align_right=True
         ))
 
-    def render_credits(self, game) -> None:
-        game.ui_manager.draw_text(Text(
+    def build_credits(self, game, layer: MenuLayer) -> None:
+        layer.add_text(Text(
             "Credits", [170, 20, 20, 255],
             self.center_pos + pygame.Vector2(0, -250), AssetManager.get_font("snake64"),
             align_center=True
         ))
 
-        game.ui_manager.draw_text(Text(
+        layer.add_text(Text(
             "Based on the novel by Yaa Gyasi", [255, 255, 255, 255],
             self.center_pos + pygame.Vector2(0, -175), AssetManager.get_font("snake40"),
             align_center=True
         ))
 
-        self.render_credit(game, "Mihir", "Programmer", -110)
-        self.render_credit(game, "Theodor", "Programmer", -50)
-        self.render_credit(game, "Abdulrahman", "Artist", 10)
-        self.render_credit(game, "Yazan", "Artist", 70)
-        self.render_credit(game, "Jonas", "Writer", 130)
+        self.build_credit(layer, "Mihir", "Programmer", -110)
+        self.build_credit(layer, "Theodor", "Programmer", -50)
+        self.build_credit(layer, "Abdulrahman", "Artist", 10)
+        self.build_credit(layer, "Yazan", "Artist", 70)
+        self.build_credit(layer, "Jonas", "Writer", 130)
 
-        game.ui_manager.draw_button(Button(Text(
+        layer.add_button(Button(Text(
             "Back", [255, 255, 255, 255],
             self.center_pos + pygame.Vector2(0, 250), AssetManager.get_font("snake64"),
             align_center=True
-        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]), 0)
+        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]))
 
-    def render(self, game) -> None:
-        game.window_surface.fill((0, 0, 0))
+    def build_layer(self, game) -> MenuLayer:
+        layer: MenuLayer = MenuLayer()
 
         match self.state:
             case Menu.MAIN:
-                self.render_main_menu(game)
+                self.build_main_menu(game, layer)
             case Menu.HOW_TO_PLAY:
-                self.render_how_to_play(game)
+                self.build_how_to_play(game, layer)
             case Menu.OPTIONS:
-                self.render_options(game)
+                self.build_options(game, layer)
             case Menu.CREDITS:
-                self.render_credits(game)
+                self.build_credits(game, layer)
 
-        if self.fade > 0:
-            self.overlay.set_alpha(self.fade)
-            game.window_surface.blit(self.overlay, (0, 0))
+        return layer
+
+    def render(self, game) -> None:
+        if self.layer is None:
+            self.layer = self.build_layer(game)
 
-        pygame.display.flip()
\ No newline at end of file
+        dirty: list[pygame.Rect] = self.layer.render(game.window_surface, game.ui_manager, self.overlay, self.fade)
+        if dirty:
+            pygame.display.update(dirty)
\ No newline at end of file
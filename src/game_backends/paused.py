@@ -2,6 +2,7 @@ import pygame
 
 from src.asset_manager import AssetManager
 from src.game_backends.backend import Backend, GameState
+from src.menu_layer import MenuLayer
 from src.ui_manager import Text, Button
 
 class PausedBackend(Backend):
@@ -12,6 +13,8 @@ class PausedBackend(Backend):
         self.bottom_pos: pygame.Vector2 = pygame.Vector2(0, 0)
         self.top_pos: pygame.Vector2 = pygame.Vector2(0, 0)
 
+        self.layer: MenuLayer | None = None
+
     def init(self, game) -> None:
         self.next_backend = None
         self.fade = 255
@@ -24,6 +27,7 @@ class PausedBackend(Backend):
         self.top_pos = game.window_surface.get_rect().midtop 
 
         game.ui_manager.set_num_buttons(3)
+        self.layer = self.build_layer()
 
     def unload(self, game) -> None:
         game.ui_manager.set_num_buttons(0)
@@ -33,6 +37,9 @@ class PausedBackend(Backend):
             if event.type == pygame.QUIT:
                 game.running = False
 
+            if event.type == pygame.WINDOWEXPOSED:
+                self.layer.invalidate()
+
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
                     match game.ui_manager.choice:
@@ -59,29 +66,30 @@ class PausedBackend(Backend):
                 return
             game.set_backend(self.next_backend)
 
-    def render(self, game) -> None:
-        game.window_surface.fill((0, 0, 0))
+    def build_layer(self) -> MenuLayer:
+        layer: MenuLayer = MenuLayer()
 
-        game.ui_manager.draw_button(Button(Text(
+        layer.add_button(Button(Text(
             "Continue", [255, 255, 255, 255],
             self.center_pos + pygame.Vector2(0, -70), AssetManager.get_font("snake64"),
             align_center=True
-        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]), 0)
+        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]))
 
-        game.ui_manager.draw_button(Button(Text(
+        layer.add_button(Button(Text(
             "Main Menu", [255, 255, 255, 255],
             self.center_pos, AssetManager.get_font("snake64"),
             align_center=True
-        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]), 1)
+        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]))
 
-        game.ui_manager.draw_button(Button(Text(
+        layer.add_button(Button(Text(
             "Exit to Desktop", [255, 255, 255, 255],
             self.center_pos + pygame.Vector2(0, 70), AssetManager.get_font("snake64"),
             align_center=True
-        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]), 2)
+        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]))
 
-        if self.fade > 0:
-            self.overlay.set_alpha(self.fade)
-            game.window_surface.blit(self.overlay, (0, 0))
+        return layer
 
-        pygame.display.flip()
+    def render(self, game) -> None:
+        dirty: list[pygame.Rect] = self.layer.render(game.window_surface, game.ui_manager, self.overlay, self.fade)
+        if dirty:
+            pygame.display.update(dirty)
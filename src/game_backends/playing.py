@@ -1,11 +1,15 @@
 import pygame
 
+from src.config import Config
+from src.damage_tracker import DamageTracker
 from src.game_backends.backend import Backend, GameState
 
 class PlayingBackend(Backend):
     def __init__(self):
         super().__init__()
         self.is_setup: bool = False
+        self.damage: DamageTracker = DamageTracker(pygame.display.get_window_size())
+        self.damage_fade: int = -1
 
     def init(self, game) -> None:
         if not self.is_setup:
@@ -19,9 +23,10 @@ class PlayingBackend(Backend):
         self.fading = 500
 
         self.overlay.fill((0, 0, 0))
+        self.damage.invalidate()
 
     def unload(self, game) -> None:
-        game.scene_manager.scenes[game.scene_manager.current_scene].unload(False)
+        game.scene_manager.scenes[game.scene_manager.current_scene].unload(False, False)
 
     def input(self, game) -> None:
         for event in pygame.event.get():
@@ -29,6 +34,9 @@ class PlayingBackend(Backend):
                 game.running = False
                 return
 
+            if event.type == pygame.WINDOWEXPOSED:
+                self.damage.invalidate()
+
             if self.fading != 0 and self.fade != 0 and self.fade != 255:
                 continue
 
@@ -57,4 +65,12 @@ class PlayingBackend(Backend):
             self.overlay.set_alpha(self.fade)
             game.window_surface.blit(self.overlay, (0, 0))
 
-        pygame.display.flip()
\ No newline at end of file
+        if not Config.DIRTY_RECT_RENDERING:
+            pygame.display.flip()
+            return
+
+        game.scene_manager.report_damage(self.damage, game.ui_manager)
+        if self.fade != self.damage_fade:
+            self.damage.invalidate()
+        self.damage_fade = self.fade
+        self.damage.present()
\ No newline at end of file
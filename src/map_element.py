@@ -1,29 +1,60 @@
 import pygame
 
+from src.asset_manager import AssetHandle, AssetManager, resolve
 from src.camera import Camera
 from src.config import Config
+from src.pixel_cache import PixelCache
 
 class MapElement:
-    def __init__(self, rect: pygame.Rect, image: pygame.Surface | None, collision: bool):
+    def __init__(self, rect: pygame.Rect, image: pygame.Surface | AssetHandle | None, collision: bool,
+                 defer: bool = False):
         self.rect: pygame.Rect = rect
         self.collision: bool = collision
 
+        self.image: pygame.Surface | AssetHandle | None = image
         self.render_surface: pygame.Surface | None = None
-        self.image_dims: pygame.Vector2 = pygame.Vector2(0, 0) if image is None else pygame.Vector2(image.get_size())
+        self.image_dims: pygame.Vector2 = pygame.Vector2(0, 0)
+        if isinstance(image, pygame.Surface):
+            self.image_dims = pygame.Vector2(image.get_size())
 
-        if image is not None:
-            dims: pygame.Vector2 = pygame.Vector2(image.get_size()) / Config.TILE_SIZE
-            self._generate_render_surface(image, pygame.Vector2(dims.x * self.rect.w, dims.y * self.rect.h))
+        if not defer:
+            self.finalize()
+
+    def finalize(self) -> None:
+        if self.render_surface is not None or (image := resolve(self.image)) is None:
+            return
+        self.image_dims = pygame.Vector2(image.get_size())
+        dims: pygame.Vector2 = self.image_dims / Config.TILE_SIZE
+        dims = pygame.Vector2(dims.x * self.rect.w, dims.y * self.rect.h)
+
+        key: str | None = None
+        if Config.PIXEL_CACHE and isinstance(self.image, AssetHandle) and \
+                (digest := AssetManager.IMAGE_DIGESTS.get(self.image.name, None)) is not None:
+            key = PixelCache.key("map_element", digest, tuple(self.image_dims), tuple(dims))
+            if (cached := PixelCache.load(key, False)) is not None:
+                self.render_surface = cached
+                return
+
+        self._generate_render_surface(image, dims)
+        if key is not None:
+            PixelCache.store(key, self.render_surface, False)
+
+    def release(self) -> None:
+        if isinstance(self.image, AssetHandle):
+            self.render_surface = None
 
     def get_collision(self, rect: pygame.Rect) -> bool:
         return self.collision and rect.colliderect(self.rect)
 
+    def get_world_pos(self) -> pygame.Vector2:
+        centered: pygame.Vector2 = pygame.Vector2(self.rect.topleft) * Config.TILE_SIZE - self.image_dims / 2
+        centered.y -= self.image_dims.y - Config.TILE_SIZE
+        return centered
+
     def render(self, surface: pygame.Surface) -> None:
         if self.render_surface is None:
             return
-        centered: pygame.Vector2 = pygame.Vector2(self.rect.topleft) * Config.TILE_SIZE - self.image_dims / 2
-        centered.y -= self.image_dims.y - Config.TILE_SIZE
-        surface.blit(self.render_surface, Camera.world_pos_to_view_pos(centered))
+        surface.blit(self.render_surface, Camera.world_pos_to_view_pos(self.get_world_pos()))
 
     def _generate_render_surface(self, image: pygame.Surface, dims: pygame.Vector2) -> None:
         self.render_surface = pygame.Surface((dims.x * Config.TILE_SIZE, dims.y * Config.TILE_SIZE)).convert()
@@ -0,0 +1,99 @@
+import math
+import pygame
+
+from src.camera import Camera
+from src.config import Config
+from src.map_element import MapElement
+
+CHUNK_SIZE: int = 512
+
+class MapLayer:
+    def __init__(self, map_elements: list[MapElement], chunk_size: int = CHUNK_SIZE):
+        self.map_elements: list[MapElement] = map_elements
+        self.chunk_size: int = chunk_size
+
+        self.chunks: dict[tuple[int, int], tuple[pygame.Surface, tuple[int, int]]] = {}
+        self.dirty: set[tuple[int, int]] = set()
+        self.baked: bool = False
+
+    def get_element_rect(self, map_element: MapElement) -> pygame.Rect | None:
+        if map_element.render_surface is None:
+            return None
+        pos: pygame.Vector2 = map_element.get_world_pos()
+        return pygame.Rect((math.floor(pos.x), math.floor(pos.y)), map_element.render_surface.get_size())
+
+    def _chunks_of(self, rect: pygame.Rect) -> list[tuple[int, int]]:
+        return [(x, y)
+                for x in range(rect.left // self.chunk_size, (rect.right - 1) // self.chunk_size + 1)
+                for y in range(rect.top // self.chunk_size, (rect.bottom - 1) // self.chunk_size + 1)]
+
+    def bake(self) -> None:
+        for job in self.bake_jobs():
+            job()
+
+    def bake_jobs(self) -> list:
+        self.chunks.clear()
+        self.dirty.clear()
+        for map_element in self.map_elements:
+            if (rect := self.get_element_rect(map_element)) is not None:
+                self.dirty.update(self._chunks_of(rect))
+
+        def finish() -> None:
+            self._rebake()
+            self.baked = True
+
+        return [lambda key=key: self._rebake({key}) for key in sorted(self.dirty)] + [finish]
+
+    def release(self) -> None:
+        self.chunks.clear()
+        self.dirty.clear()
+        self.baked = False
+
+    def _rebake(self, keys: set[tuple[int, int]] | None = None) -> None:
+        keys = self.dirty if keys is None else keys & self.dirty
+        members: dict[tuple[int, int], list] = {key: [] for key in keys}
+        for map_element in self.map_elements:
+            if (rect := self.get_element_rect(map_element)) is None:
+                continue
+            for key in self._chunks_of(rect):
+                if key in members:
+                    members[key].append((map_element.render_surface, rect))
+
+        for (x, y), elements in members.items():
+            if not elements:
+                self.chunks.pop((x, y), None)
+                continue
+
+            chunk: pygame.Surface = pygame.Surface((self.chunk_size, self.chunk_size), pygame.SRCALPHA)
+            chunk.fill((0, 0, 0, 0))
+            chunk.blits([(surface, (rect.x - x * self.chunk_size, rect.y - y * self.chunk_size))
+                         for surface, rect in elements], False)
+
+            bounds: pygame.Rect = chunk.get_bounding_rect()
+            chunk = chunk.subsurface(bounds)
+            if pygame.mask.from_surface(chunk).count() == bounds.w * bounds.h:
+                self.chunks[(x, y)] = (chunk.convert(), bounds.topleft)
+            else:
+                self.chunks[(x, y)] = (chunk.convert_alpha(), bounds.topleft)
+        self.dirty.difference_update(members)
+
+    def render(self, surface: pygame.Surface) -> int:
+        if not self.baked:
+            self.bake()
+        elif self.dirty:
+            self._rebake()
+
+        view: pygame.Vector2 = Camera.world_pos_to_view_pos(pygame.Vector2(0, 0))
+        left: int = math.floor(-view.x) // self.chunk_size
+        top: int = math.floor(-view.y) // self.chunk_size
+        right: int = math.floor(-view.x + Config.WINDOW_DIMS.x - 1) // self.chunk_size
+        bottom: int = math.floor(-view.y + Config.WINDOW_DIMS.y - 1) // self.chunk_size
+
+        blits: list = []
+        for y in range(top, bottom + 1):
+            for x in range(left, right + 1):
+                if (chunk := self.chunks.get((x, y), None)) is not None:
+                    blits.append((chunk[0], (math.floor(view.x) + x * self.chunk_size + chunk[1][0],
+                                             math.floor(view.y) + y * self.chunk_size + chunk[1][1])))
+        surface.blits(blits, False)
+        return len(blits)
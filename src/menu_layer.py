@@ -0,0 +1,73 @@
+import pygame
+
+from src.ui_manager import UIManager, Text, Button
+
+class MenuLayer:
+    def __init__(self, background: tuple[int, int, int] = (0, 0, 0)):
+        self.background: tuple[int, int, int] = background
+        self.texts: list[Text] = []
+        self.buttons: list[Button] = []
+
+        self.surface: pygame.Surface | None = None
+        self.redraw_all: bool = True
+        self.selection_rect: pygame.Rect | None = None
+        self.drawn_choice: int = -1
+        self.drawn_fade: int = 0
+
+    def add_text(self, text: Text) -> None:
+        self.texts.append(text)
+        self.surface = None
+
+    def add_button(self, button: Button) -> None:
+        self.buttons.append(button)
+        self.surface = None
+
+    def invalidate(self) -> None:
+        self.redraw_all = True
+
+    def _compose(self, size: tuple[int, int], ui_manager: UIManager) -> None:
+        self.surface = pygame.Surface(size).convert()
+        self.surface.fill(self.background)
+        for text in self.texts:
+            ui_manager.draw_text(text, self.surface)
+        for button in self.buttons:
+            ui_manager.draw_text(button.text, self.surface)
+        self.redraw_all = True
+
+    def _draw_selection(self, window_surface: pygame.Surface, ui_manager: UIManager) -> pygame.Rect | None:
+        self.drawn_choice = ui_manager.choice
+        if not 0 <= ui_manager.choice < len(self.buttons):
+            return None
+        return ui_manager.draw_selection(self.buttons[ui_manager.choice], window_surface)
+
+    def render(self, window_surface: pygame.Surface, ui_manager: UIManager,
+               overlay: pygame.Surface, fade: int) -> list[pygame.Rect]:
+        if self.surface is None or self.surface.get_size() != window_surface.get_size():
+            self._compose(window_surface.get_size(), ui_manager)
+
+        if fade != self.drawn_fade or (fade > 0 and ui_manager.choice != self.drawn_choice):
+            self.redraw_all = True
+
+        if self.redraw_all:
+            window_surface.blit(self.surface, (0, 0))
+            self.selection_rect = self._draw_selection(window_surface, ui_manager)
+            if fade > 0:
+                overlay.set_alpha(fade)
+                window_surface.blit(overlay, (0, 0))
+
+            self.drawn_fade = fade
+            self.redraw_all = False
+            return [window_surface.get_rect()]
+
+        if ui_manager.choice == self.drawn_choice:
+            return []
+
+        dirty: list[pygame.Rect] = []
+        if self.selection_rect is not None:
+            window_surface.blit(self.surface, self.selection_rect, self.selection_rect)
+            dirty.append(self.selection_rect)
+
+        self.selection_rect = self._draw_selection(window_surface, ui_manager)
+        if self.selection_rect is not None:
+            dirty.append(self.selection_rect)
+        return dirty
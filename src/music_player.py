@@ -0,0 +1,170 @@
+import time
+import wave
+
+import pygame
+
+from src.voice_manager import VoiceManager
+
+MUSIC_CHUNK_MS: int = 1000
+
+class MusicTrack:
+    def __init__(self, identifier: str, path: str, volume: float):
+        self.identifier: str = identifier
+        self.path: str = path
+        self.volume: float = volume
+
+    def get_volume(self) -> float:
+        return self.volume
+
+    def set_volume(self, volume: float) -> None:
+        self.volume = volume
+        MusicPlayer.set_volume(self, volume)
+
+    def play(self, loops: int = 0, fade_ms: int = 0) -> None:
+        MusicPlayer.play(self, loops, fade_ms)
+
+    def fadeout(self, fade_ms: int) -> None:
+        MusicPlayer.fadeout(self, fade_ms)
+
+    def same_track(self, other) -> bool:
+        return isinstance(other, MusicTrack) and other.path == self.path
+
+class ChunkedSource:
+    def __init__(self, file: wave.Wave_read, loops: int):
+        self.file: wave.Wave_read = file
+        self.loops: int = loops
+        self.frames: int = file.getframerate() * MUSIC_CHUNK_MS // 1000
+
+    @classmethod
+    def open(cls, path: str, loops: int):
+        if pygame.mixer.get_init() is None:
+            return None
+        frequency, size, channels = pygame.mixer.get_init()
+        try:
+            file: wave.Wave_read = wave.open(path, "rb")
+        except (OSError, EOFError, wave.Error):
+            return None
+        if file.getframerate() != frequency or file.getnchannels() != channels or file.getsampwidth() * 8 != abs(size):
+            file.close()
+            return None
+        return cls(file, loops)
+
+    def read(self) -> pygame.mixer.Sound | None:
+        data: bytes = self.file.readframes(self.frames)
+        if not data and self.loops != 0:
+            self.loops -= 1 if self.loops > 0 else 0
+            self.file.rewind()
+            data = self.file.readframes(self.frames)
+        return pygame.mixer.Sound(buffer=data) if data else None
+
+    def close(self) -> None:
+        self.file.close()
+
+class MusicPlayer:
+    STREAMED: MusicTrack | None = None
+    FADING: MusicTrack | None = None
+    PENDING: tuple[MusicTrack, int, int] | None = None
+
+    CHANNELED: MusicTrack | None = None
+    SOURCE: ChunkedSource | None = None
+    VOLUME: float = 0
+    RAMP: tuple[float, float, float, float] = (0, 0, 1, 1) # start, duration ( s ), from level, to level
+
+    @classmethod
+    def channel(cls) -> pygame.mixer.Channel | None:
+        VoiceManager.reserve()
+        channels: list[pygame.mixer.Channel] = VoiceManager.CHANNELS.get("music", [])
+        return channels[0] if channels else None
+
+    @classmethod
+    def play(cls, track: MusicTrack, loops: int, fade_ms: int) -> None:
+        cls.PENDING = None
+        if cls.STREAMED is not None and cls.STREAMED.same_track(track):
+            cls.STREAMED = track
+            pygame.mixer.music.set_volume(track.volume)
+        elif cls.CHANNELED is not None and cls.CHANNELED.same_track(track):
+            cls.CHANNELED = track
+            cls.VOLUME = track.volume
+            cls.RAMP = (time.perf_counter(), fade_ms / 1000, cls.level(), 1)
+        elif cls.FADING is not None and cls.FADING.same_track(track) or not pygame.mixer.music.get_busy():
+            cls.stream(track, loops, fade_ms)
+        elif cls.CHANNELED is not None or not cls.crossfade(track, loops, fade_ms):
+            # Formats that cannot be read in chunks wait for the stream instead of being decoded whole
+            cls.PENDING = (track, loops, fade_ms)
+
+    @classmethod
+    def stream(cls, track: MusicTrack, loops: int, fade_ms: int) -> None:
+        cls.FADING = None
+        try:
+            pygame.mixer.music.load(track.path)
+        except pygame.error:
+            cls.STREAMED = None
+            return
+        pygame.mixer.music.set_volume(track.volume)
+        pygame.mixer.music.play(loops, fade_ms=fade_ms)
+        cls.STREAMED = track
+
+    @classmethod
+    def crossfade(cls, track: MusicTrack, loops: int, fade_ms: int) -> bool:
+        if (channel := cls.channel()) is None or (source := ChunkedSource.open(track.path, loops)) is None:
+            return False
+        if (chunk := source.read()) is None:
+            source.close()
+            return False
+
+        cls.CHANNELED = track
+        cls.SOURCE = source
+        cls.VOLUME = track.volume
+        cls.RAMP = (time.perf_counter(), fade_ms / 1000, 0, 1)
+        channel.set_volume(cls.VOLUME * cls.level())
+        channel.play(chunk)
+        if (chunk := source.read()) is not None:
+            channel.queue(chunk)
+        return True
+
+    @classmethod
+    def fadeout(cls, track: MusicTrack, fade_ms: int) -> None:
+        if cls.PENDING is not None and cls.PENDING[0] is track:
+            cls.PENDING = None
+        if cls.STREAMED is track:
+            pygame.mixer.music.fadeout(fade_ms)
+            cls.FADING = track
+            cls.STREAMED = None
+        elif cls.CHANNELED is track and cls.RAMP[3] > 0:
+            cls.RAMP = (time.perf_counter(), fade_ms / 1000, cls.level(), 0)
+
+    @classmethod
+    def set_volume(cls, track: MusicTrack, volume: float) -> None:
+        if cls.STREAMED is track:
+            pygame.mixer.music.set_volume(volume)
+        elif cls.CHANNELED is track:
+            cls.VOLUME = volume
+
+    @classmethod
+    def level(cls) -> float:
+        start, duration, begin, end = cls.RAMP
+        if duration <= 0:
+            return end
+        return begin + (end - begin) * min(1.0, (time.perf_counter() - start) / duration)
+
+    @classmethod
+    def update(cls) -> None:
+        if not pygame.mixer.music.get_busy():
+            cls.FADING = None
+            if cls.PENDING is not None:
+                track, loops, fade_ms = cls.PENDING
+                cls.PENDING = None
+                cls.stream(track, loops, fade_ms)
+
+        if cls.SOURCE is None or (channel := cls.channel()) is None:
+            return
+        level: float = cls.level()
+        if cls.RAMP[3] == 0 and level <= 0 or not channel.get_busy():
+            channel.stop()
+            cls.SOURCE.close()
+            cls.SOURCE = None
+            cls.CHANNELED = None
+            return
+        channel.set_volume(cls.VOLUME * level)
+        if channel.get_queue() is None and (chunk := cls.SOURCE.read()) is not None:
+            channel.queue(chunk)
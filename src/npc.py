@@ -1,11 +1,11 @@
 import pygame
 
+from src.collision_index import Blocked, CollisionIndex
 from src.config import Config
 from src.dialogue import Dialogue
 from src.entity import Entity
 from src.entity_route import EntityRoute
 from src.interactable import Interactable
-from src.map_element import MapElement
 from src.player import Player
 from src.route_tracker import Conditions
 from src.sprite import Sprite, dir_to_str
@@ -46,8 +46,7 @@ class NPC(Entity, Interactable):
     def input(self, keys: pygame.key.ScancodeWrapper) -> None:
         pass
 
-    def update(self, entities: list[Entity], map_elements: list[MapElement], ui_manager: UIManager, dt: float)\
-            -> None:
+    def update(self, collision_index: CollisionIndex, ui_manager: UIManager, dt: float) -> None:
         if self.waypoint_wait_time != 0:
             self.waypoint_wait_time -= dt
             if self.waypoint_wait_time < 0:
@@ -77,27 +76,19 @@ class NPC(Entity, Interactable):
         if self.moving:
             target_grid_pos: pygame.Vector2 = self.grid_pos + self.velocity
 
-            collision: bool = False
             rect: pygame.Rect = pygame.Rect(target_grid_pos, self.hit_box)
-            for entity in entities:
-                if entity.get_collision(rect):
-                    self.moving = False
-                    self.velocity = pygame.Vector2(0, 0)
-                    self.move_time = 0
-                    collision = True
-                    break
-
-            if not collision:
-                for map_element in map_elements:
-                    if map_element.get_collision(rect):
-                        if self.current_route is not None:
-                            self.grid_pos = self.routes.get(self.current_route).waypoints[self.route_waypoint].pos
-                            self.pos = self.grid_pos * Config.TILE_SIZE
-                        self.moving = False
-                        self.velocity = pygame.Vector2(0, 0)
-                        self.move_time = 0
-                        collision = True
-                        break
+            blocked: Blocked = collision_index.is_blocked(rect)
+            collision: bool = blocked != Blocked.NONE
+
+            if blocked == Blocked.MAP:
+                if self.current_route is not None:
+                    self.grid_pos = self.routes.get(self.current_route).waypoints[self.route_waypoint].pos
+                    self.pos = self.grid_pos * Config.TILE_SIZE
+                    collision_index.move(self)
+            if collision:
+                self.moving = False
+                self.velocity = pygame.Vector2(0, 0)
+                self.move_time = 0
 
             if not collision:
                 self.move_time += dt
@@ -113,6 +104,7 @@ class NPC(Entity, Interactable):
                     self.grid_pos += self.velocity
                     self.velocity = pygame.Vector2(0, 0)
                     self.moving = False
+                    collision_index.move(self)
 
         if self.current_route is not None and self.moving:
             self.sprite.set(dir_to_str(self.facing, self.facing))
@@ -0,0 +1,55 @@
+import hashlib
+import os
+import struct
+
+import pygame
+
+from src.config import Config
+
+PIXEL_CACHE_DIR: str = ".pixel_cache"
+PIXEL_CACHE_VERSION: int = 1
+
+class PixelCache:
+    DIRECTORY: str = PIXEL_CACHE_DIR
+    HITS: int = 0
+    MISSES: int = 0
+
+    @classmethod
+    def key(cls, *parts) -> str:
+        return hashlib.sha256(repr((PIXEL_CACHE_VERSION, Config.TILE_SIZE, *parts)).encode()).hexdigest()
+
+    @classmethod
+    def file_for(cls, key: str) -> str:
+        return os.path.join(cls.DIRECTORY, key + ".px")
+
+    @classmethod
+    def load(cls, key: str, alpha: bool) -> pygame.Surface | None:
+        try:
+            with open(cls.file_for(key), "rb") as file:
+                data: bytes = file.read()
+        except OSError:
+            cls.MISSES += 1
+            return None
+
+        pixel_format: str = "RGBA" if alpha else "RGB"
+        width, height = struct.unpack("<II", data[:8]) if len(data) >= 8 else (0, 0)
+        if len(data) != 8 + width * height * len(pixel_format):
+            cls.MISSES += 1
+            return None
+
+        surface: pygame.Surface = pygame.image.frombuffer(data[8:], (width, height), pixel_format)
+        cls.HITS += 1
+        return surface.convert_alpha() if alpha else surface.convert()
+
+    @classmethod
+    def store(cls, key: str, surface: pygame.Surface, alpha: bool) -> None:
+        pixels: bytes = pygame.image.tobytes(surface, "RGBA" if alpha else "RGB")
+        file_path: str = cls.file_for(key)
+        try:
+            os.makedirs(cls.DIRECTORY, exist_ok=True)
+            with open(file_path + ".tmp", "wb") as file:
+                file.write(struct.pack("<II", *surface.get_size()))
+                file.write(pixels)
+            os.replace(file_path + ".tmp", file_path)
+        except OSError:
+            return
@@ -1,10 +1,8 @@
 import pygame
 
-from src.asset_manager import AssetManager
-from src.camera import Camera
+from src.collision_index import Blocked, CollisionIndex
 from src.config import Config
 from src.entity import Entity
-from src.map_element import MapElement
 from src.route_tracker import Conditions
 from src.sprite import Sprite
 from src.sprite import dir_to_str
@@ -38,8 +36,7 @@ class Player(Entity):
             self.facing = self.velocity
             self.moving = True
 
-    def update(self, entities: list[Entity], map_elements: list[MapElement], ui_manager: UIManager, dt: float)\
-            -> None:
+    def update(self, collision_index: CollisionIndex, ui_manager: UIManager, dt: float) -> None:
         self.sprite.set(dir_to_str(self.velocity, self.facing))
         self.sprite.update(dt)
 
@@ -54,19 +51,11 @@ class Player(Entity):
         if not self.controls_disabled:
             rect: pygame.Rect = pygame.Rect(target_grid_pos, self.hit_box)
 
-            for entity in entities:
-                if entity.get_collision(rect):
-                    self.moving = False
-                    self.velocity = pygame.Vector2(0, 0)
-                    self.move_time = 0
-                    return
-
-            for map_element in map_elements:
-                if map_element.get_collision(rect):
-                    self.moving = False
-                    self.velocity = pygame.Vector2(0, 0)
-                    self.move_time = 0
-                    return
+            if collision_index.is_blocked(rect) != Blocked.NONE:
+                self.moving = False
+                self.velocity = pygame.Vector2(0, 0)
+                self.move_time = 0
+                return
         
         self.move_time += dt
         t: float = self.move_time / self.move_duration
@@ -83,6 +72,7 @@ class Player(Entity):
             self.velocity = pygame.Vector2(0, 0)
             self.moving = False
             self.move_time = 0
+            collision_index.move(self)
 
     def move_waypoints(self, dt: float):
         if self.waypoint_wait_time != 0:
@@ -115,6 +105,4 @@ class Player(Entity):
             self.controls_disabled = False
 
     def render(self, surface: pygame.Surface) -> None:
-        frame: pygame.Surface = self.sprite.get() or AssetManager.NULL_IMAGE
-        centered: pygame.Vector2 = self.pos - pygame.Vector2(frame.get_size()) / 2
-        surface.blit(frame, Camera.world_pos_to_view_pos(centered))
+        surface.blit(*self.get_blit())
@@ -1,21 +1,83 @@
+import threading
+import weakref
+
+FLAG_LOG_LIMIT: int = 4096
+
 class Flags:
-    DEFINED: dict[str, bool] = {}
+    INDEX: dict[str, int] = {}
+    NAMES: list[str] = []
+    BITS: int = 0
+    LOCK: threading.Lock = threading.Lock()
+
+    VERSION: int = 0
+    LOG: list[str] = []
+    FLOOR: int = 0
+    DEPENDENTS: dict[int, weakref.WeakSet] = {}
+
+    @classmethod
+    def bit(cls, flag: str) -> int:
+        if (index := cls.INDEX.get(flag, None)) is not None:
+            return index
+        with cls.LOCK:
+            if (index := cls.INDEX.get(flag, None)) is None:
+                index = len(cls.NAMES)
+                cls.NAMES.append(flag)
+                cls.INDEX[flag] = index
+        return index
+
+    @classmethod
+    def mask(cls, flags: list[str]) -> int:
+        mask: int = 0
+        for flag in flags:
+            mask |= 1 << cls.bit(flag)
+        return mask
+
+    @classmethod
+    def depend(cls, conditions, bits: list[int]) -> None:
+        with cls.LOCK:
+            for bit in bits:
+                cls.DEPENDENTS.setdefault(bit, weakref.WeakSet()).add(conditions)
+
+    @classmethod
+    def changed_since(cls, version: int) -> set[str] | None:
+        if version < cls.FLOOR:
+            return None
+        return set(cls.LOG[version - cls.FLOOR:])
 
     @classmethod
     def is_set(cls, flag: str) -> bool:
-        return cls.DEFINED.get(flag, False)
+        index: int | None = cls.INDEX.get(flag, None)
+        return index is not None and bool(cls.BITS >> index & 1)
+
+    @classmethod
+    def store(cls, flag: str, bit: int, bits: int) -> None:
+        if bits == cls.BITS:
+            return
+        cls.BITS = bits
+        cls.VERSION += 1
+        cls.LOG.append(flag)
+        if len(cls.LOG) > FLAG_LOG_LIMIT:
+            del cls.LOG[:len(cls.LOG) - FLAG_LOG_LIMIT // 2]
+            cls.FLOOR = cls.VERSION - len(cls.LOG)
+        with cls.LOCK:
+            dependents: list = list(cls.DEPENDENTS.get(bit, ()))
+        for conditions in dependents:
+            conditions.dirty = True
 
     @classmethod
     def set(cls, flag: str) -> None:
-        cls.DEFINED[flag] = True
+        bit: int = cls.bit(flag)
+        cls.store(flag, bit, cls.BITS | 1 << bit)
 
     @classmethod
     def clear(cls, flag: str) -> None:
-        cls.DEFINED[flag] = False
+        bit: int = cls.bit(flag)
+        cls.store(flag, bit, cls.BITS & ~(1 << bit))
 
     @classmethod
     def toggle(cls, flag: str) -> None:
-        cls.DEFINED[flag] = not cls.DEFINED.get(flag, False)
+        bit: int = cls.bit(flag)
+        cls.store(flag, bit, cls.BITS ^ 1 << bit)
 
     @classmethod
     def modify(cls, flag: str, how: str) -> None:
@@ -34,23 +96,36 @@ class Conditions:
         self.all_flags: list[str] = all_flags
         self.any_flags: list[str] = any_flags
         self.not_flags: list[str] = not_flags
+        self.compile()
 
-    def satisfied(self) -> bool:
-        for flag in self.all_flags:
-            if not Flags.is_set(flag):
-                return False
+    def compile(self) -> None:
+        self.all_mask: int = Flags.mask(self.all_flags)
+        self.any_mask: int = Flags.mask(self.any_flags)
+        self.not_mask: int = Flags.mask(self.not_flags)
+        self.dirty: bool = True
+        self.result: bool = False
+        Flags.depend(self, self.bits())
+
+    def __getstate__(self) -> dict:
+        return {"all_flags": self.all_flags, "any_flags": self.any_flags, "not_flags": self.not_flags}
 
-        found: bool = len(self.any_flags) == 0
-        for flag in self.any_flags:
-            if Flags.is_set(flag):
-                found = True
-                break
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.compile()
 
-        if not found:
-            return False
+    def flags(self) -> list[str]:
+        return self.all_flags + self.any_flags + self.not_flags
 
-        for flag in self.not_flags:
-            if Flags.is_set(flag):
-                return False
+    def bits(self) -> list[int]:
+        return [Flags.bit(flag) for flag in dict.fromkeys(self.flags())]
+
+    def satisfied(self) -> bool:
+        if not self.dirty:
+            return self.result
 
-        return True
\ No newline at end of file
+        bits: int = Flags.BITS
+        self.result = bits & self.all_mask == self.all_mask and \
+            (self.any_mask == 0 or bits & self.any_mask != 0) and \
+            bits & self.not_mask == 0
+        self.dirty = False
+        return self.result
@@ -1,16 +1,28 @@
+import math
 import pygame
 import random
+import time
 
+from src.asset_manager import AssetManager
 from src.camera import Camera
+from src.chain_scheduler import ChainScheduler
+from src.collision_index import CollisionIndex
 from src.config import Config
+from src.damage_tracker import DamageTracker
 from src.dialogue import Dialogue
 from src.entity import Entity
 from src.event import DispatchChain
+from src.flag_index import FlagIndex
 from src.interactable import Interactable
 from src.map_element import MapElement
+from src.map_layer import MapLayer
+from src.music_player import MusicTrack
 from src.player import Player
+from src.route_tracker import Flags
 from src.scene_in_out import SceneEntrance, SceneExit
+from src.spatial_grid import SpatialGrid
 from src.trigger import Trigger
+from src.trigger_scheduler import TriggerScheduler
 from src.ui_manager import UIManager
 from src.event import SceneState
 
@@ -18,20 +30,35 @@ BACKGROUND_MUSIC_FADE_MS = 1000
 
 class Scene:
     def __init__(self, void_color: tuple[int, int, int, int], bounds: pygame.Vector2,
-                 background_music: pygame.mixer.Sound | None,
+                 background_music: MusicTrack | None,
                  map_elements: list[MapElement],
                  player: Player,
                  entities: dict[str, Entity],
                  triggers: dict[str, Trigger],
                  entrances: dict[str, SceneEntrance],
-                 exits: list[SceneExit]
+                 exits: list[SceneExit],
+                 flag_index: FlagIndex | None = None,
+                 defer: bool = False
                  ):
         self.void_color: tuple[int, int, int, int] = void_color
-        self.background_music: pygame.mixer.Sound | None = background_music
-        self.music_base_volume: float = 0 if background_music is None else background_music.get_volume()
+        self.background_music: MusicTrack | None = None
+        self.music_base_volume: float = 0
+        self.set_background_music(background_music)
         self.bounds: pygame.Vector2 = bounds
 
         self.map_elements: list[MapElement] = map_elements
+        self.collision_index: CollisionIndex = CollisionIndex(map_elements)
+        self.map_layer: MapLayer = MapLayer(map_elements)
+        self.spatial_grid: SpatialGrid = SpatialGrid()
+        self.render_stats: dict[str, int] = {
+            "entities_drawn": 0, "entities_culled": 0, "chunks_drawn": 0, "chunks_culled": 0
+        }
+
+        self.drawn: dict[int, tuple[pygame.Rect, pygame.Surface | None]] = {}
+        self.damage_drawn: dict[int, tuple[pygame.Rect, pygame.Surface | None]] = {}
+        self.damage_camera: pygame.Vector2 | None = None
+        self.damage_dialogue: tuple | None = None
+        self.map_changed: bool = True
 
         self.player: Player = player
         self.entities_dict: dict[str, Entity] = entities
@@ -40,24 +67,97 @@ class Scene:
         self.dialogue: Dialogue | None = None
 
         self.triggers: dict[str, Trigger] = triggers
+        self.trigger_scheduler: TriggerScheduler = TriggerScheduler(triggers)
 
         self.entrances: dict[str, SceneEntrance] = entrances
         self.entering_through: SceneEntrance | None = None
         self.exits: list[SceneExit] = exits
         self.exiting_through: SceneExit | None = None
 
+        if flag_index is None:
+            flag_index = FlagIndex()
+            for trigger in triggers.values():
+                for event in trigger.catches + trigger.dispatch_chain.dispatches:
+                    flag_index.add(event.conditions, trigger)
+            for scene_exit in exits:
+                flag_index.add(scene_exit.conditions, scene_exit)
+        self.flag_index: FlagIndex = flag_index
+        self.open_exits: list[SceneExit] = []
+        self.exits_version: int | None = None
+
         self.state: SceneState = SceneState.EXITED
         self.has_loaded_prev: bool = False
-        self.void_surface = pygame.Surface(Config.WINDOW_DIMS).convert()
-        self.void_surface.fill(self.void_color[:3])
-        self.void_surface.set_alpha(self.void_color[3])
+        self.void_surface: pygame.Surface | None = None
         self.render_generated_background: bool = self._needs_generated_background()
-        self.background_tile: pygame.Surface | None = self._build_sand_background_tile() \
-            if self.render_generated_background else None
+        self.background_tile: pygame.Surface | None = None
+        self.pending_jobs: list = []
+        self.next_scenes: list[str] = []
+        self.assets: set[tuple[str, str]] = set()
+        self.holds_assets: bool = False
+        self.resources: list = []
 
         self.dispatch_chains: set[DispatchChain] = set()
         self.added_dispatch_chains: set[DispatchChain] = set()
         self.removed_dispatch_chains: set[DispatchChain] = set()
+        self.chain_scheduler: ChainScheduler = ChainScheduler()
+
+        if not defer:
+            self.finalize()
+
+    def available_exits(self) -> list[SceneExit]:
+        if self.exits_version == Flags.VERSION:
+            return self.open_exits
+        if self.exits_version is None or (changed := Flags.changed_since(self.exits_version)) is None or any(
+                isinstance(owner, SceneExit) for owner in self.flag_index.affected(changed)):
+            self.open_exits = [scene_exit for scene_exit in self.exits if scene_exit.available()]
+        self.exits_version = Flags.VERSION
+        return self.open_exits
+
+    def finalize(self) -> None:
+        self.acquire_assets()
+        jobs: list = self.pending_jobs
+        self.pending_jobs = []
+        for job in jobs:
+            job()
+        if self.render_generated_background and self.background_tile is None:
+            self.background_tile = self._build_sand_background_tile()
+
+    def acquire_assets(self) -> None:
+        if not self.holds_assets:
+            self.holds_assets = True
+            AssetManager.acquire(self.assets)
+
+    def release_resources(self) -> None:
+        self.map_layer.release()
+        if Config.LAZY_ASSETS:
+            for resource in self.resources:
+                resource.release()
+        if self.holds_assets:
+            self.holds_assets = False
+            AssetManager.release(self.assets)
+
+    def queue_bake(self) -> None:
+        self.pending_jobs.extend(self.map_layer.bake_jobs())
+
+    def finalize_step(self, deadline: float) -> bool:
+        self.acquire_assets()
+        while self.pending_jobs and time.perf_counter() < deadline:
+            self.pending_jobs.pop(0)()
+        if self.pending_jobs:
+            return False
+        self.finalize()
+        return True
+
+    def get_void_surface(self) -> pygame.Surface:
+        if self.void_surface is None:
+            self.void_surface = pygame.Surface(Config.WINDOW_DIMS).convert()
+            self.void_surface.fill(self.void_color[:3])
+            self.void_surface.set_alpha(self.void_color[3])
+        return self.void_surface
+
+    def set_background_music(self, background_music: MusicTrack | None) -> None:
+        self.background_music = background_music
+        self.music_base_volume = 0 if background_music is None else background_music.get_volume()
 
     def set_music_volume(self, volume: float) -> None:
         if self.background_music is None:
@@ -65,15 +165,26 @@ class Scene:
         self.background_music.set_volume(self.music_base_volume * volume)
 
     def add_dispatch_chain(self, manager, chain: DispatchChain):
-        self.added_dispatch_chains.add(chain)
+        if Config.CHAIN_SCHEDULER:
+            self.chain_scheduler.add(chain)
+        else:
+            self.added_dispatch_chains.add(chain)
         chain.start(self, manager)
 
     def remove_dispatch_chain(self, chain: DispatchChain):
-        self.removed_dispatch_chains.add(chain)
+        if Config.CHAIN_SCHEDULER:
+            self.chain_scheduler.remove(chain)
+        else:
+            self.removed_dispatch_chains.add(chain)
 
     def load(self, entrance: str, player_face_dir: pygame.Vector2, same_bg_music: bool, from_continue: bool) -> None:
         if self.state != SceneState.EXITED: return
         self.state = SceneState.ENTERED
+        self.acquire_assets()
+        for resource in self.resources:
+            resource.finalize()
+        if not self.map_layer.baked:
+            self.map_layer.bake()
 
         if not same_bg_music and self.background_music is not None:
             self.background_music.play(loops=-1, fade_ms=BACKGROUND_MUSIC_FADE_MS)
@@ -99,8 +210,10 @@ class Scene:
 
         self.has_loaded_prev = True
 
-    def unload(self, same_bg_music: bool) -> None:
+    def unload(self, same_bg_music: bool, release: bool = True) -> None:
         self.state = SceneState.EXITED
+        if release:
+            self.release_resources()
         if not same_bg_music and self.background_music is not None:
             self.background_music.fadeout(BACKGROUND_MUSIC_FADE_MS)
 
@@ -129,14 +242,24 @@ class Scene:
                         self.music_base_volume /= 3
                         self.background_music.set_volume(self.background_music.get_volume() / 3)
 
-        for scene_exit in self.exits:
-            if not scene_exit.available():
-                continue
+        for scene_exit in self.available_exits():
             if scene_exit.can_interact(self.player):
                 self.exiting_through = scene_exit
                 self.state = SceneState.EXITING
                 break
 
+    def update_dispatch_chains(self, manager, dt: float) -> None:
+        if Config.CHAIN_SCHEDULER:
+            self.chain_scheduler.update(self, manager, dt)
+            return
+
+        self.dispatch_chains.update(self.added_dispatch_chains)
+        self.added_dispatch_chains.clear()
+        for chain in self.dispatch_chains:
+            chain.update(self, manager, dt)
+        self.dispatch_chains = self.dispatch_chains.difference(self.removed_dispatch_chains)
+        self.removed_dispatch_chains.clear()
+
     def update(self, ui_manager: UIManager, dt: float, manager) -> None:
         Camera.update(self.bounds, dt)
 
@@ -149,16 +272,14 @@ class Scene:
             self.exiting_through = None
             return
 
-        self.dispatch_chains.update(self.added_dispatch_chains)
-        self.added_dispatch_chains.clear()
-        for chain in self.dispatch_chains:
-            chain.update(self, manager, dt)
-        self.dispatch_chains = self.dispatch_chains.difference(self.removed_dispatch_chains)
-        self.removed_dispatch_chains.clear()
+        self.update_dispatch_chains(manager, dt)
 
-        for _, trigger in self.triggers.items():
-            if trigger.catch(self):
-                trigger.dispatch(manager, self)
+        if Config.EVENT_TRIGGERS:
+            self.trigger_scheduler.update(self, manager)
+        else:
+            for _, trigger in self.triggers.items():
+                if trigger.catch(self):
+                    trigger.dispatch(manager, self)
 
         if self.entering_through is not None:
             self.entering_through.update(manager, dt)
@@ -174,7 +295,8 @@ class Scene:
                 self.state = SceneState.EXITED
             return
 
-        self.player.update(self.entities, self.map_elements, ui_manager, dt)
+        self.collision_index.sync(self.entities)
+        self.player.update(self.collision_index, ui_manager, dt)
         if self.player.pos.x > self.bounds.x * Config.TILE_SIZE or \
            self.player.pos.y > self.bounds.y * Config.TILE_SIZE:
             self.player.grid_pos.x = pygame.math.clamp(self.player.grid_pos.x, 0, self.bounds.x)
@@ -185,10 +307,9 @@ class Scene:
             self.player.velocity = pygame.Vector2(0, 0)
             self.player.moving = False
             self.player.move_time = 0
+            self.collision_index.move(self.player)
 
-        for scene_exit in self.exits:
-            if not scene_exit.available():
-                continue
+        for scene_exit in self.available_exits():
             if scene_exit.entered(self.player.grid_pos):
                 self.exiting_through = scene_exit
                 self.state = SceneState.EXITING
@@ -208,19 +329,31 @@ class Scene:
         for entity in self.entities:
             if isinstance(entity, Player):
                 continue
-            entity.update(self.entities, self.map_elements, ui_manager, dt)
+            entity.update(self.collision_index, ui_manager, dt)
 
     def render(self, window_surface: pygame.Surface, ui_manager: UIManager) -> None:
         if self.render_generated_background and self.background_tile is not None:
             self._render_tiled_background(window_surface)
         else:
             window_surface.fill((0, 0, 0))
-        for map_element in self.map_elements: map_element.render(window_surface)
-        for entity in self.entities:
-            if isinstance(entity, Player):
-                continue
-            entity.render(window_surface)
-        self.player.render(window_surface)
+        self.map_changed = self.map_changed or not self.map_layer.baked or bool(self.map_layer.dirty)
+        chunks_drawn: int = self.map_layer.render(window_surface)
+
+        view: pygame.Rect = pygame.Rect(Camera.POS, Config.WINDOW_DIMS).inflate(2, 2)
+        self.spatial_grid.sync(self.entities)
+        visible: list[Entity] = self.spatial_grid.query(view)
+        batch: list = [entity.get_blit() for entity in visible if not isinstance(entity, Player)]
+        if self.player in visible:
+            batch.append(self.player.get_blit())
+        window_surface.blits(batch, False)
+
+        self.render_stats["entities_drawn"] = len(visible)
+        self.render_stats["entities_culled"] = len(self.spatial_grid.keys) - len(visible)
+        self.render_stats["chunks_drawn"] = chunks_drawn
+        self.render_stats["chunks_culled"] = len(self.map_layer.chunks) - chunks_drawn
+
+        if Config.DIRTY_RECT_RENDERING:
+            self.drawn = {id(entity): (entity.get_render_rect(), entity.sprite.get()) for entity in visible}
 
         if self.dialogue is not None:
             dims: pygame.Rect = pygame.Rect(
@@ -230,6 +363,31 @@ class Scene:
 
             self.dialogue.render(window_surface, dims, ui_manager)
 
+    def report_damage(self, tracker: DamageTracker, ui_manager: UIManager) -> None:
+        camera: pygame.Vector2 = Camera.POS.copy()
+        if self.map_changed or camera != self.damage_camera or Camera.SHAKE_OFFSET != pygame.Vector2(0, 0):
+            tracker.invalidate()
+        self.damage_camera = camera
+        self.map_changed = False
+
+        offset: tuple[int, int] = (-math.floor(camera.x), -math.floor(camera.y))
+        for key, (rect, frame) in self.drawn.items():
+            previous: tuple[pygame.Rect, pygame.Surface | None] | None = self.damage_drawn.get(key, None)
+            if previous is not None and previous[0] == rect and previous[1] is frame:
+                continue
+            tracker.add(rect.move(offset).inflate(2, 2))
+            if previous is not None:
+                tracker.add(previous[0].move(offset).inflate(2, 2))
+        for key, (rect, _) in self.damage_drawn.items():
+            if key not in self.drawn:
+                tracker.add(rect.move(offset).inflate(2, 2))
+        self.damage_drawn = self.drawn
+
+        dialogue_state: tuple | None = None if self.dialogue is None else self.dialogue.get_render_state(ui_manager)
+        if dialogue_state != self.damage_dialogue:
+            tracker.add(pygame.Rect(Config.DIALOGUE_BOX_POS, Config.DIALOGUE_BOX_DIMS))
+        self.damage_dialogue = dialogue_state
+
     def _needs_generated_background(self) -> bool:
         world_w = int(self.bounds.x * Config.TILE_SIZE)
         world_h = int(self.bounds.y * Config.TILE_SIZE)
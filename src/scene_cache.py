@@ -0,0 +1,137 @@
+import hashlib
+import io
+import os
+import pickle
+import sys
+
+from src.asset_manager import AssetManager
+from src.scene import Scene
+
+SCENE_CACHE_DIR: str = ".scene_cache"
+SOURCE_DIR: str = os.path.dirname(os.path.abspath(__file__))
+
+def source_digest() -> bytes:
+    digest = hashlib.sha256()
+    found: bool = False
+    for directory, subdirectories, files in os.walk(SOURCE_DIR):
+        subdirectories.sort()
+        for name in sorted(files):
+            if not name.endswith(".py"):
+                continue
+            path: str = os.path.join(directory, name)
+            digest.update(os.path.relpath(path, SOURCE_DIR).encode())
+            with open(path, "rb") as file:
+                digest.update(file.read())
+            found = True
+    if not found:
+        executable: os.stat_result = os.stat(sys.executable)
+        digest.update(f"{sys.executable}:{executable.st_size}:{executable.st_mtime_ns}".encode())
+    return digest.digest()
+
+def asset_ids() -> dict[int, tuple]:
+    ids: dict[int, tuple] = {}
+    for name, sound in AssetManager.AUDIO_ASSETS.items():
+        ids[id(sound)] = ("audio", name)
+    for name, font in AssetManager.FONT_ASSETS.items():
+        ids[id(font)] = ("font", name)
+    for name, image in AssetManager.IMAGE_ASSETS.items():
+        ids[id(image)] = ("image", name)
+    if AssetManager.ATLAS is not None:
+        for i, page in enumerate(AssetManager.ATLAS.pages):
+            ids[id(page)] = ("atlas", i)
+    for key, frame_set in AssetManager.FRAME_SETS.items():
+        ids[id(frame_set)] = ("frame_set", key)
+        for anim, frames in frame_set.frames.items():
+            for i, frame in enumerate(frames):
+                ids[id(frame)] = ("frame", key, anim, i)
+    return ids
+
+class ScenePickler(pickle.Pickler):
+    def __init__(self, file, game):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.game = game
+        self.assets: dict[int, tuple] = asset_ids()
+
+    def persistent_id(self, obj) -> tuple | None:
+        if self.game is not None and obj is self.game:
+            return ("game",)
+        return self.assets.get(id(obj), None)
+
+class SceneUnpickler(pickle.Unpickler):
+    def __init__(self, file, game):
+        super().__init__(file)
+        self.game = game
+
+    def persistent_load(self, pid: tuple):
+        match pid:
+            case ("game",):
+                return self.game
+            case ("audio", name):
+                return AssetManager.AUDIO_ASSETS[name]
+            case ("font", name):
+                return AssetManager.FONT_ASSETS[name]
+            case ("image", name):
+                return AssetManager.IMAGE_ASSETS[name]
+            case ("atlas", i):
+                return AssetManager.ATLAS.pages[i]
+            case ("frame_set", key):
+                return AssetManager.FRAME_SETS[key]
+            case ("frame", key, anim, i):
+                return AssetManager.FRAME_SETS[key].frames[anim][i]
+        raise pickle.UnpicklingError(f"unknown scene cache reference {pid}")
+
+class SceneCache:
+    def __init__(self, directory: str = SCENE_CACHE_DIR):
+        self.directory: str = directory
+        self.hits: int = 0
+        self.misses: int = 0
+        self.source_digest: bytes = source_digest()
+
+    def key(self, source: bytes) -> bytes:
+        digest = hashlib.sha256()
+        digest.update(self.source_digest)
+        digest.update(AssetManager.GUIDE_DIGEST.encode())
+        digest.update(source)
+        return digest.digest()
+
+    def file_for(self, path: str) -> str:
+        return os.path.join(self.directory, os.path.normpath(path).replace(os.sep, "_") + ".bin")
+
+    def load(self, path: str, source: bytes, game) -> Scene | None:
+        try:
+            with open(self.file_for(path), "rb") as file:
+                data: bytes = file.read()
+        except OSError:
+            self.misses += 1
+            return None
+
+        key: bytes = self.key(source)
+        if data[:len(key)] != key:
+            self.misses += 1
+            return None
+
+        try:
+            scene: Scene = SceneUnpickler(io.BytesIO(data[len(key):]), game).load()
+        except Exception:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return scene
+
+    def store(self, path: str, source: bytes, scene: Scene, game) -> None:
+        buffer: io.BytesIO = io.BytesIO()
+        buffer.write(self.key(source))
+        try:
+            ScenePickler(buffer, game).dump(scene)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+
+        file_path: str = self.file_for(path)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(file_path + ".tmp", "wb") as file:
+                file.write(buffer.getvalue())
+            os.replace(file_path + ".tmp", file_path)
+        except OSError:
+            return
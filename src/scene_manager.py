@@ -1,19 +1,63 @@
 import json
 
+from collections.abc import MutableMapping
+from functools import partial
+
+from src.asset_manager import AssetHandle, AssetManager
+from src.config import Config
+from src.damage_tracker import DamageTracker
 from src.dialogue import Monologue, Dialogue, MonologueOption, MonologueLine
 from src.entity import Entity
 from src.entity_route import Waypoint
 from src.event import *
+from src.flag_index import FlagIndex
 from src.map_element import MapElement
+from src.music_player import MusicPlayer
 from src.npc import NPC
 from src.player import Player
 from src.route_tracker import Conditions
 from src.scene import Scene
+from src.scene_cache import SceneCache
 from src.scene_in_out import SceneEntrance, SceneExit, str_to_scene_transition
+from src.scene_prefetcher import ScenePrefetcher
 from src.sprite import Sprite, copy_sprite
 from src.trigger import Trigger
 from src.ui_manager import UIManager
 
+PREFETCH_FINALIZE_BUDGET: float = 0.004
+
+class ParseContext:
+    def __init__(self, defer: bool = False):
+        self.defer: bool = defer
+        self.jobs: list = []
+        self.next_scenes: list[str] = []
+        self.assets: set[tuple[str, str]] = set()
+        self.resources: list = []
+        self.flag_index: FlagIndex = FlagIndex()
+
+    def finalize(self, job) -> None:
+        if self.defer:
+            self.jobs.append(job)
+        else:
+            job()
+
+    def asset(self, kind: str, name: str) -> AssetHandle | None:
+        handle: AssetHandle | None = AssetManager.handle(kind, name)
+        if handle is not None:
+            self.assets.add(handle.key())
+        return handle
+
+    def depend(self, conditions: Conditions | None, owner) -> None:
+        self.flag_index.add(conditions, owner)
+
+    def resource(self, resource) -> None:
+        self.resources.append(resource)
+        self.finalize(resource.finalize)
+
+    def link(self, next_scene: str | None) -> None:
+        if next_scene and next_scene not in self.next_scenes:
+            self.next_scenes.append(next_scene)
+
 def parse_conditions(conditions_obj: dict) -> Conditions:
     all_flags: list[str] = [flag for flag in conditions_obj.get("all", [])]
     any_flags: list[str] = [flag for flag in conditions_obj.get("any", [])]
@@ -21,7 +65,7 @@ def parse_conditions(conditions_obj: dict) -> Conditions:
 
     return Conditions(all_flags=all_flags, any_flags=any_flags, not_flags=not_flags)
 
-def parse_entity_route(route_obj: dict) -> EntityRoute:
+def parse_entity_route(route_obj: dict, context: ParseContext | None = None) -> EntityRoute:
     waypoints_obj: list = route_obj.get("waypoints", [])
     waypoints: list[Waypoint] = []
     for waypoint_obj in waypoints_obj:
@@ -48,7 +92,10 @@ def parse_entity_route(route_obj: dict) -> EntityRoute:
     conditions_obj: dict = route_obj.get("conditions", {})
     conditions: Conditions = parse_conditions(conditions_obj)
 
-    return EntityRoute(waypoints=waypoints, conditions=conditions)
+    route: EntityRoute = EntityRoute(waypoints=waypoints, conditions=conditions)
+    if context is not None:
+        context.depend(conditions, route)
+    return route
 
 def parse_catch(catch_obj: dict) -> CatchEvent | None:
     name: str = catch_obj.get("name", "")
@@ -76,10 +123,12 @@ def parse_catch(catch_obj: dict) -> CatchEvent | None:
     event.conditions = parse_conditions(catch_obj.get("conditions", {}))
     return event
 
-def parse_dispatch(dispatch_obj: dict, game) -> DispatchEvent | None:
+def parse_dispatch(dispatch_obj: dict, game, context: ParseContext | None = None) -> DispatchEvent | None:
+    context = ParseContext() if context is None else context
     name: str = dispatch_obj.get("name", "")
     match name:
         case "exit_scene":
+            context.link(dispatch_obj.get("next_scene"))
             event = ExitScene(
                 transition=dispatch_obj.get("transition"),
                 transition_time=dispatch_obj.get("transition_time"),
@@ -123,7 +172,8 @@ def parse_dispatch(dispatch_obj: dict, game) -> DispatchEvent | None:
                 dialogue=parse_dialogue(
                     dialogue_obj=dispatch_obj.get("dialogue"),
                     entity_id="",
-                    game=game
+                    game=game,
+                    context=context
                 )
             )
         case "end_dialogue":
@@ -160,8 +210,12 @@ def parse_dispatch(dispatch_obj: dict, game) -> DispatchEvent | None:
         case "play_audio":
             event = PlayAudio(
                 audio_id=dispatch_obj.get("identifier", ""),
-                volume=dispatch_obj.get("volume", 0)
+                volume=dispatch_obj.get("volume", 0),
+                priority=dispatch_obj.get("priority", 0),
+                audio=context.asset("audio", dispatch_obj.get("identifier", ""))
             )
+            if event.audio is not None:
+                context.resource(event)
         case "launch_script":
             event = LaunchScript(
                 script_path=dispatch_obj.get("path", "")
@@ -188,14 +242,18 @@ def parse_dispatch(dispatch_obj: dict, game) -> DispatchEvent | None:
     event.org_wait = event.wait
     return event
 
-def parse_monologue_option(option_obj: dict) -> MonologueOption:
-    return MonologueOption(
+def parse_monologue_option(option_obj: dict, context: ParseContext | None = None) -> MonologueOption:
+    option: MonologueOption = MonologueOption(
         text=option_obj.get("text", ""),
         next_monologue=option_obj.get("next_monologue", ""),
         conditions=parse_conditions(option_obj.get("conditions", {}))
     )
+    if context is not None:
+        context.depend(option.conditions, option)
+    return option
 
-def parse_monologue(monologue_obj: dict, game) -> Monologue:
+def parse_monologue(monologue_obj: dict, game, context: ParseContext | None = None) -> Monologue:
+    context = ParseContext() if context is None else context
     conditions_obj: dict = monologue_obj.get("conditions", {})
     conditions: Conditions = parse_conditions(conditions_obj)
 
@@ -218,7 +276,7 @@ def parse_monologue(monologue_obj: dict, game) -> Monologue:
     dispatch_events: list[DispatchEvent] = []
     dispatch_objs: list = monologue_obj.get("dispatch_on_reach", [])
     for dispatch_obj in dispatch_objs:
-        de: DispatchEvent | None = parse_dispatch(dispatch_obj, game)
+        de: DispatchEvent | None = parse_dispatch(dispatch_obj, game, context)
         if de is not None:
             dispatch_events.append(de)
 
@@ -230,17 +288,17 @@ def parse_monologue(monologue_obj: dict, game) -> Monologue:
     options: list[MonologueOption] = []
     options_obj: list = monologue_obj.get("options", [])
     for option_obj in options_obj:
-        options.append(parse_monologue_option(option_obj))
+        options.append(parse_monologue_option(option_obj, context))
 
-    speaker_image: pygame.Surface | None = None
+    speaker_image: AssetHandle | None = None
     if monologue_obj.get("speaker_image", "") != "":
-        speaker_image = AssetManager.get_image(monologue_obj.get("speaker_image", ""))
+        speaker_image = context.asset("images", monologue_obj.get("speaker_image", ""))
 
-    speaking_sfx: pygame.mixer.Sound | None = None
+    speaking_sfx: AssetHandle | None = None
     if monologue_obj.get("speaking_sfx", "") != "":
-        speaking_sfx = AssetManager.get_audio(monologue_obj.get("speaking_sfx", ""))
+        speaking_sfx = context.asset("audio", monologue_obj.get("speaking_sfx", ""))
 
-    return Monologue(
+    monologue: Monologue = Monologue(
         conditions=conditions,
         alt_monologue=monologue_obj.get("alt_monologue", ""),
         speaker=monologue_obj.get("speaker", ""),
@@ -252,11 +310,16 @@ def parse_monologue(monologue_obj: dict, game) -> Monologue:
         modify_flags=modify_flags,
         options=options,
         speaker_image=speaker_image,
-        speaking_sfx=speaking_sfx
+        speaking_sfx=speaking_sfx,
+        defer=True
     )
+    context.resource(monologue)
+
+    return monologue
 
 
-def parse_dialogue(dialogue_obj: dict, entity_id: str, game) -> Dialogue:
+def parse_dialogue(dialogue_obj: dict, entity_id: str, game, context: ParseContext | None = None) -> Dialogue:
+    context = ParseContext() if context is None else context
     start_monologues: list[tuple[str, Conditions]] = []
     start_monologues_obj: list = dialogue_obj.get("start_monologue", [])
     for start_monologue_obj in start_monologues_obj:
@@ -268,17 +331,23 @@ def parse_dialogue(dialogue_obj: dict, entity_id: str, game) -> Dialogue:
     monologues: dict[str, Monologue] = {}
     monologues_obj: list = dialogue_obj.get("monologues", [])
     for monologue_obj in monologues_obj:
-        monologues[monologue_obj.get("id", "")] = parse_monologue(monologue_obj, game)
+        monologues[monologue_obj.get("id", "")] = parse_monologue(monologue_obj, game, context)
 
-    return Dialogue(
+    dialogue: Dialogue = Dialogue(
         conditions=parse_conditions(dialogue_obj.get("conditions", {})),
         start_monologues=start_monologues,
         monologues=monologues,
         entity_id=entity_id
     )
 
+    return dialogue
+
+
+def load_background_music(scene: Scene, identifier: str, volume: float) -> None:
+    scene.set_background_music(AssetManager.get_music(identifier, volume))
 
-def parse_scene(scene_obj: dict, game) -> Scene:
+def parse_scene(scene_obj: dict, game, context: ParseContext | None = None) -> Scene:
+    context = ParseContext() if context is None else context
     void_color_obj: dict = scene_obj.get("void_color", {})
     void_color: tuple[int, int, int, int] = (
         void_color_obj.get("r", 0), void_color_obj.get("g", 0), void_color_obj.get("b", 0),
@@ -289,12 +358,6 @@ def parse_scene(scene_obj: dict, game) -> Scene:
     bounds = pygame.Vector2(bounds_obj.get("x", 0), bounds_obj.get("y", 0))
 
     background_music_obj: dict = scene_obj.get("background_music", {})
-    if AssetManager.get_audio(background_music_obj.get("identifier", "")) is not None:
-        background_music: pygame.mixer.Sound | None = pygame.mixer.Sound(
-            AssetManager.get_audio(background_music_obj.get("identifier", "")))
-        background_music.set_volume(background_music_obj.get("volume", 0))
-    else:
-        background_music: pygame.mixer.Sound | None = None
 
     map_elements_obj: list = scene_obj.get("map_elements", [])
     map_elements: list[MapElement] = []
@@ -302,11 +365,14 @@ def parse_scene(scene_obj: dict, game) -> Scene:
         rect_obj: dict = map_element_obj.get("rect", {})
         rect: pygame.Rect = pygame.Rect(rect_obj.get("x", 0), rect_obj.get("y", 0),
                                         rect_obj.get("w", 0), rect_obj.get("h", 0))
-        map_elements.append(MapElement(
+        map_element: MapElement = MapElement(
             rect=rect,
-            image=AssetManager.get_image(map_element_obj.get("image", "")),
-            collision=map_element_obj.get("collision", False)
-        ))
+            image=context.asset("images", map_element_obj.get("image", "")),
+            collision=map_element_obj.get("collision", False),
+            defer=True
+        )
+        context.resource(map_element)
+        map_elements.append(map_element)
 
     entity_lookup: dict = {}
     entity_lookup_obj: list = scene_obj.get("entity_lookup", [])
@@ -332,16 +398,19 @@ def parse_scene(scene_obj: dict, game) -> Scene:
     triggers_obj: list = scene_obj.get("triggers", [])
     for trigger_obj in triggers_obj:
         catches: list = [parse_catch(e) for e in trigger_obj.get("catch", [])]
-        dispatches: list = [parse_dispatch(e, game) for e in trigger_obj.get("dispatch", [])]
+        dispatches: list = [parse_dispatch(e, game, context) for e in trigger_obj.get("dispatch", [])]
         for i in range(catches.count(None)): catches.remove(None)
         for i in range(dispatches.count(None)): dispatches.remove(None)
 
-        triggers[trigger_obj.get("identifier", "")] = Trigger(
+        trigger: Trigger = Trigger(
             disabled=trigger_obj.get("disabled", False),
             once=trigger_obj.get("once", False),
             catch=catches,
             dispatch=dispatches
         )
+        for event in catches + dispatches:
+            context.depend(event.conditions, trigger)
+        triggers[trigger_obj.get("identifier", "")] = trigger
 
     entrances: dict[str, SceneEntrance] = {}
     entrances_obj: list = scene_obj.get("entrances", [])
@@ -361,7 +430,7 @@ def parse_scene(scene_obj: dict, game) -> Scene:
             rect_obj.get("x", 0), rect_obj.get("y", 0), rect_obj.get("w", 0), rect_obj.get("h", 0)
         )
 
-        exits.append(SceneExit(
+        scene_exit: SceneExit = SceneExit(
             rect=rect,
             require_interact=exit_obj.get("require_interact", False),
             transition=str_to_scene_transition(exit_obj.get("transition", "")),
@@ -369,7 +438,10 @@ def parse_scene(scene_obj: dict, game) -> Scene:
             next_scene=exit_obj.get("next_scene", ""),
             next_entrance=exit_obj.get("entrance", ""),
             conditions=parse_conditions(exit_obj.get("conditions", {}))
-        ))
+        )
+        context.depend(scene_exit.conditions, scene_exit)
+        exits.append(scene_exit)
+        context.link(exit_obj.get("next_scene", ""))
 
     entities: dict[str, Entity] = {}
 
@@ -381,12 +453,12 @@ def parse_scene(scene_obj: dict, game) -> Scene:
         dialogues: dict[str, Dialogue] = {}
         dialogues_obj: list = entity_obj.get("dialogues", [])
         for dialogue_obj in dialogues_obj:
-            dialogues[dialogue_obj.get("id", "")] = parse_dialogue(dialogue_obj, entity_obj.get("id", ""), game)
+            dialogues[dialogue_obj.get("id", "")] = parse_dialogue(dialogue_obj, entity_obj.get("id", ""), game, context)
 
         routes: dict[str, EntityRoute] = {}
         routes_obj: list = entity_obj.get("routes", [])
         for route_obj in routes_obj:
-            routes[route_obj.get("id", "")] = parse_entity_route(route_obj)
+            routes[route_obj.get("id", "")] = parse_entity_route(route_obj, context)
 
         if len(dialogues) > 0:
             spawn_obj: dict = entity_obj.get("spawn", {})
@@ -413,21 +485,74 @@ def parse_scene(scene_obj: dict, game) -> Scene:
     scene: Scene = Scene(
         void_color=void_color,
         bounds=bounds,
-        background_music=background_music,
+        background_music=None,
         map_elements=map_elements,
         player=player,
         entities=entities,
         triggers=triggers,
         entrances=entrances,
-        exits=exits
+        exits=exits,
+        flag_index=context.flag_index,
+        defer=True
     )
+    context.finalize(partial(load_background_music, scene, background_music_obj.get("identifier", ""),
+                             background_music_obj.get("volume", 0)))
+    scene.next_scenes = context.next_scenes
+    scene.assets = context.assets
+    scene.resources = context.resources
+    scene.pending_jobs = context.jobs
+    if not context.defer:
+        scene.finalize()
 
     return scene
 
 
+class SceneMap(MutableMapping):
+    def __init__(self, loader):
+        self.loader = loader
+        self.paths: dict[str, str | None] = {}
+        self.parsed: dict[str, Scene] = {}
+
+    def add_path(self, name: str, path: str) -> None:
+        self.paths[name] = path
+        self.parsed.pop(name, None)
+
+    def loaded(self) -> dict[str, Scene]:
+        return self.parsed
+
+    def __getitem__(self, name: str) -> Scene:
+        if (scene := self.parsed.get(name, None)) is None:
+            if self.paths.get(name, None) is None:
+                raise KeyError(name)
+            scene = self.loader(name, self.paths[name])
+            self.parsed[name] = scene
+        return scene
+
+    def __setitem__(self, name: str, scene: Scene) -> None:
+        self.paths.setdefault(name, None)
+        self.parsed[name] = scene
+
+    def __delitem__(self, name: str) -> None:
+        del self.paths[name]
+        self.parsed.pop(name, None)
+
+    def __contains__(self, name) -> bool:
+        return name in self.paths
+
+    def __iter__(self):
+        return iter(self.paths)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+
 class SceneManager:
     def __init__(self, scene_guide: str, game):
-        self.scenes: dict[str, Scene] = {}
+        self.game = game
+        self.scenes: SceneMap = SceneMap(self.parse_scene_file)
+        self.prefetcher: ScenePrefetcher = ScenePrefetcher(self.read_scene_file)
+        self.cache: SceneCache | None = SceneCache() if Config.SCENE_CACHE else None
+        self.music_volume: float | None = None
         self.current_scene: str = ""
         self.start_scene: str = ""
 
@@ -437,19 +562,68 @@ class SceneManager:
         self.overlay: pygame.Surface = pygame.Surface(pygame.display.get_window_size()).convert()
         self.overlay.fill((0, 0, 0))
 
+        self.damage_scene: str = ""
+        self.damage_fade: int = 0
+
         with open(scene_guide, "r") as file:
             obj = json.load(file)
 
         self.start_scene = obj.get("start_scene", "")
         for scene_obj in obj.get("scenes", []):
-            with open(scene_obj.get("path"), "r") as file:
-                scene_json = json.load(file)
-            self.add_scene(scene_obj.get("name"), parse_scene(scene_json, game))
+            self.scenes.add_path(scene_obj.get("name"), scene_obj.get("path"))
+
+        if not Config.LAZY_SCENE_LOADING:
+            for name in self.scenes:
+                self.scenes[name]
+
+    def read_scene_file(self, path: str, defer: bool = True) -> Scene:
+        with open(path, "rb") as file:
+            source: bytes = file.read()
+
+        scene: Scene | None = self.cache.load(path, source, self.game) if self.cache is not None else None
+        if scene is None:
+            scene = parse_scene(json.loads(source), self.game, ParseContext(True))
+            if self.cache is not None:
+                scene.pending_jobs.insert(0, partial(self.store_scene, path, source, scene, list(scene.pending_jobs)))
+
+        if not defer:
+            scene.finalize()
+        return scene
+
+    def store_scene(self, path: str, source: bytes, scene: Scene, jobs: list) -> None:
+        pending, holds_assets = scene.pending_jobs, scene.holds_assets
+        scene.pending_jobs, scene.holds_assets = jobs, False
+        self.cache.store(path, source, scene, self.game)
+        scene.pending_jobs, scene.holds_assets = pending, holds_assets
+
+    def parse_scene_file(self, name: str, path: str) -> Scene:
+        scene: Scene | None = self.prefetcher.take(name) if Config.SCENE_PREFETCH else None
+        if scene is None:
+            scene = self.read_scene_file(path, False)
+        scene.finalize()
+        if self.music_volume is not None:
+            scene.set_music_volume(self.music_volume)
+        return scene
 
     def set_music_volume(self, volume: float) -> None:
-        for _, scene in self.scenes.items():
+        self.music_volume = volume
+        for _, scene in self.scenes.loaded().items():
             scene.set_music_volume(volume)
 
+    def prefetch(self, names: list[str]) -> None:
+        for name in self.prefetcher.retain(names):
+            if name != self.current_scene and name in self.scenes.loaded():
+                self.scenes.loaded()[name].release_resources()
+        for name in names:
+            if name in self.scenes.loaded() or self.scenes.paths.get(name, None) is None:
+                continue
+            self.prefetcher.prefetch(name, self.scenes.paths[name])
+
+    def adopt_scene(self, name: str, scene: Scene) -> None:
+        if self.music_volume is not None:
+            scene.set_music_volume(self.music_volume)
+        self.scenes[name] = scene
+
     def add_scene(self, name: str, scene: Scene) -> None:
         self.scenes[name] = scene
 
@@ -459,20 +633,28 @@ class SceneManager:
         if self.current_scene != "":
             if self.scenes[self.current_scene].background_music is None or self.scenes[scene_name].background_music is None:
                 same_bg_music = False
-            elif self.scenes[self.current_scene].background_music.get_raw() == self.scenes[scene_name].background_music.get_raw():
+            elif self.scenes[self.current_scene].background_music.same_track(self.scenes[scene_name].background_music):
                 volume: float = self.scenes[scene_name].background_music.get_volume()
                 self.scenes[scene_name].background_music = self.scenes[self.current_scene].background_music
                 self.scenes[scene_name].background_music.set_volume(volume)
                 same_bg_music = True
-            self.scenes[self.current_scene].unload(same_bg_music)
+            # Continuing into the scene that was paused keeps its baked chunks and assets
+            self.scenes[self.current_scene].unload(same_bg_music, scene_name != self.current_scene)
         self.scenes[scene_name].load(entrance_id, player_face_dir, same_bg_music and not from_continue, from_continue)
         self.current_scene = scene_name
 
+        if Config.SCENE_PREFETCH:
+            self.prefetcher.claim(scene_name)
+            self.prefetch(self.scenes[scene_name].next_scenes)
+
     def input(self, ui_manager: UIManager, keys: pygame.key.ScancodeWrapper) -> None:
         self.scenes[self.current_scene].input(ui_manager, self, keys)
 
     def update(self, ui_manager: UIManager, dt: float) -> None:
         self.fade = pygame.math.clamp(self.fade + self.fading * dt, 0, 255)
+        MusicPlayer.update()
+        if Config.SCENE_PREFETCH and (prefetched := self.prefetcher.step(PREFETCH_FINALIZE_BUDGET)) is not None:
+            self.adopt_scene(*prefetched)
         self.scenes[self.current_scene].update(ui_manager, dt, self)
 
     def render(self, window_surface: pygame.Surface, ui_manager: UIManager) -> None:
@@ -481,3 +663,11 @@ class SceneManager:
         if self.fade > 0:
             self.overlay.set_alpha(self.fade)
             window_surface.blit(self.overlay, (0, 0))
+
+    def report_damage(self, tracker: DamageTracker, ui_manager: UIManager) -> None:
+        if self.current_scene != self.damage_scene or self.fade != self.damage_fade:
+            tracker.invalidate()
+        self.damage_scene = self.current_scene
+        self.damage_fade = self.fade
+
+        self.scenes[self.current_scene].report_damage(tracker, ui_manager)
@@ -0,0 +1,97 @@
+import time
+
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from src.scene import Scene
+
+class ScenePrefetcher:
+    def __init__(self, parse):
+        self.parse = parse
+        self.executor: ThreadPoolExecutor | None = None
+        self.futures: dict[str, Future] = {}
+        self.adopting: dict[str, Scene] = {}
+        self.ready: set[str] = set()
+
+        self.hits: int = 0
+        self.late: int = 0
+        self.misses: int = 0
+
+    def prefetch(self, name: str, path: str) -> None:
+        if name in self.futures or name in self.adopting or name in self.ready:
+            return
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scene-prefetch")
+        self.futures[name] = self.executor.submit(self.parse, path)
+
+    def retain(self, names: list[str]) -> list[str]:
+        for name in [name for name in self.futures if name not in names]:
+            self.futures.pop(name).cancel()
+        for name in [name for name in self.adopting if name not in names]:
+            self.adopting.pop(name).release_resources()
+        dropped: list[str] = [name for name in self.ready if name not in names]
+        self.ready.difference_update(dropped)
+        return dropped
+
+    def step(self, budget: float) -> tuple[str, Scene] | None:
+        if not self.adopting:
+            for name, future in list(self.futures.items()):
+                if not future.done():
+                    continue
+                self.futures.pop(name)
+                if not future.cancelled() and future.exception() is None:
+                    scene: Scene = future.result()
+                    scene.pending_jobs.append(scene.queue_bake)
+                    self.adopting[name] = scene
+                    break
+
+        if not self.adopting:
+            return None
+
+        name, scene = next(iter(self.adopting.items()))
+        if not scene.finalize_step(time.perf_counter() + budget):
+            return None
+
+        self.adopting.pop(name)
+        self.ready.add(name)
+        return name, scene
+
+    def claim(self, name: str) -> None:
+        if name in self.ready:
+            self.ready.discard(name)
+            self.hits += 1
+
+    def take(self, name: str) -> Scene | None:
+        if (scene := self.adopting.pop(name, None)) is not None:
+            self.late += 1
+            return scene
+
+        future: Future | None = self.futures.pop(name, None)
+        if future is None or future.cancelled():
+            self.misses += 1
+            return None
+
+        try:
+            scene = future.result()
+        except Exception:
+            self.misses += 1
+            return None
+
+        self.late += 1
+        return scene
+
+    def shutdown(self) -> None:
+        self.futures.clear()
+        self.adopting.clear()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    def stats(self) -> dict[str, float]:
+        requests: int = max(self.hits + self.late + self.misses, 1)
+        return {
+            "hits": self.hits,
+            "late": self.late,
+            "misses": self.misses,
+            "pending": len(self.futures) + len(self.adopting),
+            "hit_rate": self.hits / requests
+        }
@@ -0,0 +1,69 @@
+import math
+import pygame
+
+from src.config import Config
+
+BUCKET_SIZE: int = 2
+
+class SpatialGrid:
+    def __init__(self, bucket_size: int = BUCKET_SIZE):
+        self.bucket_size: int = bucket_size
+        self.buckets: dict[tuple[int, int], list] = {}
+        self.keys: dict[int, tuple[tuple[int, int], object, object]] = {}
+        self.order: dict[int, int] = {}
+        self.extent: pygame.Vector2 = pygame.Vector2(0, 0)
+
+    def _bucket(self, x: float, y: float) -> tuple[int, int]:
+        span: int = self.bucket_size * Config.TILE_SIZE
+        return math.floor(x) // span, math.floor(y) // span
+
+    def _remove(self, entity_id: int) -> None:
+        key, entity, _ = self.keys.pop(entity_id)
+        self.buckets[key].remove(entity)
+        if not self.buckets[key]:
+            del self.buckets[key]
+
+    def sync(self, entities: list) -> None:
+        span: int = self.bucket_size * Config.TILE_SIZE
+        keys: dict[int, tuple[tuple[int, int], object, object]] = self.keys
+        order: dict[int, int] = {}
+        for i, entity in enumerate(entities):
+            entity_id: int = id(entity)
+            order[entity_id] = i
+            key: tuple[int, int] = (math.floor(entity.pos.x) // span, math.floor(entity.pos.y) // span)
+            if (old := keys.get(entity_id, None)) is not None:
+                if old[0] == key and old[2] is entity.sprite:
+                    continue
+                self._remove(entity_id)
+            self.buckets.setdefault(key, []).append(entity)
+            keys[entity_id] = (key, entity, entity.sprite)
+
+            size: pygame.Vector2 = entity.sprite.dimensions * max(1.0, Config.ENTITY_RENDER_SCALE)
+            self.extent.x = max(self.extent.x, math.ceil(size.x / 2))
+            self.extent.y = max(self.extent.y, math.ceil(size.y / 2))
+
+        if len(keys) != len(order):
+            for entity_id in [entity_id for entity_id in keys if entity_id not in order]:
+                self._remove(entity_id)
+        self.order = order
+
+    def query(self, view: pygame.Rect) -> list:
+        span: int = self.bucket_size * Config.TILE_SIZE
+        left, top = self._bucket(view.left - self.extent.x, view.top - self.extent.y)
+        right, bottom = self._bucket(view.right + self.extent.x, view.bottom + self.extent.y)
+        inner: pygame.Rect = view.inflate(-2 * self.extent.x - 2, -2 * self.extent.y - 2)
+
+        order: dict[int, int] = self.order
+        visible: list[tuple[int, object]] = []
+        for x in range(left, right + 1):
+            for y in range(top, bottom + 1):
+                if (bucket := self.buckets.get((x, y), None)) is None:
+                    continue
+                if inner.contains((x * span, y * span, span, span)):
+                    visible += [(order[id(entity)], entity) for entity in bucket]
+                    continue
+                for entity in bucket:
+                    if entity.get_render_rect().colliderect(view):
+                        visible.append((order[id(entity)], entity))
+        visible.sort(key=lambda item: item[0])
+        return [entity for _, entity in visible]
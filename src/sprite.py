@@ -31,36 +31,80 @@ def dir_to_str(moving: pygame.Vector2, facing: pygame.Vector2) -> str | None:
 DEFAULT_ANIM: str = "idle_down"
 DEFAULT_FRAME_TIME: float = 0.2
 
-class Sprite:
-    def __init__(self, spritesheet: pygame.Surface | None, dimensions: pygame.Vector2,
-                 animations: list[str] | None, row_major: bool | None,
-                 num_frames: int,
-
-                 frames: dict[str, list[pygame.Surface]] | None = None,
-                 default_anim: str | None = None,
-                 frame_time: float | None = None):
-
-        self.frames: dict[str, list[pygame.Surface]] = {}
+class FrameSet:
+    def __init__(self, frames: dict[str, list[pygame.Surface]], dimensions: pygame.Vector2, num_frames: int):
+        self.frames: dict[str, list[pygame.Surface]] = frames
+        self.regions: dict[str, list[tuple[pygame.Surface, pygame.Rect]]] | None = None
         self.dimensions: pygame.Vector2 = dimensions
         self.num_frames: int = num_frames
 
-        self.default_anim: str = DEFAULT_ANIM
+def slice_frames(spritesheet: pygame.Surface, dimensions: pygame.Vector2, animations: list[str],
+                 row_major: bool, num_frames: int) -> FrameSet:
+    frames: dict[str, list[pygame.Surface]] = {}
+    elements: int = num_frames * len(animations)
+    render_scale: float = max(1.0, Config.ENTITY_RENDER_SCALE)
+
+    x: int = 0
+    y: int = 0
+    for i in range(elements):
+        subsurface: pygame.Surface = spritesheet.subsurface(pygame.Rect(
+            x * dimensions.x, y * dimensions.y,
+            dimensions.x, dimensions.y)
+        )
+        if render_scale != 1.0:
+            scaled_w = int(dimensions.x * render_scale)
+            scaled_h = int(dimensions.y * render_scale)
+            subsurface = pygame.transform.scale(subsurface, (scaled_w, scaled_h))
+
+        animation: str = animations[y if row_major else x]
+        if frames.get(animation, False):
+            frames[animation].append(subsurface)
+        else:
+            frames[animation] = [subsurface]
+
+        if row_major:
+            x += 1
+        else:
+            y += 1
+
+        if i % num_frames == num_frames - 1:
+            if row_major:
+                x = 0
+                y += 1
+            else:
+                x += 1
+                y = 0
+
+    return FrameSet(frames, dimensions, num_frames)
+
+# Frame sets are shared: every sprite cut from the same sheet points at one FrameSet, and once packed its frames are
+# subsurfaces of the atlas pages. Sprites only read their frames; copy a frame before changing its pixels.
+class Sprite:
+    def __init__(self, frame_set: FrameSet, default_anim: str = DEFAULT_ANIM, frame_time: float = DEFAULT_FRAME_TIME):
+        self.frame_set: FrameSet = frame_set
+
+        self.default_anim: str = default_anim
         self.animation: str = self.default_anim
 
         self.frame_progress: float = 0
-        self.frame_time: float = DEFAULT_FRAME_TIME
+        self.frame_time: float = frame_time
         self.frame_index: int = 0
 
-        if frames is not None:
-            for k, v in frames.items():
-                self.frames[k] = []
-                for frame in v:
-                    self.frames[k].append(frame.copy())
-            self.default_anim = default_anim
-            self.frame_time = frame_time
-            return
+    @property
+    def frames(self) -> dict[str, list[pygame.Surface]]:
+        return self.frame_set.frames
+
+    @property
+    def regions(self) -> dict[str, list[tuple[pygame.Surface, pygame.Rect]]] | None:
+        return self.frame_set.regions
 
-        self.init_frames(spritesheet, animations, row_major)
+    @property
+    def dimensions(self) -> pygame.Vector2:
+        return self.frame_set.dimensions
+
+    @property
+    def num_frames(self) -> int:
+        return self.frame_set.num_frames
 
     def set_default_anim(self, anim: str):
         self.default_anim = anim
@@ -68,41 +112,6 @@ class Sprite:
     def set_frame_time(self, frame_time: float):
         self.frame_time = frame_time
 
-    def init_frames(self, spritesheet: pygame.Surface, animations: list[str], row_major: bool) -> None:
-        elements: int = self.num_frames * len(animations)
-        render_scale: float = max(1.0, Config.ENTITY_RENDER_SCALE)
-
-        x: int = 0
-        y: int = 0
-        for i in range(elements):
-            subsurface: pygame.Surface = spritesheet.subsurface(pygame.Rect(
-                x * self.dimensions.x, y * self.dimensions.y,
-                self.dimensions.x, self.dimensions.y)
-            )
-            if render_scale != 1.0:
-                scaled_w = int(self.dimensions.x * render_scale)
-                scaled_h = int(self.dimensions.y * render_scale)
-                subsurface = pygame.transform.scale(subsurface, (scaled_w, scaled_h))
-
-            animation: str = animations[y if row_major else x]
-            if self.frames.get(animation, False):
-                self.frames[animation].append(subsurface)
-            else:
-                self.frames[animation] = [subsurface]
-
-            if row_major:
-                x += 1
-            else:
-                y += 1
-
-            if i % self.num_frames == self.num_frames - 1:
-                if row_major:
-                    x = 0
-                    y += 1
-                else:
-                    x += 1
-                    y = 0
-
     def reset_frames(self) -> None:
         self.frame_progress = 0
         self.frame_index = 0
@@ -117,6 +126,14 @@ class Sprite:
             return None
         return self.frames.get(self.animation)[self.frame_index]
 
+    def get_region(self) -> tuple[pygame.Surface, pygame.Rect] | None:
+        if self.regions is None:
+            frame: pygame.Surface | None = self.get()
+            return None if frame is None else (frame, frame.get_rect())
+        if self.regions.get(self.animation) is None:
+            return None
+        return self.regions.get(self.animation)[self.frame_index]
+
     def update(self, dt: float) -> None:
         self.frame_progress += dt
         if self.frame_progress >= self.frame_time:
@@ -125,14 +142,4 @@ class Sprite:
             self.frame_index %= self.num_frames
 
 def copy_sprite(sprite: Sprite) -> Sprite:
-    new_sprite: Sprite = Sprite(
-        spritesheet=None,
-        dimensions=sprite.dimensions,
-        animations=None,
-        row_major=None,
-        num_frames=sprite.num_frames,
-        frames=sprite.frames,
-        default_anim=sprite.default_anim,
-        frame_time=sprite.frame_time
-    )
-    return new_sprite
+    return Sprite(sprite.frame_set, sprite.default_anim, sprite.frame_time)
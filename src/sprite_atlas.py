@@ -0,0 +1,68 @@
+import pygame
+
+from src.sprite import FrameSet
+
+ATLAS_SIZE: int = 1024
+
+def pack_shelves(sizes: list[tuple[int, int]], atlas_size: int) -> list[tuple[int, int, int]]:
+    placements: list[tuple[int, int, int] | None] = [None] * len(sizes)
+    shelves: list[list[int]] = [] # [ page, y, height, next x ]
+    page_heights: list[int] = []
+
+    for i in sorted(range(len(sizes)), key=lambda i: (sizes[i][1], sizes[i][0]), reverse=True):
+        w, h = sizes[i]
+        if w > atlas_size or h > atlas_size:
+            raise ValueError(f"frame of size {w}x{h} does not fit a {atlas_size}x{atlas_size} atlas")
+
+        for shelf in shelves:
+            if h <= shelf[2] and shelf[3] + w <= atlas_size:
+                placements[i] = (shelf[0], shelf[3], shelf[1])
+                shelf[3] += w
+                break
+        else:
+            page: int = next((p for p, used in enumerate(page_heights) if used + h <= atlas_size), len(page_heights))
+            if page == len(page_heights):
+                page_heights.append(0)
+            shelves.append([page, page_heights[page], h, w])
+            placements[i] = (page, 0, page_heights[page])
+            page_heights[page] += h
+
+    return placements
+
+class SpriteAtlas:
+    def __init__(self, atlas_size: int = ATLAS_SIZE):
+        self.atlas_size: int = atlas_size
+        self.pages: list[pygame.Surface] = []
+
+    def pack(self, frame_sets: list[FrameSet]) -> None:
+        frames: list[tuple[FrameSet, str, int, pygame.Surface]] = [
+            (frame_set, animation, i, frame)
+            for frame_set in frame_sets
+            for animation, animation_frames in frame_set.frames.items()
+            for i, frame in enumerate(animation_frames)
+        ]
+        placements: list[tuple[int, int, int]] = pack_shelves([frame[3].get_size() for frame in frames],
+                                                               self.atlas_size)
+
+        page_extents: dict[int, list[int]] = {}
+        for (_, _, _, frame), (page, x, y) in zip(frames, placements):
+            extent: list[int] = page_extents.setdefault(page, [0, 0])
+            extent[0] = max(extent[0], x + frame.get_width())
+            extent[1] = max(extent[1], y + frame.get_height())
+
+        self.pages = []
+        for page in range(len(page_extents)):
+            surface: pygame.Surface = pygame.Surface(page_extents[page], pygame.SRCALPHA)
+            surface.fill((0, 0, 0, 0))
+            self.pages.append(surface.convert_alpha())
+
+        for (_, _, _, frame), (page, x, y) in zip(frames, placements):
+            self.pages[page].blit(frame, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+
+        for frame_set in frame_sets:
+            frame_set.regions = {animation: [None] * len(animation_frames)
+                                 for animation, animation_frames in frame_set.frames.items()}
+        for (frame_set, animation, i, frame), (page, x, y) in zip(frames, placements):
+            area: pygame.Rect = pygame.Rect((x, y), frame.get_size())
+            frame_set.frames[animation][i] = self.pages[page].subsurface(area)
+            frame_set.regions[animation][i] = (self.pages[page], area)
@@ -0,0 +1,379 @@
+import array
+import bisect
+import itertools
+import pygame
+
+from collections import OrderedDict
+
+from src.config import Config
+
+ATLAS_CHARSET: str = "".join(chr(code) for code in range(32, 127))
+ATLAS_MAX_WIDTH: int = 1024
+ATLAS_PADDING: int = 1
+
+LINE_SPACING: int = -2
+NO_WRAP: int = 1 << 30
+LAYOUT_CACHE_SIZE: int = 256
+
+def _color_key(color: tuple[int, int, int]) -> tuple[int, int, int]:
+    return (0, 0, 0) if color != (0, 0, 0) else (255, 255, 255)
+
+class GlyphAtlas:
+    def __init__(self, font: pygame.font.Font, name: str = "", charset: str = ATLAS_CHARSET):
+        self.font: pygame.font.Font = font
+        self.name: str = name if name else str(id(font))
+        self.charset: str = ""
+        self.line_height: int = font.size("Tg")[1]
+
+        self.glyphs: dict[str, pygame.Rect] = {}
+        self.advances: dict[str, int] = {}
+        self.offsets: dict[str, int] = {}
+        self.size: tuple[int, int] = (0, 0)
+        self.pages: dict[tuple[int, int, int], pygame.Surface] = {}
+
+        self._build(charset)
+
+    def _build(self, charset: str) -> None:
+        self.charset = "".join(sorted(set(self.charset + charset)))
+        self.glyphs.clear()
+        self.advances.clear()
+        self.offsets.clear()
+        self.pages.clear()
+
+        x: int = 0
+        y: int = 0
+        width: int = 0
+        for char in self.charset:
+            metrics = self.font.metrics(char)[0]
+            self.advances[char] = metrics[4] if metrics is not None else self.font.size(char)[0]
+            self.offsets[char] = min(metrics[0], 0) if metrics is not None else 0
+
+            glyph_w, glyph_h = self.font.size(char)
+            if x + glyph_w > ATLAS_MAX_WIDTH:
+                x = 0
+                y += self.line_height + ATLAS_PADDING
+            self.glyphs[char] = pygame.Rect(x, y, glyph_w, glyph_h)
+            x += glyph_w + ATLAS_PADDING
+            width = max(width, x)
+
+        self.size = (max(width, 1), y + self.line_height)
+
+    def ensure(self, text: str) -> None:
+        missing: str = "".join(set(char for char in text if char not in self.glyphs and char != "\n"))
+        if missing:
+            self._build(missing)
+
+    def page(self, color) -> pygame.Surface:
+        key: tuple[int, int, int] = (int(color[0]), int(color[1]), int(color[2]))
+        if (page := self.pages.get(key, None)) is None:
+            color_key: tuple[int, int, int] = _color_key(key)
+            page = pygame.Surface(self.size).convert()
+            page.fill(color_key)
+            page.blits([(self.font.render(char, False, key, color_key), rect)
+                        for char, rect in self.glyphs.items()], False)
+            page.set_colorkey(color_key)
+            self.pages[key] = page
+        return page
+
+    def width(self, text: str) -> int:
+        self.ensure(text)
+        return max(sum(self.advances[char] for char in line) for line in text.split("\n"))
+
+    def cumulative(self, text: str, start: int = 0) -> itertools.accumulate:
+        self.ensure(text)
+        return itertools.accumulate((self.advances.get(char, 0) for char in text), initial=start)
+
+    def blit_list(self, page: pygame.Surface, text: str, pos: tuple[int, int]) -> list:
+        x, y = pos
+        blits: list = []
+        for char in text:
+            if char != " ":
+                blits.append((page, (x + self.offsets[char], y), self.glyphs[char]))
+            x += self.advances[char]
+        return blits
+
+
+class TextLayout:
+    def __init__(self, atlas: GlyphAtlas, text: str, width: int,
+                 advances: array.array | None = None, lines: list[tuple[int, int]] | None = None):
+        self.atlas: GlyphAtlas = atlas
+        self.text: str = text
+        self.width: int = width
+
+        self.advances: array.array = advances if advances is not None else array.array("l", atlas.cumulative(text))
+        self.lines: list[tuple[int, int]] = lines if lines is not None else []
+
+        if lines is None:
+            self._break_lines(0)
+
+    def extended(self, text: str) -> "TextLayout":
+        advances: array.array = array.array("l", self.advances)
+        advances.extend(itertools.islice(self.atlas.cumulative(text[len(self.text):], advances[-1]), 1, None))
+
+        restart: int = self.lines[-1][0] if self.lines else 0
+        layout: TextLayout = TextLayout(self.atlas, text, self.width, advances, self.lines[:-1] if self.lines else [])
+        layout._break_lines(restart)
+        return layout
+
+    def _break_lines(self, start: int) -> None:
+        while start <= len(self.text):
+            end: int = self.text.find("\n", start)
+            end = len(self.text) if end == -1 else end
+
+            while start < end:
+                i: int = bisect.bisect_left(self.advances, self.advances[start] + self.width, start + 1, end + 1)
+                i = min(i, end)
+
+                if i < end:
+                    split_idx: int = self.text.rfind(" ", start, i)
+                    i = split_idx + 1 if split_idx != -1 else i
+
+                self.lines.append((start, i))
+                start = i
+
+            start = end + 1
+
+
+class TextPage:
+    def __init__(self, atlas: GlyphAtlas, text: str, width: int):
+        layout: TextLayout = TextLayout(atlas, text, width)
+        self.atlas: GlyphAtlas = atlas
+        self.text: str = text
+        self.width: int = width
+
+        self.advances: array.array = layout.advances
+        self.starts: array.array = array.array("l", (start for start, _ in layout.lines))
+        self.ends: array.array = array.array("l", (end for _, end in layout.lines))
+        self.heights: array.array = array.array("l", [atlas.line_height + LINE_SPACING] * len(layout.lines))
+        self.tops: array.array = array.array("l", itertools.accumulate(self.heights, initial=0))
+
+    def lines(self, length: int) -> list[tuple[int, int]]:
+        count: int = bisect.bisect_left(self.starts, length)
+        return [(self.starts[i], min(self.ends[i], length)) for i in range(count)]
+
+
+class TextCache:
+    ENTRIES: OrderedDict[tuple, tuple[pygame.Surface, tuple[int, int]]] = OrderedDict()
+    BYTES: int = 0
+
+    HITS: int = 0
+    MISSES: int = 0
+    EVICTIONS: int = 0
+
+    @classmethod
+    def get(cls, key: tuple) -> tuple[pygame.Surface, tuple[int, int]] | None:
+        if (entry := cls.ENTRIES.get(key, None)) is None:
+            cls.MISSES += 1
+            return None
+        cls.HITS += 1
+        cls.ENTRIES.move_to_end(key)
+        return entry
+
+    @classmethod
+    def put(cls, key: tuple, surface: pygame.Surface, offset: tuple[int, int]) -> None:
+        size: int = surface.get_width() * surface.get_height() * surface.get_bytesize()
+        if size > Config.TEXT_CACHE_BUDGET:
+            return
+        cls.ENTRIES[key] = (surface, offset)
+        cls.BYTES += size
+        cls._evict()
+
+    @classmethod
+    def clear(cls) -> None:
+        cls.ENTRIES.clear()
+        cls.BYTES = 0
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        return {
+            "hits": cls.HITS,
+            "misses": cls.MISSES,
+            "evictions": cls.EVICTIONS,
+            "entries": len(cls.ENTRIES),
+            "bytes": cls.BYTES,
+            "budget": Config.TEXT_CACHE_BUDGET
+        }
+
+    @classmethod
+    def _evict(cls) -> None:
+        while cls.BYTES > Config.TEXT_CACHE_BUDGET and cls.ENTRIES:
+            _, (surface, _) = cls.ENTRIES.popitem(last=False)
+            cls.BYTES -= surface.get_width() * surface.get_height() * surface.get_bytesize()
+            cls.EVICTIONS += 1
+
+
+class TextEngine:
+    ATLASES: dict[str, GlyphAtlas] = {}
+    _BY_FONT: dict[int, GlyphAtlas] = {}
+    _LAYOUTS: OrderedDict[tuple[int, str, int], TextLayout] = OrderedDict()
+    _RECENT: dict[tuple[int, int], TextLayout] = {}
+
+    @classmethod
+    def init(cls, fonts: dict[str, pygame.font.Font]) -> None:
+        cls.ATLASES.clear()
+        cls._BY_FONT.clear()
+        TextCache.clear()
+        for name, font in fonts.items():
+            atlas: GlyphAtlas = GlyphAtlas(font, name)
+            cls.ATLASES[name] = atlas
+            cls._BY_FONT[id(font)] = atlas
+
+    @classmethod
+    def get_atlas(cls, font: pygame.font.Font) -> GlyphAtlas:
+        if (atlas := cls._BY_FONT.get(id(font), None)) is None:
+            atlas = GlyphAtlas(font)
+            cls._BY_FONT[id(font)] = atlas
+        return atlas
+
+    @classmethod
+    def size(cls, text: str, font: pygame.font.Font) -> tuple[int, int]:
+        return max(font.size(line)[0] for line in text.split("\n")), cls.get_atlas(font).line_height
+
+    @classmethod
+    def layout(cls, text: str, font: pygame.font.Font, width: int) -> TextLayout:
+        atlas: GlyphAtlas = cls.get_atlas(font)
+        key: tuple[int, str, int] = (id(atlas), text, width)
+
+        if (layout := cls._LAYOUTS.get(key, None)) is not None:
+            cls._LAYOUTS.move_to_end(key)
+        else:
+            base: TextLayout | None = cls._RECENT.get((id(atlas), width), None)
+            if base is not None and text.startswith(base.text):
+                layout = base.extended(text)
+            else:
+                layout = TextLayout(atlas, text, width)
+
+            cls._LAYOUTS[key] = layout
+            if len(cls._LAYOUTS) > LAYOUT_CACHE_SIZE:
+                cls._LAYOUTS.popitem(last=False)
+
+        cls._RECENT[(id(atlas), width)] = layout
+        return layout
+
+    @classmethod
+    def draw(cls, surface: pygame.Surface, text: str, font: pygame.font.Font, color: list,
+             rect: pygame.Rect, cached: bool = True, width: int | None = None) -> pygame.Rect:
+        atlas: GlyphAtlas = cls.get_atlas(font)
+        width = rect.width if width is None else width
+        rgb: tuple[int, int, int] = (int(color[0]), int(color[1]), int(color[2]))
+        alpha: int = int(color[3]) if len(color) > 3 else 255
+
+        if not cached:
+            page: pygame.Surface = atlas.page(rgb)
+            page.set_alpha(alpha if alpha < 255 else None)
+            drawn: list[pygame.Rect] = surface.blits(cls._compose(atlas, page, text, width, rect.topleft))
+            return pygame.Rect(rect.topleft, (0, 0)).unionall(drawn)
+
+        key: tuple = (atlas.name, text, rgb, alpha, width)
+        if (entry := TextCache.get(key)) is None:
+            entry = cls._rasterize(atlas, text, rgb, alpha, width)
+            TextCache.put(key, *entry)
+
+        rendered, offset = entry
+        return surface.blit(rendered, (rect.left + offset[0], rect.top + offset[1]))
+
+    @classmethod
+    def render(cls, text: str, font: pygame.font.Font, color: list,
+               width: int) -> tuple[pygame.Surface, tuple[int, int]]:
+        rgb: tuple[int, int, int] = (int(color[0]), int(color[1]), int(color[2]))
+        return cls._rasterize(cls.get_atlas(font), text, rgb, int(color[3]) if len(color) > 3 else 255, width)
+
+    @classmethod
+    def _compose(cls, atlas: GlyphAtlas, page: pygame.Surface, text: str, width: int,
+                 pos: tuple[int, int]) -> list:
+        y: int = pos[1]
+        blits: list = []
+        for start, end in cls.layout(text, atlas.font, width).lines:
+            blits += atlas.blit_list(page, text[start:end], (pos[0], y))
+            y += atlas.line_height + LINE_SPACING
+        return blits
+
+    @classmethod
+    def _rasterize(cls, atlas: GlyphAtlas, text: str, rgb: tuple[int, int, int], alpha: int,
+                   width: int) -> tuple[pygame.Surface, tuple[int, int]]:
+        page: pygame.Surface = atlas.page(rgb)
+        page.set_alpha(None)
+        blits: list = cls._compose(atlas, page, text, width, (0, 0))
+
+        bounds: pygame.Rect = pygame.Rect(0, 0, 1, 1).unionall(
+            [pygame.Rect(dest, area.size) for _, dest, area in blits])
+        color_key: tuple[int, int, int] = _color_key(rgb)
+
+        rendered: pygame.Surface = pygame.Surface(bounds.size).convert()
+        rendered.fill(color_key)
+        rendered.blits([(page, (dest[0] - bounds.x, dest[1] - bounds.y), area) for page, dest, area in blits], False)
+        rendered.set_colorkey(color_key)
+        if alpha < 255:
+            rendered.set_alpha(alpha)
+        return rendered, bounds.topleft
+
+
+class TextCanvas:
+    def __init__(self, font: pygame.font.Font, color: list, width: int, height: int, padding: int = 4):
+        self.atlas: GlyphAtlas = TextEngine.get_atlas(font)
+        self.width: int = width
+        self.padding: int = padding
+
+        self.rgb: tuple[int, int, int] = (int(color[0]), int(color[1]), int(color[2]))
+        self.color_key: tuple[int, int, int] = _color_key(self.rgb)
+
+        self.surface: pygame.Surface = pygame.Surface((width + padding * 2, max(height, 1))).convert()
+        self.surface.set_colorkey(self.color_key)
+        self.surface.fill(self.color_key)
+
+        self.text: str = ""
+        self.lines: list[tuple[int, int]] = []
+        self.text_page: TextPage | None = None
+
+    def clear(self) -> None:
+        self.surface.fill(self.color_key)
+        self.text = ""
+        self.lines = []
+
+    def _line_y(self, line: int) -> int:
+        if self.text_page is not None:
+            return self.text_page.tops[line]
+        return line * (self.atlas.line_height + LINE_SPACING)
+
+    def update(self, text: str, text_page: TextPage | None = None) -> None:
+        if text == self.text and text_page is self.text_page:
+            return
+        if not text.startswith(self.text) or text_page is not self.text_page:
+            self.clear()
+        self.text_page = text_page
+
+        if text_page is not None:
+            advances: array.array = text_page.advances
+            lines: list[tuple[int, int]] = text_page.lines(len(text))
+        else:
+            layout: TextLayout = TextEngine.layout(text, self.atlas.font, self.width)
+            advances: array.array = layout.advances
+            lines: list[tuple[int, int]] = layout.lines
+        page: pygame.Surface = self.atlas.page(self.rgb)
+        page.set_alpha(None)
+
+        i: int = 0
+        while i < len(self.lines) and i < len(lines) and self.lines[i] == lines[i]:
+            i += 1
+
+        blits: list = []
+        if i == len(self.lines) - 1 and i < len(lines) and lines[i][0] == self.lines[i][0] and \
+                lines[i][1] > self.lines[i][1]:
+            start, end = lines[i]
+            x: int = self.padding + advances[self.lines[i][1]] - advances[start]
+            blits += self.atlas.blit_list(page, text[self.lines[i][1]:end], (x, self._line_y(i)))
+            i += 1
+        elif i < len(self.lines):
+            y: int = self._line_y(i)
+            self.surface.fill(self.color_key, (0, y, self.surface.get_width(), self.surface.get_height() - y))
+
+        for line in range(i, len(lines)):
+            start, end = lines[line]
+            blits += self.atlas.blit_list(page, text[start:end], (self.padding, self._line_y(line)))
+
+        self.surface.blits(blits, False)
+        self.text = text
+        self.lines = list(lines)
+
+    def draw(self, surface: pygame.Surface, pos: pygame.Vector2) -> None:
+        surface.blit(self.surface, (pos.x - self.padding, pos.y))
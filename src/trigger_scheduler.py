@@ -0,0 +1,106 @@
+from src.event import CatchEvent
+from src.route_tracker import Flags
+from src.trigger import Trigger
+
+class TriggerScheduler:
+    def __init__(self, triggers: dict[str, Trigger]):
+        self.triggers: list[Trigger] = list(triggers.values())
+        self.events: list[tuple[int, CatchEvent]] = []
+        self.trigger_events: list[list[int]] = []
+        for index, trigger in enumerate(self.triggers):
+            self.trigger_events.append(list(range(len(self.events), len(self.events) + len(trigger.catches))))
+            self.events += [(index, event) for event in trigger.catches]
+
+        self.subscribers: dict[tuple, list[int]] = {}
+        self.polled: list[int] = []
+        self.watched: list[str] = []
+        for event_index, (_, event) in enumerate(self.events):
+            signals: list[tuple] | None = event.signals()
+            if signals is None:
+                self.polled.append(event_index)
+                continue
+            if event.conditions is not None:
+                signals = signals + [("flag", flag) for flag in event.conditions.flags()]
+            for signal in signals:
+                self.subscribers.setdefault(signal, []).append(event_index)
+                if signal[0] == "entity" and signal[1] not in self.watched:
+                    self.watched.append(signal[1])
+
+        self.caught: list[bool] = [False] * len(self.events)
+        self.live: set[int] = set()
+        self.primed: bool = False
+
+        self.player_cell: tuple[float, float] | None = None
+        self.state = None
+        self.entity_cells: dict[str, tuple | None] = {}
+        self.flags_version: int = 0
+
+        self.evaluated: int = 0
+
+    def poll(self, scene) -> set[tuple]:
+        fired: set[tuple] = set()
+
+        player_cell: tuple[float, float] = (scene.player.grid_pos.x, scene.player.grid_pos.y)
+        if player_cell != self.player_cell:
+            self.player_cell = player_cell
+            fired.add(("player",))
+
+        if scene.state != self.state:
+            self.state = scene.state
+            fired.add(("state",))
+
+        for identifier in self.watched:
+            entity = scene.entities_dict.get(identifier, None)
+            cell: tuple | None = None if entity is None else \
+                (entity.grid_pos.x, entity.grid_pos.y, entity.hit_box.x, entity.hit_box.y)
+            if cell != self.entity_cells.get(identifier, None):
+                self.entity_cells[identifier] = cell
+                fired.add(("entity", identifier))
+
+        if Flags.VERSION != self.flags_version:
+            if (changed := Flags.changed_since(self.flags_version)) is None:
+                self.primed = False
+            else:
+                fired.update(("flag", flag) for flag in changed)
+            self.flags_version = Flags.VERSION
+
+        return fired
+
+    def evaluate(self, scene) -> None:
+        fired: set[tuple] = self.poll(scene)
+        if self.primed:
+            stale: set[int] = set(self.polled)
+            for signal in fired:
+                stale.update(self.subscribers.get(signal, []))
+        else:
+            stale = set(range(len(self.events)))
+            self.primed = True
+
+        touched: set[int] = set()
+        for event_index in stale:
+            trigger_index, event = self.events[event_index]
+            self.caught[event_index] = (event.conditions is None or event.conditions.satisfied()) and \
+                bool(event.catch(scene))
+            touched.add(trigger_index)
+        self.evaluated += len(stale)
+
+        for trigger_index in touched:
+            if any(self.caught[event_index] for event_index in self.trigger_events[trigger_index]):
+                self.live.add(trigger_index)
+            else:
+                self.live.discard(trigger_index)
+
+    def update(self, scene, manager) -> None:
+        self.evaluate(scene)
+
+        last: int = -1
+        while scene.dialogue is None:
+            pending: list[int] = [index for index in self.live if index > last]
+            if not pending:
+                break
+            last = min(pending)
+            trigger: Trigger = self.triggers[last]
+            if trigger.disabled:
+                continue
+            trigger.dispatch(manager, scene)
+            self.evaluate(scene)
@@ -1,5 +1,7 @@
 import pygame
 
+from src.text_engine import NO_WRAP, TextEngine
+
 class Text:
     def __init__(self, text: str, color: list, pos: pygame.Vector2, font: pygame.font.Font,
                  align_left: bool = False, align_center: bool = False, align_right: bool = False,
@@ -8,17 +10,21 @@ class Text:
         self.font: pygame.font.Font = font
         self.pos: pygame.Vector2 = pos
         self.color: list = color
+        self.wrap_width: int = NO_WRAP
 
         if align_left:
-            self.rect = self.font.render(text, True, color).get_rect()
+            self.rect = pygame.Rect((0, 0), TextEngine.size(text, font))
             self.rect.x = self.pos.x
             self.rect.y = self.pos.y
         elif align_center:
-            self.rect = self.font.render(text, True, color).get_rect(center=pos)
+            self.rect = pygame.Rect((0, 0), TextEngine.size(text, font))
+            self.rect.center = pos
         elif align_right:
-            self.rect = self.font.render(text, True, color).get_rect(topright=pos)
+            self.rect = pygame.Rect((0, 0), TextEngine.size(text, font))
+            self.rect.topright = pos
         else:
             self.rect = pygame.Rect(self.pos.x, self.pos.y, dimensions.x, dimensions.y)
+            self.wrap_width = self.rect.width
 
 class Button:
     def __init__(self, text: Text, select_pos: pygame.Vector2,
@@ -29,34 +35,8 @@ class Button:
         self.select_color: list = select_color
 
 
-def _render_text(text: Text, surface: pygame.Surface) -> None:
-    rect: pygame.Rect = pygame.Rect(text.rect)
-    y: int = rect.top
-    line_spacing: int = -2
-    font_height: int = text.font.size("Tg")[1]
-
-    write: str = text.text
-    lines: list[str] = write.split("\n")
-
-    blits: list = []
-    for line in lines:
-        while line:
-            i: int = 1
-
-            while text.font.size(line[:i])[0] < rect.width and i < len(line):
-                i += 1
-
-            if i < len(line):
-                split_idx: int = line.rfind(" ", 0, i)
-                i = split_idx + 1 if split_idx != -1 else i
-
-            img: pygame.Surface = text.font.render(line[:i], False, text.color[:3]).convert()
-            if text.color[3] < 255: img.set_alpha(text.color[3])
-            blits.append((img, (rect.left, y)))
-            y += font_height + line_spacing
-            line = line[i:]
-
-    surface.blits(blits)
+def _render_text(text: Text, surface: pygame.Surface, cached: bool = True) -> pygame.Rect:
+    return TextEngine.draw(surface, text.text, text.font, text.color, text.rect, cached, text.wrap_width)
 
 
 class UIManager:
@@ -71,17 +51,20 @@ class UIManager:
         if buttons != self.num_buttons: self.choice = 0
         self.num_buttons = buttons
 
-    def draw_text(self, text: Text, surface: pygame.Surface = None) -> None:
-        _render_text(text, surface if surface is not None else self.window_surface)
+    def draw_text(self, text: Text, surface: pygame.Surface = None, cached: bool = True) -> None:
+        _render_text(text, surface if surface is not None else self.window_surface, cached)
 
     def draw_button(self, button: Button, button_index: int, surface: pygame.Surface = None) -> None:
         _render_text(button.text, surface if surface is not None else self.window_surface)
         if self.choice == button_index:
-            _render_text(Text(
-                "*", button.select_color,
-                button.text.rect.midleft + button.select_pos,
-                button.select_font, align_center=True
-            ), surface if surface is not None else self.window_surface)
+            self.draw_selection(button, surface)
+
+    def draw_selection(self, button: Button, surface: pygame.Surface = None) -> pygame.Rect:
+        return _render_text(Text(
+            "*", button.select_color,
+            button.text.rect.midleft + button.select_pos,
+            button.select_font, align_center=True
+        ), surface if surface is not None else self.window_surface)
     
     def input(self, keys: pygame.key.ScancodeWrapper) -> None:
         moving: bool = False
@@ -0,0 +1,87 @@
+import weakref
+
+import pygame
+
+VOICE_POOLS: dict[str, int] = {
+    "dialogue": 2,
+    "cutscene": 4,
+    "music": 1
+}
+FREE_CHANNELS: int = 2
+
+class VoiceManager:
+    CHANNELS: dict[str, list[pygame.mixer.Channel]] = {}
+    PRIORITIES: dict[int, tuple[int, int]] = {}
+    STARTS: int = 0
+    LOUDER: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    PLAYED: int = 0
+    STOLEN: int = 0
+    DROPPED: int = 0
+
+    @classmethod
+    def reserve(cls) -> None:
+        if cls.CHANNELS or pygame.mixer.get_init() is None:
+            return
+        reserved: int = sum(VOICE_POOLS.values())
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), reserved + FREE_CHANNELS))
+        pygame.mixer.set_reserved(reserved)
+
+        index: int = 0
+        for pool, size in VOICE_POOLS.items():
+            cls.CHANNELS[pool] = [pygame.mixer.Channel(i) for i in range(index, index + size)]
+            index += size
+
+    @classmethod
+    def play(cls, pool: str, sound: pygame.mixer.Sound, priority: int = 0,
+             volume: float | None = None) -> pygame.mixer.Channel | None:
+        cls.reserve()
+        channels: list[pygame.mixer.Channel] = cls.CHANNELS.get(pool, [])
+        if not channels:
+            cls.DROPPED += 1
+            return None
+
+        index: int = next((i for i, channel in enumerate(channels) if not channel.get_busy()), -1)
+        if index == -1:
+            index = min(range(len(channels)), key=lambda i: cls.PRIORITIES.get(id(channels[i]), (0, 0)))
+            if cls.PRIORITIES.get(id(channels[index]), (0, 0))[0] > priority:
+                cls.DROPPED += 1
+                return None
+            channels[index].stop()
+            cls.STOLEN += 1
+
+        channel: pygame.mixer.Channel = channels[index]
+        base: float = sound.get_volume()
+        if volume is not None and volume > base:
+            sound = cls.louder(sound, volume)
+            base = sound.get_volume()
+        channel.set_volume(1.0 if volume is None or base == 0 else min(1.0, volume / base))
+        channel.play(sound)
+        cls.STARTS += 1
+        cls.PRIORITIES[id(channel)] = (priority, cls.STARTS)
+        cls.PLAYED += 1
+        return channel
+
+    @classmethod
+    def louder(cls, sound: pygame.mixer.Sound, volume: float) -> pygame.mixer.Sound:
+        # Channel volume can only attenuate, so louder plays use a copy rather than changing the shared sound
+        copies: dict[float, pygame.mixer.Sound] = cls.LOUDER.setdefault(sound, {})
+        if (copy := copies.get(volume, None)) is None:
+            copy = pygame.mixer.Sound(sound)
+            copy.set_volume(volume)
+            copies[volume] = copy
+        return copy
+
+    @classmethod
+    def active(cls, pool: str | None = None) -> int:
+        pools: list[str] = list(cls.CHANNELS) if pool is None else [pool]
+        return sum(channel.get_busy() for name in pools for channel in cls.CHANNELS.get(name, []))
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        return {
+            "played": cls.PLAYED,
+            "stolen": cls.STOLEN,
+            "dropped": cls.DROPPED,
+            "active": cls.active()
+        }
@@ -0,0 +1,17 @@
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import pygame
+import pytest
+
+@pytest.fixture(scope="session")
+def font() -> pygame.font.Font:
+    pygame.font.init()
+    return pygame.font.Font(None, 24)
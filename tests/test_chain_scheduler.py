@@ -0,0 +1,110 @@
+from types import SimpleNamespace
+
+from src.chain_scheduler import ChainScheduler
+from src.route_tracker import Flags
+
+DT: float = 0.1
+
+class FakeChain:
+    def __init__(self, name: str, log: list[str], idles: list | None = None):
+        self.name: str = name
+        self.log: list[str] = log
+        self.idles: list = list(idles or [])
+        self.event: SimpleNamespace = SimpleNamespace(wait=0.0, signals=lambda: [])
+        self.dispatches: list = [self.event]
+        self.dispatch_index: int = 0
+        self.last_dispatch_index: int = 0
+        self.idle_calls: int = 0
+
+    def update(self, scene, manager, dt: float) -> None:
+        self.log.append(self.name)
+        self.event.wait -= dt
+
+    def idle(self, scene):
+        self.idle_calls += 1
+        return self.idles.pop(0) if self.idles else None
+
+def frames(scheduler: ChainScheduler, scene: SimpleNamespace, log: list[str], count: int) -> list[list[str]]:
+    updates: list[list[str]] = []
+    for _ in range(count):
+        log.clear()
+        scheduler.update(scene, None, DT)
+        updates.append(list(log))
+    return updates
+
+def test_awake_chains_update_in_the_order_they_were_added():
+    scheduler: ChainScheduler = ChainScheduler()
+    scene: SimpleNamespace = SimpleNamespace(dialogue=None)
+    log: list[str] = []
+    for name in "cab":
+        scheduler.add(FakeChain(name, log))
+
+    assert frames(scheduler, scene, log, 2) == [["c", "a", "b"], ["c", "a", "b"]]
+
+    scheduler.add(FakeChain("d", log))
+    assert frames(scheduler, scene, log, 1) == [["c", "a", "b", "d"]]
+
+def test_removed_chains_stop_updating():
+    scheduler: ChainScheduler = ChainScheduler()
+    scene: SimpleNamespace = SimpleNamespace(dialogue=None)
+    log: list[str] = []
+    first: FakeChain = FakeChain("a", log)
+    scheduler.add(first)
+    scheduler.add(FakeChain("b", log))
+    frames(scheduler, scene, log, 1)
+
+    scheduler.remove(first)
+    assert frames(scheduler, scene, log, 2) == [["a", "b"], ["b"]]
+    assert scheduler.active() == 1
+
+def test_sleeping_chains_wake_in_deadline_order_behind_awake_chains():
+    scheduler: ChainScheduler = ChainScheduler()
+    scene: SimpleNamespace = SimpleNamespace(dialogue=None)
+    log: list[str] = []
+    late: FakeChain = FakeChain("late", log, [(0.45, [])])
+    early: FakeChain = FakeChain("early", log, [(0.15, [])])
+    late.event.wait = early.event.wait = 0.1
+    scheduler.add(late)
+    scheduler.add(early)
+    scheduler.add(FakeChain("busy", log))
+
+    updates: list[list[str]] = frames(scheduler, scene, log, 7)
+    assert updates[0] == ["late", "early", "busy"]
+    assert updates[1] == ["busy"]
+    woke_early: int = next(i for i, frame in enumerate(updates) if i > 0 and "early" in frame)
+    woke_late: int = next(i for i, frame in enumerate(updates) if i > 0 and "late" in frame)
+    assert woke_early < woke_late
+    assert updates[woke_early] == ["busy", "early"]
+    assert updates[woke_late] == ["busy", "early", "late"]
+    assert scheduler.active() == 3
+
+def test_signals_wake_only_the_chains_watching_them():
+    scheduler: ChainScheduler = ChainScheduler()
+    scene: SimpleNamespace = SimpleNamespace(dialogue=None)
+    log: list[str] = []
+    scheduler.add(FakeChain("talk", log, [(None, [("dialogue",)])]))
+    scheduler.add(FakeChain("flag", log, [(None, [("flag", "chain_test_flag")])]))
+    frames(scheduler, scene, log, 1)
+    assert frames(scheduler, scene, log, 1) == [[]]
+
+    Flags.set("chain_test_flag")
+    assert frames(scheduler, scene, log, 1) == [["flag"]]
+
+    scene.dialogue = object()
+    assert frames(scheduler, scene, log, 1) == [["flag", "talk"]]
+
+def test_chains_on_an_event_without_signals_skip_idle_until_they_dispatch_again():
+    scheduler: ChainScheduler = ChainScheduler()
+    scene: SimpleNamespace = SimpleNamespace(dialogue=None)
+    log: list[str] = []
+    chain: FakeChain = FakeChain("move", log)
+    chain.dispatches.append(SimpleNamespace(wait=0.0, signals=lambda: None))
+    chain.last_dispatch_index = 1
+    scheduler.add(chain)
+
+    assert frames(scheduler, scene, log, 3) == [["move"]] * 3
+    assert chain.idle_calls == 1
+
+    chain.last_dispatch_index = 0
+    frames(scheduler, scene, log, 2)
+    assert chain.idle_calls == 3
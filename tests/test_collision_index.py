@@ -0,0 +1,55 @@
+from types import SimpleNamespace
+
+import pygame
+
+from src.collision_index import Blocked, CollisionIndex
+
+def element(x: int, y: int, w: int, h: int, collision: bool = True) -> SimpleNamespace:
+    return SimpleNamespace(rect=pygame.Rect(x, y, w, h), collision=collision)
+
+def entity(x: int, y: int, w: int = 1, h: int = 1, collision: bool = True) -> SimpleNamespace:
+    return SimpleNamespace(grid_pos=pygame.Vector2(x, y), hit_box=pygame.Vector2(w, h), collision=collision)
+
+def test_map_elements_block_their_cells():
+    index: CollisionIndex = CollisionIndex([element(2, 3, 2, 2), element(10, 10, 1, 1, collision=False)])
+
+    assert index.is_blocked(pygame.Rect(3, 4, 1, 1)) == Blocked.MAP
+    assert index.is_blocked(pygame.Rect(1, 2, 2, 2)) == Blocked.MAP
+    assert index.is_blocked(pygame.Rect(4, 3, 1, 1)) == Blocked.NONE
+    assert index.is_blocked(pygame.Rect(10, 10, 1, 1)) == Blocked.NONE
+    assert index.is_blocked(pygame.Rect(-50, -50, 1, 1)) == Blocked.NONE
+
+def test_empty_map_blocks_nothing():
+    assert CollisionIndex([]).is_blocked(pygame.Rect(0, 0, 3, 3)) == Blocked.NONE
+
+def test_entities_block_until_moved_or_removed():
+    index: CollisionIndex = CollisionIndex([element(0, 0, 1, 1)])
+    npc: SimpleNamespace = entity(5, 5, 2, 1)
+    index.move(npc)
+
+    assert index.is_blocked(pygame.Rect(6, 5, 1, 1)) == Blocked.ENTITY
+
+    npc.grid_pos = pygame.Vector2(7, 7)
+    index.move(npc)
+    assert index.is_blocked(pygame.Rect(6, 5, 1, 1)) == Blocked.NONE
+    assert index.is_blocked(pygame.Rect(8, 7, 1, 1)) == Blocked.ENTITY
+
+    index.remove(npc)
+    assert index.is_blocked(pygame.Rect(8, 7, 1, 1)) == Blocked.NONE
+
+def test_entity_takes_precedence_over_map():
+    index: CollisionIndex = CollisionIndex([element(0, 0, 4, 4)])
+    index.move(entity(1, 1))
+
+    assert index.is_blocked(pygame.Rect(1, 1, 1, 1)) == Blocked.ENTITY
+
+def test_sync_drops_missing_and_non_colliding_entities():
+    index: CollisionIndex = CollisionIndex([])
+    a: SimpleNamespace = entity(1, 1)
+    b: SimpleNamespace = entity(2, 2)
+    index.sync([a, b])
+    b.collision = False
+    index.sync([b])
+
+    assert index.is_blocked(pygame.Rect(1, 1, 1, 1)) == Blocked.NONE
+    assert index.is_blocked(pygame.Rect(2, 2, 1, 1)) == Blocked.NONE
@@ -0,0 +1,80 @@
+import pickle
+
+from src import route_tracker
+from src.route_tracker import Conditions, Flags
+
+def test_changed_since_lists_the_flags_stored_after_a_version():
+    start: int = Flags.VERSION
+    Flags.set("changed_a")
+    Flags.set("changed_b")
+    Flags.set("changed_a")
+
+    assert Flags.changed_since(start) == {"changed_a", "changed_b"}
+    assert Flags.changed_since(start + 1) == {"changed_b"}
+    assert Flags.changed_since(Flags.VERSION) == set()
+
+def test_trimmed_log_falls_back_to_a_full_re_evaluation(monkeypatch):
+    monkeypatch.setattr(route_tracker, "FLAG_LOG_LIMIT", 8)
+    start: int = Flags.VERSION
+    Flags.toggle("trimmed_a")
+    for _ in range(20):
+        Flags.toggle("trimmed_b")
+
+    assert len(Flags.LOG) <= 8
+    assert Flags.VERSION == Flags.FLOOR + len(Flags.LOG)
+    assert Flags.changed_since(start) is None
+    assert Flags.changed_since(Flags.VERSION - 2) == {"trimmed_b"}
+
+def test_conditions_compile_their_flags_into_masks():
+    conditions: Conditions = Conditions(["mask_all_a", "mask_all_b"], ["mask_any"], ["mask_not"])
+
+    assert conditions.all_mask == 1 << Flags.bit("mask_all_a") | 1 << Flags.bit("mask_all_b")
+    assert conditions.any_mask == 1 << Flags.bit("mask_any")
+    assert conditions.not_mask == 1 << Flags.bit("mask_not")
+    assert Flags.mask([]) == 0
+
+def test_conditions_need_all_flags_one_any_flag_and_no_not_flag():
+    conditions: Conditions = Conditions(["need_all_a", "need_all_b"], ["need_any_a", "need_any_b"], ["need_not"])
+    assert not conditions.satisfied()
+
+    Flags.set("need_all_a")
+    Flags.set("need_all_b")
+    assert not conditions.satisfied()
+
+    Flags.set("need_any_b")
+    assert conditions.satisfied()
+
+    Flags.set("need_not")
+    assert not conditions.satisfied()
+
+    Flags.clear("need_not")
+    Flags.clear("need_all_a")
+    assert not conditions.satisfied()
+
+def test_empty_any_list_is_satisfied():
+    assert Conditions([], [], ["empty_any_not"]).satisfied()
+
+def test_pickled_conditions_recompile_their_masks():
+    conditions: Conditions = pickle.loads(pickle.dumps(Conditions(["pickled_all"], [], [])))
+    assert conditions.all_mask == 1 << Flags.bit("pickled_all")
+
+    Flags.set("pickled_all")
+    assert conditions.satisfied()
+
+def test_satisfied_is_memoized_until_a_flag_it_reads_changes():
+    conditions: Conditions = Conditions(["memo_a"], [], [])
+    assert not conditions.satisfied()
+    assert not conditions.dirty
+
+    Flags.set("memo_unrelated")
+    assert not conditions.dirty
+
+    conditions.result = True
+    assert conditions.satisfied()
+
+    Flags.set("memo_a")
+    assert conditions.dirty
+    assert conditions.satisfied()
+
+    Flags.set("memo_a")
+    assert not conditions.dirty
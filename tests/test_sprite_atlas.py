@@ -0,0 +1,57 @@
+import pygame
+import pytest
+
+from src.sprite import FrameSet, Sprite
+from src.sprite_atlas import SpriteAtlas, pack_shelves
+
+def rects(sizes: list[tuple[int, int]], atlas_size: int) -> list[tuple[int, pygame.Rect]]:
+    return [(page, pygame.Rect(x, y, *size)) for size, (page, x, y) in zip(sizes, pack_shelves(sizes, atlas_size))]
+
+def test_placements_fit_and_do_not_overlap():
+    sizes: list[tuple[int, int]] = [(16, 32), (32, 32), (8, 8), (64, 16), (16, 16), (40, 24), (8, 30)] * 6
+    placed: list[tuple[int, pygame.Rect]] = rects(sizes, 128)
+
+    for i, (page, rect) in enumerate(placed):
+        assert pygame.Rect(0, 0, 128, 128).contains(rect)
+        for other_page, other in placed[i + 1:]:
+            assert page != other_page or not rect.colliderect(other)
+
+def test_full_page_spills_onto_a_new_page():
+    placed: list[tuple[int, pygame.Rect]] = rects([(64, 64)] * 5, 128)
+
+    assert [page for page, _ in placed].count(0) == 4
+    assert [page for page, _ in placed].count(1) == 1
+
+def test_taller_frames_are_shelved_first():
+    placed: list[tuple[int, pygame.Rect]] = rects([(10, 5), (10, 20), (10, 10)], 64)
+
+    assert placed[1][1].topleft == (0, 0)
+    assert placed[0][1].y == placed[2][1].y == 0
+
+def test_oversized_frame_is_rejected():
+    with pytest.raises(ValueError):
+        pack_shelves([(8, 8), (129, 8)], 128)
+
+def test_packed_frames_keep_their_pixels():
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    frames: dict[str, list[pygame.Surface]] = {"idle": [], "walk": []}
+    for animation, color in (("idle", (255, 0, 0, 255)), ("walk", (0, 0, 255, 128))):
+        for size in ((12, 20), (7, 9)):
+            frame: pygame.Surface = pygame.Surface(size, pygame.SRCALPHA)
+            frame.fill(color)
+            frames[animation].append(frame)
+    expected: dict[str, list[bytes]] = {animation: [pygame.image.tobytes(frame, "RGBA") for frame in animation_frames]
+                                        for animation, animation_frames in frames.items()}
+
+    frame_set: FrameSet = FrameSet(frames, pygame.Vector2(12, 20), 2)
+    SpriteAtlas(64).pack([frame_set])
+    sprite: Sprite = Sprite(frame_set, "walk")
+    sprite.frame_index = 1
+
+    for animation, animation_frames in frame_set.frames.items():
+        for i, frame in enumerate(animation_frames):
+            assert pygame.image.tobytes(frame, "RGBA") == expected[animation][i]
+            page, area = frame_set.regions[animation][i]
+            assert frame.get_parent() is page and frame.get_offset() == area.topleft
+    assert sprite.get_region() == frame_set.regions["walk"][1]
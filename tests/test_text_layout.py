@@ -0,0 +1,38 @@
+from src.text_engine import GlyphAtlas, TextLayout
+
+TEXT: str = "The quick brown fox jumps over the lazy dog and keeps running\nuntil the river bank"
+
+def test_lines_overshoot_width_by_at_most_one_char_and_break_at_spaces(font):
+    atlas: GlyphAtlas = GlyphAtlas(font)
+    layout: TextLayout = TextLayout(atlas, TEXT, 120)
+
+    assert len(layout.lines) > 2
+    for start, end in layout.lines:
+        line: str = TEXT[start:end]
+        assert atlas.width(line[:-1]) < 120
+        assert end == len(TEXT) or TEXT[end - 1] == " " or TEXT[end] == "\n"
+
+def test_lines_cover_text_without_newlines(font):
+    layout: TextLayout = TextLayout(GlyphAtlas(font), TEXT, 120)
+
+    assert "".join(TEXT[start:end] for start, end in layout.lines) == TEXT.replace("\n", "")
+    assert TEXT.index("\n") + 1 in [start for start, _ in layout.lines]
+
+def test_long_word_is_split(font):
+    atlas: GlyphAtlas = GlyphAtlas(font)
+    layout: TextLayout = TextLayout(atlas, "x" * 200, 50)
+
+    assert len(layout.lines) > 1
+    assert all(atlas.width("x" * (end - start - 1)) < 50 for start, end in layout.lines)
+
+def test_extended_matches_fresh_layout(font):
+    atlas: GlyphAtlas = GlyphAtlas(font)
+    layout: TextLayout = TextLayout(atlas, TEXT[:20], 120)
+    for length in range(21, len(TEXT) + 1):
+        layout = layout.extended(TEXT[:length])
+        assert layout.lines == TextLayout(atlas, TEXT[:length], 120).lines
+
+def test_width_of_multiline_text_is_widest_line(font):
+    atlas: GlyphAtlas = GlyphAtlas(font)
+
+    assert atlas.width("ab\nabcd") == atlas.width("abcd")
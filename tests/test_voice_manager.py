@@ -0,0 +1,28 @@
+import pygame
+import pytest
+
+from src.voice_manager import VoiceManager
+
+def tone(volume: float) -> pygame.mixer.Sound:
+    pygame.mixer.init()
+    sound: pygame.mixer.Sound = pygame.mixer.Sound(buffer=b"\x10\x00" * 88200)
+    sound.set_volume(volume)
+    return sound
+
+def played_volume(channel: pygame.mixer.Channel) -> float:
+    return channel.get_sound().get_volume() * channel.get_volume()
+
+def test_quieter_plays_attenuate_the_channel():
+    sound: pygame.mixer.Sound = tone(0.5)
+    channel: pygame.mixer.Channel = VoiceManager.play("cutscene", sound, volume=0.2)
+
+    assert channel.get_sound() is sound
+    assert played_volume(channel) == pytest.approx(0.2, abs=0.01)
+
+def test_louder_plays_keep_their_volume_without_touching_the_shared_sound():
+    sound: pygame.mixer.Sound = tone(0.25)
+    channel: pygame.mixer.Channel = VoiceManager.play("cutscene", sound, volume=0.8)
+
+    assert played_volume(channel) == pytest.approx(0.8, abs=0.01)
+    assert sound.get_volume() == pytest.approx(0.25, abs=0.01)
+    assert VoiceManager.play("cutscene", sound, volume=0.8).get_sound() is channel.get_sound()